@@ -0,0 +1,646 @@
+#!/usr/bin/env python3
+"""
+Jira Stand-in - Offline Jira Cloud REST API server for benchmarks and regression checks
+Covers the endpoints used by the toolkit, with configurable latency, rate limits and failures
+
+Endpoints:
+  POST /rest/api/3/issue                      Create issue
+  POST /rest/api/3/issue/bulk                 Bulk create issues
+  GET  /rest/api/3/issue/{key}                Issue with ?fields= and ?expand=transitions
+  PUT  /rest/api/3/issue/{key}                Edit issue fields
+  GET  /rest/api/3/issue/{key}/transitions    Available transitions
+  POST /rest/api/3/issue/{key}/transitions    Transition issue
+  POST /rest/api/3/issueLink                  Link two issues
+  GET/POST /rest/api/3/search[/jql]           JQL search (subset, see JqlFilter)
+
+Control endpoints (not rate limited or counted):
+  GET  /_standin/stats                        Request counters
+  POST /_standin/reset                        Reset counters (and issues with {"issues": true})
+  POST /_standin/seed                         Create epics/stories/test cases directly
+"""
+
+import argparse
+import gzip
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+ISSUE_TYPES = {
+    "10000": {"id": "10000", "name": "Epic", "subtask": False},
+    "10006": {"id": "10006", "name": "Story", "subtask": False},
+    "10007": {"id": "10007", "name": "Subtask", "subtask": True},
+    "10008": {"id": "10008", "name": "Test", "subtask": False},
+}
+
+# Every status can move to every other one through these transitions
+TRANSITIONS = [
+    {"id": "11", "name": "Start Progress", "to": "In Progress"},
+    {"id": "21", "name": "Done", "to": "Done"},
+    {"id": "2", "name": "Not Needed", "to": "Not Needed"},
+    {"id": "31", "name": "To Do", "to": "To Do"},
+]
+
+LINKED_FIELDS = ("summary", "status", "issuetype", "priority")
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "+0000"
+
+
+class StandinError(Exception):
+    """Error reported to the client as a Jira-style error payload"""
+
+    def __init__(self, status: int, message: str, field: str = None):
+        super().__init__(message)
+        self.status = status
+        self.payload = {"errorMessages": [], "errors": {}}
+        if field:
+            self.payload["errors"][field] = message
+        else:
+            self.payload["errorMessages"].append(message)
+
+
+class IssueStore:
+    """In-memory issues and links for one project"""
+
+    def __init__(self, project_key: str):
+        self.project_key = project_key
+        self.lock = threading.RLock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.issues = {}
+            self.links = []
+            # Indexes so rendering an issue doesn't scan the whole store
+            self.children = {}
+            self.links_by_key = {}
+            self.next_id = 10001
+            self.next_number = 1
+
+    def create(self, fields: Dict) -> Dict:
+        with self.lock:
+            project = (fields.get("project") or {}).get("key", self.project_key)
+            if project != self.project_key:
+                raise StandinError(400, f"Project '{project}' does not exist", "project")
+            if not fields.get("summary"):
+                raise StandinError(400, "You must specify a summary of the issue.", "summary")
+
+            issuetype = fields.get("issuetype") or {}
+            issue_type = ISSUE_TYPES.get(str(issuetype.get("id", ""))) or next(
+                (t for t in ISSUE_TYPES.values() if t["name"] == issuetype.get("name")), None)
+            if not issue_type:
+                raise StandinError(400, "The issue type selected is invalid.", "issuetype")
+
+            parent_key = (fields.get("parent") or {}).get("key")
+            if parent_key and parent_key not in self.issues:
+                raise StandinError(400, f"Could not find issue by id or key '{parent_key}'.", "parent")
+
+            issue_id = str(self.next_id)
+            key = f"{self.project_key}-{self.next_number}"
+            self.next_id += 1
+            self.next_number += 1
+            timestamp = now_iso()
+
+            stored = dict(fields)
+            stored.update({
+                "project": {"key": self.project_key},
+                "issuetype": dict(issue_type),
+                "status": {"name": "To Do"},
+                "priority": {"id": (fields.get("priority") or {}).get("id", "3")},
+                "labels": list(fields.get("labels") or []),
+                "created": timestamp,
+                "updated": timestamp,
+            })
+            if parent_key:
+                stored["parent"] = {"key": parent_key}
+                self.children.setdefault(parent_key, []).append(key)
+            self.issues[key] = {"id": issue_id, "key": key, "fields": stored}
+            return {"id": issue_id, "key": key, "self": f"/rest/api/3/issue/{issue_id}"}
+
+    def get(self, key: str) -> Dict:
+        issue = self.issues.get(key)
+        if not issue:
+            raise StandinError(404, "Issue does not exist or you do not have permission to see it.")
+        return issue
+
+    def edit(self, key: str, fields: Dict):
+        with self.lock:
+            issue = self.get(key)
+            for name, value in fields.items():
+                if name in ("project", "issuetype", "status"):
+                    continue
+                if name == "parent":
+                    new_parent = (value or {}).get("key")
+                    if new_parent and new_parent not in self.issues:
+                        raise StandinError(400, f"Could not find issue '{new_parent}'.", "parent")
+                    old_parent = issue["fields"].get("parent", {}).get("key")
+                    if old_parent != new_parent:
+                        if old_parent:
+                            self.children[old_parent].remove(key)
+                        if new_parent:
+                            self.children.setdefault(new_parent, []).append(key)
+                issue["fields"][name] = value
+            issue["fields"]["updated"] = now_iso()
+
+    def transitions(self, key: str) -> List[Dict]:
+        status = self.get(key)["fields"]["status"]["name"]
+        return [{"id": t["id"], "name": t["name"], "to": {"name": t["to"]}}
+                for t in TRANSITIONS if t["to"] != status]
+
+    def transition(self, key: str, transition_id: str):
+        with self.lock:
+            available = {t["id"]: t for t in self.transitions(key)}
+            if str(transition_id) not in available:
+                raise StandinError(400, f"Transition id '{transition_id}' is not valid for this issue.")
+            issue = self.issues[key]
+            issue["fields"]["status"] = {"name": available[str(transition_id)]["to"]["name"]}
+            issue["fields"]["updated"] = now_iso()
+
+    def link(self, type_name: str, inward_key: str, outward_key: str):
+        with self.lock:
+            self.get(inward_key)
+            self.get(outward_key)
+            # Like Jira, an identical link is not created twice
+            for existing in self.links_by_key.get(inward_key, []):
+                if (existing["type"]["name"], existing["inward"], existing["outward"]) == \
+                        (type_name, inward_key, outward_key):
+                    return
+            link = {
+                "id": str(len(self.links) + 1),
+                "type": {"name": type_name, "inward": f"is {type_name.lower()} by",
+                         "outward": type_name.lower()},
+                "inward": inward_key,
+                "outward": outward_key,
+            }
+            self.links.append(link)
+            self.links_by_key.setdefault(inward_key, []).append(link)
+            self.links_by_key.setdefault(outward_key, []).append(link)
+
+    def _linked_issue(self, key: str) -> Dict:
+        issue = self.issues[key]
+        return {"id": issue["id"], "key": key,
+                "fields": {name: issue["fields"].get(name) for name in LINKED_FIELDS}}
+
+    def render(self, key: str, fields: Optional[List[str]] = None, expand: str = "") -> Dict:
+        """Issue as returned by GET /issue or /search"""
+        issue = self.get(key)
+        all_fields = dict(issue["fields"])
+        all_fields["subtasks"] = [self._linked_issue(child) for child in self.children.get(key, [])
+                                  if self.issues[child]["fields"]["issuetype"]["subtask"]]
+        all_fields["issuelinks"] = []
+        for link in self.links_by_key.get(key, []):
+            if link["inward"] == key:
+                all_fields["issuelinks"].append({"id": link["id"], "type": link["type"],
+                                                 "outwardIssue": self._linked_issue(link["outward"])})
+            elif link["outward"] == key:
+                all_fields["issuelinks"].append({"id": link["id"], "type": link["type"],
+                                                 "inwardIssue": self._linked_issue(link["inward"])})
+
+        if fields and "*all" not in fields and "*navigable" not in fields:
+            all_fields = {name: value for name, value in all_fields.items() if name in fields}
+
+        rendered = {"id": issue["id"], "key": key, "fields": all_fields}
+        if "transitions" in expand:
+            rendered["transitions"] = self.transitions(key)
+        return rendered
+
+    def linked_keys(self, key: str) -> set:
+        links = self.links_by_key.get(key, [])
+        return ({link["outward"] for link in links if link["inward"] == key} |
+                {link["inward"] for link in links if link["outward"] == key})
+
+
+class JqlFilter:
+    """Evaluate the JQL subset used by the toolkit
+
+    Clauses joined by AND / OR (AND binds tighter, no nested parentheses):
+      key|issue = K, key|issue in (K1, K2), parent = K, parent in (...),
+      project = P, issuetype = T, issuetype in (...), labels = L, labels in (...),
+      status = S, status in (...), updated >= "yyyy/MM/dd HH:mm" or "-15m" (m/h/d/w),
+      issue in linkedIssues(K)
+    ORDER BY is accepted and ignored (results are in creation order). As in
+    Jira, a key clause naming an issue that does not exist fails the search.
+    """
+
+    CLAUSE = re.compile(
+        r'^\s*(\w+)\s*(=|!=|>=|<=|>|<|not in|in)\s*(.+?)\s*$', re.IGNORECASE)
+
+    def __init__(self, jql: str, store: IssueStore):
+        self.store = store
+        jql = re.split(r'\s+ORDER\s+BY\s+', jql or "", flags=re.IGNORECASE)[0].strip()
+        self.groups = [[self._parse(clause) for clause in self._split(group, "AND")]
+                       for group in self._split(jql, "OR")] if jql else [[]]
+
+    @staticmethod
+    def _split(text: str, keyword: str) -> List[str]:
+        parts, depth, quote, start = [], 0, None, 0
+        token = f" {keyword} "
+        i = 0
+        while i < len(text):
+            char = text[i]
+            if quote:
+                quote = None if char == quote else quote
+            elif char in "\"'":
+                quote = char
+            elif char == "(":
+                depth += 1
+            elif char == ")":
+                depth -= 1
+            elif depth == 0 and text[i:i + len(token)].upper() == token:
+                parts.append(text[start:i])
+                start = i + len(token)
+                i = start
+                continue
+            i += 1
+        parts.append(text[start:])
+        return [part.strip() for part in parts if part.strip()]
+
+    @staticmethod
+    def _values(text: str) -> List[str]:
+        text = text.strip()
+        if text.startswith("(") and text.endswith(")"):
+            text = text[1:-1]
+        return [value.strip().strip("\"'") for value in text.split(",") if value.strip()]
+
+    def _parse(self, clause: str):
+        clause = clause.strip()
+        while clause.startswith("(") and clause.endswith(")"):
+            clause = clause[1:-1].strip()
+        match = self.CLAUSE.match(clause)
+        if not match:
+            raise StandinError(400, f"Error in the JQL Query: unsupported clause '{clause}'")
+        field, op, value = match.group(1).lower(), match.group(2).lower(), match.group(3)
+
+        linked = re.match(r'linkedIssues\(\s*"?([\w-]+)"?\s*\)', value, re.IGNORECASE)
+        if linked:
+            return ("linked", op, linked.group(1))
+        return (field, op, self._values(value))
+
+    def unknown_keys(self) -> List[Tuple[str, str]]:
+        """(key, field) pairs named by key clauses that match no issue
+
+        Jira rejects the whole query over these instead of matching nothing.
+        """
+        return [(value, field) for group in self.groups for field, _, values in group
+                if field in ("key", "issue", "issuekey")
+                for value in values if value not in self.store.issues]
+
+    def matches(self, key: str) -> bool:
+        return any(all(self._match_clause(key, clause) for clause in group) for group in self.groups)
+
+    def _match_clause(self, key: str, clause) -> bool:
+        field, op, values = clause
+        fields = self.store.issues[key]["fields"]
+
+        if field == "linked":
+            return key in self.store.linked_keys(values)
+        if field == "updated":
+            return self._compare_time(fields["updated"], op, values[0])
+
+        if field in ("key", "issue", "issuekey"):
+            actual = {key}
+        elif field == "parent":
+            actual = {fields.get("parent", {}).get("key")}
+        elif field == "project":
+            actual = {fields["project"]["key"]}
+        elif field in ("issuetype", "type"):
+            actual = {fields["issuetype"]["name"].lower(), fields["issuetype"]["id"]}
+            values = [value.lower() for value in values]
+        elif field == "labels":
+            actual = set(fields.get("labels") or [])
+        elif field == "status":
+            actual = {fields["status"]["name"].lower()}
+            values = [value.lower() for value in values]
+        else:
+            raise StandinError(400, f"Error in the JQL Query: field '{field}' is not supported")
+
+        hit = bool(actual & set(values))
+        return not hit if op in ("!=", "not in") else hit
+
+    @staticmethod
+    def _compare_time(updated: str, op: str, value: str) -> bool:
+        relative = re.fullmatch(r'-(\d+)([mhdw])', value.strip())
+        if relative:
+            unit = {"m": "minutes", "h": "hours", "d": "days", "w": "weeks"}[relative.group(2)]
+            bound = datetime.now(timezone.utc) - timedelta(**{unit: int(relative.group(1))})
+        else:
+            value = value.replace("/", "-")
+            for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+                try:
+                    bound = datetime.strptime(value, fmt).replace(tzinfo=timezone.utc)
+                    break
+                except ValueError:
+                    continue
+            else:
+                raise StandinError(400, f"Date value '{value}' for field 'updated' is invalid")
+        actual = datetime.strptime(updated[:19], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=timezone.utc)
+        return {">=": actual >= bound, ">": actual > bound,
+                "<=": actual <= bound, "<": actual < bound}.get(op, False)
+
+
+class TokenBucket:
+    """Requests per second limit; returns the seconds to wait when exhausted"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, options):
+        super().__init__(address, StandinHandler)
+        self.options = options
+        self.store = IssueStore(options.project)
+        self.bucket = TokenBucket(options.rate_limit) if options.rate_limit else None
+        self.random = random.Random(options.seed)
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats = Counter()
+            self.started = time.monotonic()
+
+    def count(self, name: str, amount: int = 1):
+        with self.stats_lock:
+            self.stats[name] += amount
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "JiraStandin/1.0"
+    # Headers and body go out in separate writes; without this, Nagle plus
+    # delayed ACKs add ~40ms to every keep-alive response
+    disable_nagle_algorithm = True
+
+    ROUTES = [
+        ("POST", re.compile(r'^/rest/api/[23]/issue/bulk$'), "create_bulk"),
+        ("POST", re.compile(r'^/rest/api/[23]/issue$'), "create_issue"),
+        ("GET", re.compile(r'^/rest/api/[23]/issue/([\w-]+)/transitions$'), "get_transitions"),
+        ("POST", re.compile(r'^/rest/api/[23]/issue/([\w-]+)/transitions$'), "post_transition"),
+        ("GET", re.compile(r'^/rest/api/[23]/issue/([\w-]+)$'), "get_issue"),
+        ("PUT", re.compile(r'^/rest/api/[23]/issue/([\w-]+)$'), "edit_issue"),
+        ("POST", re.compile(r'^/rest/api/[23]/issueLink$'), "create_link"),
+        ("GET", re.compile(r'^/rest/api/[23]/search(?:/jql)?$'), "search"),
+        ("POST", re.compile(r'^/rest/api/[23]/search(?:/jql)?$'), "search"),
+    ]
+
+    def log_message(self, format, *args):
+        if self.server.options.verbose:
+            super().log_message(format, *args)
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    def do_PUT(self):
+        self.dispatch("PUT")
+
+    def dispatch(self, method: str):
+        url = urlsplit(self.path)
+        self.query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+
+        try:
+            self.body = json.loads(raw) if raw else {}
+        except ValueError:
+            self.send_json(400, {"errorMessages": ["Invalid JSON body"]})
+            return
+
+        if url.path.startswith("/_standin/"):
+            self.control(method, url.path)
+            return
+
+        for route_method, pattern, name in self.ROUTES:
+            match = pattern.match(url.path)
+            if route_method == method and match:
+                break
+        else:
+            self.send_json(404, {"errorMessages": [f"No stand-in route for {method} {url.path}"]})
+            return
+
+        server = self.server
+        options = server.options
+        server.count("requests")
+        server.count(f"{method} {name}")
+
+        if not self.headers.get("Authorization"):
+            server.count("status_401")
+            self.send_json(401, {"errorMessages": ["You are not authenticated."]})
+            return
+
+        if server.bucket:
+            wait = server.bucket.take()
+            if wait:
+                server.count("status_429")
+                self.send_json(429, {"errorMessages": ["Rate limit exceeded."]},
+                               {"Retry-After": str(max(1, round(wait)))})
+                return
+
+        if options.latency:
+            time.sleep(max(0.0, options.latency + server.random.uniform(-1, 1) * options.jitter) / 1000)
+
+        if options.fail_rate and server.random.random() < options.fail_rate:
+            server.count("status_500")
+            self.send_json(500, {"errorMessages": ["Injected failure"]})
+            return
+
+        try:
+            status, payload = getattr(self, name)(*match.groups())
+        except StandinError as e:
+            server.count(f"status_{e.status}")
+            self.send_json(e.status, e.payload)
+            return
+        self.send_json(status, payload)
+
+    def send_json(self, status: int, payload, headers: Dict = None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        if body and "gzip" in self.headers.get("Accept-Encoding", "") and len(body) > 512:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        if body:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    # --- Jira endpoints -------------------------------------------------
+
+    def create_issue(self):
+        created = self.server.store.create(self.body.get("fields") or {})
+        self.server.count("issues_created")
+        return 201, created
+
+    def create_bulk(self):
+        issues, errors = [], []
+        for index, update in enumerate(self.body.get("issueUpdates") or []):
+            try:
+                issues.append(self.server.store.create(update.get("fields") or {}))
+            except StandinError as e:
+                errors.append({"status": e.status, "elementErrors": e.payload,
+                               "failedElementNumber": index})
+        self.server.count("issues_created", len(issues))
+        return (201 if issues or not errors else 400), {"issues": issues, "errors": errors}
+
+    def get_issue(self, key):
+        fields = self.query.get("fields")
+        fields = [f.strip() for f in fields.split(",")] if fields else None
+        return 200, self.server.store.render(key, fields, self.query.get("expand", ""))
+
+    def edit_issue(self, key):
+        self.server.store.edit(key, self.body.get("fields") or {})
+        return 204, None
+
+    def get_transitions(self, key):
+        return 200, {"transitions": self.server.store.transitions(key)}
+
+    def post_transition(self, key):
+        transition_id = (self.body.get("transition") or {}).get("id")
+        self.server.store.transition(key, transition_id)
+        self.server.count("transitions")
+        return 204, None
+
+    def create_link(self):
+        self.server.store.link((self.body.get("type") or {}).get("name", "Relates"),
+                               (self.body.get("inwardIssue") or {}).get("key"),
+                               (self.body.get("outwardIssue") or {}).get("key"))
+        return 201, None
+
+    def search(self):
+        params = dict(self.query)
+        params.update(self.body or {})
+        store = self.server.store
+        jql_filter = JqlFilter(params.get("jql", ""), store)
+
+        fields = params.get("fields")
+        if isinstance(fields, str):
+            fields = [f.strip() for f in fields.split(",")]
+        expand = params.get("expand") or ""
+        if isinstance(expand, list):
+            expand = ",".join(expand)
+
+        max_results = min(int(params.get("maxResults") or 50), 100)
+        start_at = int(params.get("nextPageToken") or params.get("startAt") or 0)
+
+        with store.lock:
+            unknown = jql_filter.unknown_keys()
+            if unknown:
+                self.server.count("status_400")
+                return 400, {"errorMessages": [f"An issue with key '{key}' does not exist for field '{field}'."
+                                               for key, field in unknown], "errors": {}}
+            keys = [key for key in store.issues if jql_filter.matches(key)]
+            page = [store.render(key, fields, expand) for key in keys[start_at:start_at + max_results]]
+
+        end = start_at + len(page)
+        result = {"issues": page, "startAt": start_at, "maxResults": max_results,
+                  "total": len(keys), "isLast": end >= len(keys)}
+        if end < len(keys):
+            result["nextPageToken"] = str(end)
+        return 200, result
+
+    # --- Control endpoints ------------------------------------------------
+
+    def control(self, method: str, path: str):
+        server = self.server
+        if path == "/_standin/stats" and method == "GET":
+            with server.stats_lock:
+                stats = dict(server.stats)
+                stats["elapsed"] = round(time.monotonic() - server.started, 3)
+            stats["issues"] = len(server.store.issues)
+            self.send_json(200, stats)
+        elif path == "/_standin/reset" and method == "POST":
+            if self.body.get("issues"):
+                server.store.reset()
+            server.reset_stats()
+            self.send_json(200, {"ok": True})
+        elif path == "/_standin/seed" and method == "POST":
+            self.send_json(200, self.seed(self.body))
+        else:
+            self.send_json(404, {"errorMessages": [f"Unknown control endpoint {path}"]})
+
+    def seed(self, spec: Dict) -> Dict:
+        """Create epics (labelled stage-NNN), stories and test cases without counting requests
+
+        spec: {"epics": N, "storiesPerEpic": M, "subtasksPerStory": S, "linkedTestsPerStory": T}
+        """
+        store = self.server.store
+        project = {"key": store.project_key}
+        result = {"epics": [], "stories": []}
+        for number in range(1, int(spec.get("epics", 0)) + 1):
+            epic = store.create({"project": project, "summary": f"STAGE-{number:03d}: Stage {number}",
+                                 "issuetype": {"id": "10000"}, "labels": [f"stage-{number:03d}", "stage"]})
+            result["epics"].append(epic["key"])
+            for story_number in range(int(spec.get("storiesPerEpic", 0))):
+                story = store.create({"project": project, "summary": f"Story {number}.{story_number}",
+                                      "issuetype": {"id": "10006"}, "parent": {"key": epic["key"]},
+                                      "labels": [f"stage-{number:03d}"]})
+                result["stories"].append(story["key"])
+                for test in range(int(spec.get("subtasksPerStory", 0))):
+                    store.create({"project": project, "summary": f"TC-{test + 1:03d}: Subtask test",
+                                  "issuetype": {"id": "10007"}, "parent": {"key": story["key"]}})
+                for test in range(int(spec.get("linkedTestsPerStory", 0))):
+                    linked = store.create({"project": project, "summary": f"TC-{test + 1:03d}: Linked test",
+                                           "issuetype": {"id": "10008"}})
+                    store.link("Test", linked["key"], story["key"])
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run an offline Jira stand-in server")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8089, help="Port to listen on (0 = any free port)")
+    parser.add_argument("--project", default="AURA", help="Project key for created issues")
+    parser.add_argument("--latency", type=float, default=0, help="Added latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="Random +/- latency jitter (ms)")
+    parser.add_argument("--rate-limit", type=float, default=0,
+                        help="Requests per second before answering 429 (0 = unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0,
+                        help="Fraction of requests answered with 500 (e.g. 0.05)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for jitter and failures")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    options = parser.parse_args()
+
+    server = StandinServer((options.host, options.port), options)
+    host, port = server.server_address[:2]
+    # The benchmark suite reads this line to find the port
+    print(f"Jira stand-in listening on http://{host}:{port} (project {options.project})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Plan Parser Benchmark - Measure how ImplementationPlanParser scales with plan size
+Generates synthetic implementation plans and reports parse time and peak memory
+"""
+
+import argparse
+import importlib.util
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_script(relative_path: str, module_name: str):
+    """Import one of the skill scripts (their file names aren't valid module names)"""
+    spec = importlib.util.spec_from_file_location(module_name, REPO_ROOT / relative_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def write_plan(path: Path, total_tasks: int, tasks_per_stage: int = 20):
+    """Write a synthetic plan in the documented implementation plan format"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("# Implementation Plan\n\n## Project Overview\n\nSynthetic benchmark plan.\n\n---\n\n")
+        stage = 0
+        for start in range(0, total_tasks, tasks_per_stage):
+            stage += 1
+            f.write(f"### Stage {stage}: Feature Area {stage} (Week {stage}-{stage + 1}, 40 hours)\n")
+            f.write("**Tasks:**\n")
+            for task in range(start, min(start + tasks_per_stage, total_tasks)):
+                f.write(f"- [ ] Create endpoint /api/resource{task} with validation and tests\n")
+                if task % 5 == 0:
+                    f.write(f"  - [ ] Build UI component for resource {task}\n")
+            f.write("\n**Acceptance Criteria:**\n")
+            f.write("- ✅ Endpoints respond correctly\n- ✅ UI renders on mobile and desktop\n\n---\n\n")
+
+
+def legacy_parse(plan_path: Path) -> int:
+    """The previous whole-file regex parser, kept for comparison"""
+    content = plan_path.read_text(encoding='utf-8')
+    stage_pattern = r'### Stage (\d+): (.+?) \(Week .+?\).*?\*\*Tasks:\*\*(.*?)(?=###|\Z)'
+    count = 0
+    for match in re.finditer(stage_pattern, content, re.DOTALL):
+        count += len(re.findall(r'- \[ \] (.+)', match.group(3)))
+    return count
+
+
+def streaming_parse(parser_class, plan_path: Path) -> int:
+    """Consume the streaming parser without keeping stages around"""
+    return sum(len(stage["tasks"]) for stage in parser_class(str(plan_path)).iter_stages())
+
+
+def measure(func, repeat: int):
+    """Best wall time over `repeat` runs, plus peak traced memory of one run"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark implementation plan parsing")
+    parser.add_argument("--sizes", default="1000,5000,10000,20000,50000",
+                        help="Comma-separated task counts to generate")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best time is reported)")
+    parser.add_argument("--legacy", action="store_true", help="Also time the old regex parser")
+    args = parser.parse_args()
+
+    story_creator = load_script("jira-story-creator/jira-story-creator.py", "jira_story_creator")
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    header = f"{'tasks':>8} {'parsed':>8} {'time (ms)':>10} {'us/task':>8} {'peak KiB':>9}"
+    if args.legacy:
+        header += f" {'legacy (ms)':>12} {'legacy KiB':>11}"
+    print(header)
+    print("-" * len(header))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            plan_path = Path(tmp) / f"plan-{size}.md"
+            write_plan(plan_path, size)
+
+            parsed, elapsed, peak = measure(
+                lambda: streaming_parse(story_creator.ImplementationPlanParser, plan_path), args.repeat)
+            line = (f"{size:>8} {parsed:>8} {elapsed * 1000:>10.1f} "
+                    f"{elapsed * 1e6 / parsed:>8.2f} {peak / 1024:>9.0f}")
+
+            if args.legacy:
+                legacy_count, legacy_elapsed, legacy_peak = measure(
+                    lambda: legacy_parse(plan_path), args.repeat)
+                if legacy_count != parsed:
+                    print(f"WARNING: legacy parser found {legacy_count} tasks", file=sys.stderr)
+                line += f" {legacy_elapsed * 1000:>12.1f} {legacy_peak / 1024:>11.0f}"
+
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
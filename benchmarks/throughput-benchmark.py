@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Throughput Benchmark - Run the Jira skills against the offline stand-in and compare modes
+Reports requests, wall time and issues/sec for plans and projects of increasing size
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+import zipfile
+from pathlib import Path
+from typing import Dict, List
+from xml.sax.saxutils import escape
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+STANDIN = REPO_ROOT / "benchmarks" / "jira-standin.py"
+STORY_CREATOR = REPO_ROOT / "jira-story-creator" / "jira-story-creator.py"
+PROJECT_CREATOR = REPO_ROOT / "jira-project-creator" / "jira-project-creator.py"
+STATUS_UPDATE = REPO_ROOT / "jira-status-update" / "jira-update.py"
+
+PROJECT_KEY = "AURA"
+TASKS_PER_STAGE = 20
+
+
+class Standin:
+    """Run jira-standin.py as a subprocess for the duration of a benchmark"""
+
+    def __init__(self, latency: float, jitter: float, rate_limit: float, fail_rate: float):
+        self.args = [sys.executable, str(STANDIN), "--port", "0", "--project", PROJECT_KEY,
+                     "--latency", str(latency), "--jitter", str(jitter),
+                     "--rate-limit", str(rate_limit), "--fail-rate", str(fail_rate)]
+        self.process = None
+        self.url = ""
+
+    def __enter__(self):
+        self.process = subprocess.Popen(self.args, stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline()
+        if "listening on " not in line:
+            self.process.kill()
+            raise RuntimeError(f"Jira stand-in failed to start: {line!r}")
+        self.url = line.split("listening on ", 1)[1].split()[0]
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        self.process.wait(timeout=10)
+
+    def control(self, path: str, payload: Dict = None) -> Dict:
+        data = json.dumps(payload).encode() if payload is not None else None
+        request = urllib.request.Request(f"{self.url}/_standin/{path}", data=data,
+                                         method="POST" if data is not None else "GET")
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def reset(self, issues: bool = False):
+        self.control("reset", {"issues": issues})
+
+    def seed(self, **spec) -> Dict:
+        return self.control("seed", spec)
+
+    def stats(self) -> Dict:
+        return self.control("stats")
+
+
+def tool_env(workdir: Path, **variables: str) -> Dict:
+    """Environment for a tool run, with its caches kept under the benchmark's temp dir"""
+    return dict(os.environ, XDG_CACHE_HOME=str(workdir / "cache"), **variables)
+
+
+def has_modules(*names: str) -> bool:
+    return all(importlib.util.find_spec(name) is not None for name in names)
+
+
+def write_plan(path: Path, total_tasks: int):
+    """Implementation plan in the jira-story-creator format"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("# Benchmark Plan\n\n")
+        for index, start in enumerate(range(0, total_tasks, TASKS_PER_STAGE), 1):
+            f.write(f"### Stage {index}: Feature Area {index} (Week {index}, 40 hours)\n**Tasks:**\n")
+            for task in range(start, min(start + TASKS_PER_STAGE, total_tasks)):
+                f.write(f"- [ ] Create endpoint /api/resource{task} with validation\n")
+            f.write("\n")
+
+
+def write_spec_docx(path: Path, stages: int):
+    """Minimal .docx spec with 'Stage N:' headings that SpecParser understands"""
+    paragraphs = ["Project: Benchmark Project", f"Timeline: {stages} weeks"]
+    for number in range(1, stages + 1):
+        paragraphs += [f"Stage {number}: Feature Area {number}",
+                       f"Build and ship feature area {number}.",
+                       f"- Task A for area {number}", f"- Task B for area {number}"]
+    body = "".join(f"<w:p><w:r><w:t>{escape(text)}</w:t></w:r></w:p>" for text in paragraphs)
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as docx:
+        docx.writestr("[Content_Types].xml",
+                      '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                      '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                      '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                      '<Default Extension="xml" ContentType="application/xml"/>'
+                      '<Override PartName="/word/document.xml" ContentType="application/'
+                      'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/></Types>')
+        docx.writestr("_rels/.rels",
+                      '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                      '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                      '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+                      '2006/relationships/officeDocument" Target="word/document.xml"/></Relationships>')
+        docx.writestr("word/document.xml",
+                      '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                      '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+                      f'<w:body>{body}</w:body></w:document>')
+
+
+def run(command: List[str], env: Dict, cwd: Path) -> (int, float, str):
+    start = time.perf_counter()
+    result = subprocess.run(command, env=env, cwd=str(cwd), capture_output=True, text=True)
+    return result.returncode, time.perf_counter() - start, result.stdout + result.stderr
+
+
+def measure(standin: Standin, label: str, commands: List[List[str]], env: Dict,
+            cwd: Path, issues_counter: str) -> Dict:
+    """Run commands back to back and collect stand-in counters for the batch"""
+    standin.reset()
+    wall = 0.0
+    failures = 0
+    output = ""
+    for command in commands:
+        code, elapsed, output = run(command, env, cwd)
+        wall += elapsed
+        failures += code != 0
+    stats = standin.stats()
+    issues = stats.get(issues_counter, 0)
+    if failures:
+        print(f"  {label}: {failures} run(s) exited non-zero; last output:\n{output[-800:]}",
+              file=sys.stderr)
+    return {
+        "mode": label,
+        "requests": stats.get("requests", 0),
+        "throttled": stats.get("status_429", 0),
+        "errors": stats.get("status_500", 0),
+        "issues": issues,
+        "wall": wall,
+        "issues_per_sec": issues / wall if wall else 0.0,
+    }
+
+
+def bench_story_creator(standin: Standin, size: int, workdir: Path) -> List[Dict]:
+    plan = workdir / f"plan-{size}.md"
+    write_plan(plan, size)
+    config = workdir / "story-config.json"
+    config.write_text(json.dumps({"jira": {
+        "instanceUrl": standin.url, "email": "bench@example.com", "apiToken": "token",
+        "projectKey": PROJECT_KEY, "storyTypeId": "10006"}}))
+
+    modes = [
+        ("sequential", []),
+        ("--workers 8", ["--workers", "8"]),
+        ("--bulk", ["--bulk"]),
+        ("--bulk --workers 4", ["--bulk", "--workers", "4"]),
+    ]
+
+    rows = []
+    for label, extra in modes:
+        # Fresh issues (with epics AURA-1..N for the stage parents) and a fresh ledger per mode
+        standin.reset(issues=True)
+        standin.seed(epics=-(-size // TASKS_PER_STAGE))
+        ledger = workdir / f"ledger-{size}-{len(rows)}.sqlite"
+        mirror = workdir / f"story-mirror-{size}-{len(rows)}.sqlite"
+        command = [sys.executable, str(STORY_CREATOR), "--plan", str(plan), "--config", str(config),
+                   "--ledger", str(ledger), "--mirror", str(mirror)] + extra
+        rows.append(measure(standin, label, [command], tool_env(workdir), workdir, "issues_created"))
+    return rows
+
+
+def bench_project_creator(standin: Standin, size: int, workdir: Path) -> List[Dict]:
+    stages = max(1, size // TASKS_PER_STAGE)
+    spec = workdir / f"spec-{stages}.docx"
+    write_spec_docx(spec, stages)
+    config = workdir / "project-config.json"
+    config.write_text(json.dumps({
+        "jira": {"instanceUrl": standin.url, "email": "bench@example.com", "apiToken": "token",
+                 "projectKey": PROJECT_KEY},
+        "timeline": {"startDate": "2026-01-05", "compressionFactor": 7},
+        "options": {"addDependencies": True}}))
+
+    standin.reset(issues=True)
+    env = tool_env(workdir)
+    env.pop("ANTHROPIC_API_KEY", None)  # benchmark the spec-parsing path, not the LLM
+    command = [sys.executable, str(PROJECT_CREATOR), "--spec", str(spec), "--config", str(config),
+               "--mirror", str(workdir / f"project-mirror-{size}.sqlite"),
+               "--spec-cache", str(workdir / "specs")]
+    return [measure(standin, f"{stages} stages", [command], env, workdir, "issues_created")]
+
+
+def bench_status_update(standin: Standin, size: int, workdir: Path) -> List[Dict]:
+    stories = max(1, size // 10)
+    env = tool_env(workdir, JIRA_BASE_URL=standin.url, JIRA_EMAIL="bench@example.com",
+                   JIRA_API_TOKEN="token")
+    modes = [
+        ("per-story runs", lambda script, keys: [script + [key, "Done"] for key in keys]),
+        ("one batch run", lambda script, keys: [script + keys + ["Done"]]),
+    ]
+
+    rows = []
+    for label, commands in modes:
+        # Every mode starts from freshly seeded stories and an empty issue mirror
+        standin.reset(issues=True)
+        seeded = standin.seed(epics=1, storiesPerEpic=stories, subtasksPerStory=3, linkedTestsPerStory=2)
+        # A warm daemon from the user's own shell must not serve these runs
+        script = [sys.executable, str(STATUS_UPDATE), "--no-daemon",
+                  "--mirror", str(workdir / f"update-mirror-{size}-{len(rows)}.sqlite")]
+        rows.append(measure(standin, label, commands(script, seeded["stories"]),
+                            env, workdir, "transitions"))
+    return rows
+
+
+TOOLS = {
+    "story": ("jira-story-creator.py", bench_story_creator, ()),
+    "project": ("jira-project-creator.py", bench_project_creator, ()),
+    "update": ("jira-update.py", bench_status_update, ("requests",)),
+}
+
+
+def print_rows(tool: str, size: int, rows: List[Dict]):
+    for row in rows:
+        print(f"{tool:<24} {size:>6} {row['mode']:<24} {row['requests']:>8} {row['throttled']:>6} "
+              f"{row['issues']:>7} {row['wall']:>8.2f} {row['issues_per_sec']:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Jira skills against the offline stand-in")
+    parser.add_argument("--sizes", default="50,200,500", help="Comma-separated task counts per run")
+    parser.add_argument("--tools", default="story,project,update",
+                        help="Comma-separated tools to run: story, project, update")
+    parser.add_argument("--latency", type=float, default=50, help="Stand-in latency per request (ms)")
+    parser.add_argument("--jitter", type=float, default=10, help="Stand-in latency jitter (ms)")
+    parser.add_argument("--rate-limit", type=float, default=0,
+                        help="Stand-in requests/sec before 429s (0 = unlimited)")
+    parser.add_argument("--fail-rate", type=float, default=0, help="Fraction of requests that fail with 500")
+    parser.add_argument("--json", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    tools = [tool.strip() for tool in args.tools.split(",")]
+    results = []
+
+    print(f"Stand-in: latency {args.latency:g}ms ±{args.jitter:g}ms, "
+          f"rate limit {args.rate_limit or 'none'}, fail rate {args.fail_rate:g}")
+    print()
+    print(f"{'tool':<24} {'size':>6} {'mode':<24} {'requests':>8} {'429s':>6} "
+          f"{'issues':>7} {'wall (s)':>8} {'issues/sec':>10}")
+    print("-" * 100)
+
+    with tempfile.TemporaryDirectory() as tmp, \
+            Standin(args.latency, args.jitter, args.rate_limit, args.fail_rate) as standin:
+        workdir = Path(tmp)
+        for tool in tools:
+            script, bench, modules = TOOLS[tool]
+            if not has_modules(*modules):
+                print(f"{script:<24} skipped: requires {', '.join(modules)}")
+                continue
+            for size in sizes:
+                rows = bench(standin, size, workdir)
+                print_rows(script, size, rows)
+                results += [dict(row, tool=script, size=size) for row in rows]
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,64 +5,262 @@ Automatically creates Jira Epics, dependencies, timeline, and Plan from a spec d
 """
 
 import argparse
+import base64
+import gzip
+import hashlib
+import http.client
 import json
+import queue
+import select
+import ssl
 import sys
-import subprocess
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urlsplit
+from xml.etree import ElementTree
 import re
 import os
+import sqlite3
+
+# Jira accepts at most 50 issues per /rest/api/3/issue/bulk request
+BULK_BATCH_SIZE = 50
+
+# Epic start date ("Start date" on the roadmap)
+START_DATE_FIELD = "customfield_10015"
+
+# Local state shared by the Jira skills
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "jira-toolkit"
+
+# Bump when iter_docx_blocks changes what it extracts, so old cache entries are ignored
+SPEC_CACHE_VERSION = 3
+
+# Parsed specs kept in the spec cache (least recently used are removed first)
+SPEC_CACHE_ENTRIES = 20
+
+# Generated plans kept in the plan cache (least recently used are removed first)
+PLAN_CACHE_ENTRIES = 20
+
+# Specs up to this many characters are planned in one request; longer ones are split
+PLAN_SINGLE_REQUEST_CHARS = 50000
+# Largest part of a split spec, and how many parts are planned at once
+PLAN_CHUNK_CHARS = 20000
+PLAN_WORKERS = 8
+# Stage count the merged plan of a split spec is reduced to
+PLAN_MAX_STAGES = 15
+
+# WordprocessingML tags read by iter_docx_blocks
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# Elements that wrap runs inside a paragraph (links, tracked insertions, simple fields)
+RUN_CONTAINERS = {W + "hyperlink", W + "ins", W + "smartTag", W + "fldSimple"}
+
+
+def docx_run_text(run) -> str:
+    """Text of a w:r element, with tabs and breaks as python-docx renders them"""
+    parts = []
+    for child in run:
+        if child.tag == W + "t":
+            parts.append(child.text or "")
+        elif child.tag in (W + "tab", W + "ptab"):
+            parts.append("\t")
+        elif child.tag in (W + "br", W + "cr"):
+            parts.append("\n")
+        elif child.tag == W + "noBreakHyphen":
+            parts.append("-")
+    return "".join(parts)
+
+
+def docx_paragraph_text(paragraph) -> str:
+    """Text of a w:p element's own runs (text boxes anchored in it are not included)"""
+    parts = []
+    for child in paragraph:
+        if child.tag == W + "r":
+            parts.append(docx_run_text(child))
+        elif child.tag in RUN_CONTAINERS:
+            parts.extend(docx_run_text(run) for run in child if run.tag == W + "r")
+    return "".join(parts)
+
+
+def docx_paragraph_kind(paragraph) -> str:
+    """Block kind of a w:p: Title/Heading N styles are headings, numbered or List-styled ones list items"""
+    properties = paragraph.find(W + "pPr")
+    if properties is None:
+        return "paragraph"
+    style = properties.find(W + "pStyle")
+    style = style.get(W + "val", "") if style is not None else ""
+    if style == "Title" or style.startswith("Heading"):
+        return "heading"
+    if properties.find(W + "numPr") is not None or style.startswith("List"):
+        return "list_item"
+    return "paragraph"
+
+
+def iter_docx_blocks(spec_path: str):
+    """Stream a .docx body as (kind, text) blocks in document order
+
+    kind is "paragraph", "heading", "list_item" (a numbered or bulleted
+    paragraph) or "table_row" (cell texts joined with " | "; nested tables are folded into
+    their cell). word/document.xml is read straight from the zip with an
+    incremental parser, and each block is discarded once yielded, so memory
+    stays flat however long the document is.
+    """
+    with zipfile.ZipFile(spec_path) as docx, docx.open("word/document.xml") as xml:
+        body = None
+        paragraph_depth = 0  # > 1 inside text boxes
+        table_depth = 0
+        row = []
+
+        for event, elem in ElementTree.iterparse(xml, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == W + "p":
+                    paragraph_depth += 1
+                elif tag == W + "tbl":
+                    table_depth += 1
+                elif tag == W + "tr" and table_depth == 1:
+                    row = []
+                elif tag == W + "body":
+                    body = elem
+                continue
+
+            if tag == W + "p":
+                paragraph_depth -= 1
+                if paragraph_depth or table_depth:
+                    continue  # read with the paragraph or cell around it
+                yield docx_paragraph_kind(elem), docx_paragraph_text(elem)
+            elif tag == W + "tc" and table_depth == 1:
+                row.append("\n".join(docx_paragraph_text(p) for p in elem.iter(W + "p")).strip())
+                continue
+            elif tag == W + "tr" and table_depth == 1:
+                yield "table_row", " | ".join(row)
+                continue
+            elif tag == W + "tbl":
+                table_depth -= 1
+                if table_depth:
+                    continue
+            else:
+                continue
+
+            # A top-level block is done: drop it (and the emptied body entries) from the tree
+            elem.clear()
+            if body is not None:
+                body.clear()
+
+
+class SpecDocument:
+    """Text of a specification document, parsed once per run for AI planning
+
+    Holds the (kind, text) blocks from iter_docx_blocks (the fallback spec
+    parser reads them straight from the file instead). Parsed documents are
+    cached on disk keyed by a hash of the file's bytes, so rerunning on an
+    unchanged spec skips parsing entirely.
+    """
+
+    def __init__(self, blocks: List[Tuple[str, str]], content_hash: str = ""):
+        self.blocks = blocks
+        self.content_hash = content_hash
+        self._text = None
+
+    @property
+    def text(self) -> str:
+        """All block texts joined with newlines (built on first use)"""
+        if self._text is None:
+            self._text = "\n".join(text for _, text in self.blocks)
+        return self._text
+
+    @staticmethod
+    def file_hash(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def parse(spec_path: str) -> List[Tuple[str, str]]:
+        """Paragraphs, list items and table rows of a .docx file"""
+        return list(iter_docx_blocks(spec_path))
+
+    @classmethod
+    def load(cls, spec_path: str, cache_dir: Optional[Path] = CACHE_DIR / "specs") -> "SpecDocument":
+        """Parse a spec, or reuse its cached parse if the file is unchanged (cache_dir=None disables)"""
+        content_hash = cls.file_hash(spec_path)
+        cache_path = Path(cache_dir) / f"{content_hash}.json" if cache_dir else None
+
+        if cache_path:
+            try:
+                with open(cache_path, encoding="utf-8") as f:
+                    cached = json.load(f)
+                if cached.get("version") == SPEC_CACHE_VERSION:
+                    os.utime(cache_path)  # mark as recently used
+                    return cls([(kind, text) for kind, text in cached["blocks"]], content_hash)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        document = cls(cls.parse(spec_path), content_hash)
+        if cache_path:
+            document.save(cache_path)
+        return document
+
+    def save(self, cache_path: Path):
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": SPEC_CACHE_VERSION, "blocks": self.blocks}, f)
+        os.replace(tmp_path, cache_path)
+
+        entries = sorted(cache_path.parent.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for stale in entries[SPEC_CACHE_ENTRIES:]:
+            stale.unlink(missing_ok=True)
 
-try:
-    from docx import Document
-except ImportError:
-    print("ERROR: python-docx not installed. Run: pip install python-docx")
-    sys.exit(1)
 
-try:
-    import anthropic
-except ImportError:
-    print("ERROR: anthropic not installed. Run: pip install anthropic")
-    sys.exit(1)
+class SpecParser:
+    """Parse project specification document
 
+    Takes any iterable of (kind, text) blocks: a SpecDocument's blocks, or
+    iter_docx_blocks() directly to parse a file in a single streaming pass.
+    """
 
-class SpecParser:
-    """Parse project specification document"""
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self._parsed = None
 
-    def __init__(self, spec_path: str):
-        self.spec_path = spec_path
-        self.doc = Document(spec_path)
+    @classmethod
+    def from_docx(cls, spec_path: str) -> "SpecParser":
+        return cls(iter_docx_blocks(spec_path))
+
+    def parse(self) -> Tuple[Dict, List[Dict]]:
+        """Project info and stages, read in one pass over the blocks"""
+        if self._parsed is not None:
+            return self._parsed
 
-    def extract_project_info(self) -> Dict:
-        """Extract project name, timeline, scope"""
         info = {
             "name": "",
             "timeline_weeks": 0,
             "stages": []
         }
-
-        full_text = "\n".join([p.text for p in self.doc.paragraphs])
-
-        # Extract project name (look for "Project:" or similar)
-        name_match = re.search(r'Project[:\s]+([^\n]+)', full_text, re.IGNORECASE)
-        if name_match:
-            info["name"] = name_match.group(1).strip()
-
-        # Extract timeline (look for "X weeks" or "X-Y weeks")
-        timeline_match = re.search(r'(\d+)[-–]?(\d+)?\s*weeks?', full_text, re.IGNORECASE)
-        if timeline_match:
-            info["timeline_weeks"] = int(timeline_match.group(2) or timeline_match.group(1))
-
-        return info
-
-    def extract_stages(self) -> List[Dict]:
-        """Extract stages/epics from specification"""
         stages = []
         current_stage = None
 
-        for para in self.doc.paragraphs:
-            text = para.text.strip()
+        for kind, text in self.blocks:
+            # Extract project name (look for "Project:" or similar)
+            if not info["name"]:
+                name_match = re.search(r'Project[:\s]+([^\n]+)', text, re.IGNORECASE)
+                if name_match:
+                    info["name"] = name_match.group(1).strip()
+
+            # Extract timeline (look for "X weeks" or "X-Y weeks")
+            if not info["timeline_weeks"]:
+                timeline_match = re.search(r'(\d+)[-–]?(\d+)?\s*weeks?', text, re.IGNORECASE)
+                if timeline_match:
+                    info["timeline_weeks"] = int(timeline_match.group(2) or timeline_match.group(1))
+
+            text = text.strip()
 
             # Look for stage headings (e.g., "Stage 1:", "EPIC-001:", etc.)
             stage_match = re.match(r'(?:Stage|Epic|STAGE|EPIC)[\s-]*(\d+)[:\s]+(.+)', text, re.IGNORECASE)
@@ -79,10 +277,11 @@ class SpecParser:
                     "dependencies": []
                 }
             elif current_stage:
-                # Add to description or tasks
-                if text.startswith("- [ ]") or text.startswith("-"):
+                # Add to description or tasks (Word bullets count as "- " items)
+                if kind == "list_item" or text.startswith("- [ ]") or text.startswith("-"):
                     task = text.lstrip("- [ ]").strip()
-                    current_stage["tasks"].append(task)
+                    if task:
+                        current_stage["tasks"].append(task)
                 elif "week" in text.lower() or "day" in text.lower():
                     current_stage["timeline"] = text
                 else:
@@ -91,20 +290,270 @@ class SpecParser:
         if current_stage:
             stages.append(current_stage)
 
-        return stages
+        self._parsed = info, stages
+        return self._parsed
+
+    def extract_project_info(self) -> Dict:
+        """Extract project name, timeline, scope"""
+        return self.parse()[0]
+
+    def extract_stages(self) -> List[Dict]:
+        """Extract stages/epics from specification"""
+        return self.parse()[1]
+
+
+class RateLimiter:
+    """Shared request pacing for one Jira site
+
+    Callers take a slot with acquire() before each request. A 429 pauses every
+    caller until Retry-After has passed and doubles the spacing between
+    requests; successes shrink the spacing again, so throughput settles just
+    under the server's limit.
+    """
+
+    def __init__(self, min_interval: float = 0.0, max_interval: float = 10.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._next_slot = 0.0
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller may send its next request"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def throttled(self, retry_after: Optional[float] = None):
+        """Record a 429 response and push back every pending request"""
+        with self._lock:
+            now = time.monotonic()
+            # Requests already in flight when the first 429 arrived will also be
+            # rejected; only back off once per pause
+            if now >= self._resume_at:
+                self.interval = min(self.max_interval, max(self.interval * 2, 0.05))
+            pause = retry_after if retry_after is not None else self.interval
+            self._next_slot = max(self._next_slot, now + pause)
+            self._resume_at = self._next_slot
+
+    def succeeded(self):
+        """Record a successful request and ease the spacing back down"""
+        with self._lock:
+            self.interval *= 0.9
+            if self.interval < max(self.min_interval, 0.001):
+                self.interval = self.min_interval
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header as seconds (accepts delta-seconds or an HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class JiraResponse:
+    """Result of a Jira REST call: HTTP status, headers and decoded body"""
+
+    def __init__(self, status: int, headers=None, body: bytes = b"", error: str = ""):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def header(self, name: str, default: str = None) -> Optional[str]:
+        return self.headers.get(name, default) if self.headers is not None else default
+
+    def json(self):
+        """Parsed JSON body, or an empty dict for empty/non-JSON bodies"""
+        try:
+            return json.loads(self.body) if self.body else {}
+        except ValueError:
+            return {}
+
+    def error_message(self) -> str:
+        """Human-readable error built from Jira's errorMessages/errors payload"""
+        if self.error:
+            return self.error
+        data = self.json()
+        messages = []
+        if isinstance(data, dict):
+            messages += data.get("errorMessages") or []
+            if isinstance(data.get("errors"), dict):
+                messages += [f"{field}: {message}" for field, message in data["errors"].items()]
+        if not messages and self.body:
+            messages.append(self.text.strip()[:200])
+        return f"HTTP {self.status}: " + ("; ".join(messages) or "no details")
+
+
+class JiraTransport:
+    """Pooled keep-alive HTTP client for the Jira REST API
+
+    Connections are kept open and reused across requests (and threads), responses
+    are gzip-compressed on the wire, and credentials travel in a header rather
+    than on a command line. With a RateLimiter attached, every request is paced
+    through it and 429 responses are retried after the server's Retry-After.
+    A request that fails on a pooled connection the server had closed is only
+    sent again when that is safe: for idempotent methods, or when it failed
+    before it was sent. A POST that may have reached Jira is reported instead,
+    so it can never create an issue twice.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+    def __init__(self, base_url: str, email: str, api_token: str,
+                 pool_size: int = 8, timeout: float = 30,
+                 limiter: RateLimiter = None, max_retries: int = 5):
+        url = urlsplit(base_url.rstrip("/"))
+        self.scheme = url.scheme or "https"
+        self.host = url.hostname
+        self.port = url.port
+        self.base_path = url.path
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+        token = base64.b64encode(f"{email}:{api_token}".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {token}",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "Content-Type": "application/json",
+            "User-Agent": "claude-skills-jira-toolkit",
+        }
+
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "http":
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout,
+                                           context=ssl.create_default_context())
+
+    @staticmethod
+    def _dropped(conn: http.client.HTTPConnection) -> bool:
+        """True if the server has closed an idle connection (it has nothing else to say)"""
+        if conn.sock is None:
+            return True
+        try:
+            return bool(select.select([conn.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _acquire(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if not self._dropped(conn):
+                return conn, True
+            conn.close()
+        return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPConnection):
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, path: str, payload=None, params: Dict = None) -> JiraResponse:
+        """Send a request and return a JiraResponse (status 0 on connection errors)"""
+        url = self.base_path + path
+        if params:
+            url += "?" + urlencode(params)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+
+        retries = 0
+        while True:
+            if self.limiter:
+                self.limiter.acquire()
+            conn, reused = self._acquire()
+            sent = False
+            try:
+                conn.request(method, url, body=body, headers=self.headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                # A pooled connection the server already closed: retry on a fresh one,
+                # unless a request that isn't safe to repeat may have reached Jira
+                if reused and isinstance(e, (http.client.RemoteDisconnected,
+                                             ConnectionResetError, BrokenPipeError)) \
+                        and (not sent or method in self.IDEMPOTENT_METHODS):
+                    continue
+                return JiraResponse(0, error=f"Connection error: {e}")
+
+            if response.getheader("Content-Encoding", "").lower() == "gzip":
+                data = gzip.decompress(data)
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+
+            if response.status == 429 and self.limiter and retries < self.max_retries:
+                retries += 1
+                self.limiter.throttled(parse_retry_after(response.getheader("Retry-After")))
+                continue
+            if self.limiter and response.status != 429:
+                self.limiter.succeeded()
+
+            return JiraResponse(response.status, response.msg, data)
+
+    def get(self, path: str, params: Dict = None) -> JiraResponse:
+        return self.request("GET", path, params=params)
+
+    def post(self, path: str, payload=None) -> JiraResponse:
+        return self.request("POST", path, payload)
+
+    def put(self, path: str, payload=None) -> JiraResponse:
+        return self.request("PUT", path, payload)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
 
 
 class JiraClient:
     """Interact with Jira API"""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, workers: int = 1):
         self.base_url = config["jira"]["instanceUrl"]
-        self.auth = f"{config['jira']['email']}:{config['jira']['apiToken']}"
+        self.workers = max(1, workers)
+        self.http = JiraTransport(self.base_url, config["jira"]["email"],
+                                  config["jira"]["apiToken"],
+                                  pool_size=max(8, self.workers), limiter=RateLimiter())
         self.project_key = config["jira"]["projectKey"]
 
-    def create_epic(self, summary: str, description: str = "", labels: List[str] = None,
-                   priority: str = "1", start_date: str = None, due_date: str = None) -> str:
-        """Create an Epic in Jira"""
+    def build_epic_fields(self, summary: str, description: str = "", labels: List[str] = None,
+                          priority: str = "1", start_date: str = None, due_date: str = None) -> Dict:
+        """Fields payload for a new Epic, start date included"""
 
         fields = {
             "project": {"key": self.project_key},
@@ -126,75 +575,232 @@ class JiraClient:
         if labels:
             fields["labels"] = labels
 
+        if start_date:
+            fields[START_DATE_FIELD] = start_date
+
         if due_date:
             fields["duedate"] = due_date
 
-        data = json.dumps({"fields": fields})
+        return fields
 
-        result = subprocess.run(
-            ["curl", "-s", "-u", self.auth, "-X", "POST",
-             "-H", "Content-Type: application/json",
-             "-d", data,
-             f"{self.base_url}/rest/api/3/issue"],
-            capture_output=True,
-            text=True
-        )
+    def create_epics_bulk(self, epics: List[Dict]) -> List[Tuple[str, str]]:
+        """Create epics through the bulk issue endpoint
+
+        Takes a list of fields payloads (see build_epic_fields) and returns one
+        (key, error) tuple per epic, in the same order as the input. Epics
+        rejected only because the start date field isn't on the create screen
+        are created again without it, and the date is set afterwards.
+        """
+        results = []
+        for start in range(0, len(epics), BULK_BATCH_SIZE):
+            results.extend(self._create_bulk_batch(epics[start:start + BULK_BATCH_SIZE]))
+
+        retry = [index for index, (epic_key, error) in enumerate(results)
+                 if not epic_key and START_DATE_FIELD in error and START_DATE_FIELD in epics[index]]
+        if retry:
+            without_start = [{name: value for name, value in epics[index].items() if name != START_DATE_FIELD}
+                             for index in retry]
+            for index, (epic_key, error) in zip(retry, self.create_epics_bulk(without_start)):
+                results[index] = (epic_key, error)
+                if epic_key:
+                    self.add_start_date(epic_key, epics[index][START_DATE_FIELD])
+        return results
 
-        response = json.loads(result.stdout)
-        return response.get("key", "")
+    def _create_bulk_batch(self, batch: List[Dict]) -> List[Tuple[str, str]]:
+        response = self.http.post("/rest/api/3/issue/bulk",
+                                  {"issueUpdates": [{"fields": fields} for fields in batch]})
 
-    def add_start_date(self, issue_key: str, start_date: str):
+        data = response.json()
+        # Element-level failures come back as a 400 with an errors list;
+        # anything else that isn't a 2xx failed the whole batch
+        if not isinstance(data, dict) or not (response.ok or isinstance(data.get("errors"), list)):
+            return [("", response.error_message())] * len(batch)
+
+        return self._map_bulk_response(data, len(batch))
+
+    @staticmethod
+    def _map_bulk_response(response: Dict, count: int) -> List[Tuple[str, str]]:
+        """Map a bulk create response back onto the submitted items
+
+        Jira lists created issues in submission order, skipping the failed
+        elements, which are reported separately by index.
+        """
+        errors = {}
+        element_failures = response.get("errors") if isinstance(response.get("errors"), list) else []
+        for error in element_failures:
+            index = error.get("failedElementNumber")
+            if index is None:
+                continue
+            element_errors = error.get("elementErrors", {})
+            messages = list(element_errors.get("errorMessages", []))
+            messages += [f"{field}: {message}"
+                         for field, message in element_errors.get("errors", {}).items()]
+            errors[index] = "; ".join(messages) or f"HTTP {error.get('status', '?')}"
+
+        if not response.get("issues") and not errors:
+            # Request-level failure (auth, malformed payload): every item failed
+            messages = list(response.get("errorMessages", []))
+            if isinstance(response.get("errors"), dict):
+                messages += [f"{field}: {message}"
+                             for field, message in response["errors"].items()]
+            error = "; ".join(messages) or "No issues returned by bulk create"
+            return [("", error)] * count
+
+        created = iter(response.get("issues", []))
+        results = []
+        for index in range(count):
+            if index in errors:
+                results.append(("", errors[index]))
+            else:
+                issue = next(created, None)
+                if issue:
+                    results.append((issue.get("key", ""), ""))
+                else:
+                    results.append(("", "Missing from bulk create response"))
+        return results
+
+    def search(self, jql: str, fields: List[str]) -> Tuple[List[Dict], str]:
+        """Run a JQL search, following pagination; returns (issues, error)"""
+        issues = []
+        page_token = None
+
+        while True:
+            payload = {"jql": jql, "fields": fields, "maxResults": 100}
+            if page_token:
+                payload["nextPageToken"] = page_token
+            response = self.http.post("/rest/api/3/search/jql", payload)
+            if not response.ok:
+                return issues, response.error_message()
+
+            data = response.json()
+            issues.extend(data.get("issues", []))
+            page_token = data.get("nextPageToken")
+            if not page_token or data.get("isLast", True):
+                return issues, ""
+
+    def find_stage_epics(self) -> Tuple[Dict[int, str], str]:
+        """Existing stage epics by their stage-NNN labels, with one search for the "stage" label
+
+        Returns ({stage_number: epic_key}, error). If several epics carry the
+        same stage label, the oldest one wins.
+        """
+        jql = f'project = "{self.project_key}" AND issuetype = Epic AND labels = stage ORDER BY created ASC'
+        issues, error = self.search(jql, ["labels"])
+        epics = {}
+        for issue in issues:
+            for label in issue.get("fields", {}).get("labels") or []:
+                match = re.fullmatch(r'stage-(\d+)', label)
+                if match:
+                    epics.setdefault(int(match.group(1)), issue["key"])
+        return epics, error
+
+    def add_start_date(self, issue_key: str, start_date: str) -> bool:
         """Add start date to an issue"""
-        data = json.dumps({"fields": {"customfield_10015": start_date}})
-
-        subprocess.run(
-            ["curl", "-s", "-u", self.auth, "-X", "PUT",
-             "-H", "Content-Type: application/json",
-             "-d", data,
-             f"{self.base_url}/rest/api/3/issue/{issue_key}"],
-            capture_output=True
-        )
+        response = self.http.put(f"/rest/api/3/issue/{issue_key}",
+                                 {"fields": {"customfield_10015": start_date}})
 
-    def create_dependency(self, blocker_key: str, blocked_key: str):
+        if not response.ok:
+            print(f"   Error setting start date on {issue_key}: {response.error_message()}")
+        return response.ok
+
+    def create_dependency(self, blocker_key: str, blocked_key: str) -> bool:
         """Create a 'blocks' dependency between two issues"""
-        data = json.dumps({
+        response = self.http.post("/rest/api/3/issueLink", {
             "type": {"name": "Blocks"},
             "inwardIssue": {"key": blocker_key},
             "outwardIssue": {"key": blocked_key}
         })
 
-        subprocess.run(
-            ["curl", "-s", "-u", self.auth, "-X", "POST",
-             "-H", "Content-Type: application/json",
-             "-d", data,
-             f"{self.base_url}/rest/api/3/issueLink"],
-            capture_output=True
-        )
+        if not response.ok:
+            print(f"   Error linking {blocker_key} -> {blocked_key}: {response.error_message()}")
+        return response.ok
 
+    def create_dependencies(self, links: List[Tuple[str, str]]) -> List[bool]:
+        """Create (blocker, blocked) links concurrently; Jira has no bulk endpoint for links
 
-class ImplementationPlanGenerator:
-    """Generate implementation plan from specification using Claude API"""
+        Up to `workers` links are in flight at once, paced by the transport's
+        rate limiter. Returns one result per link, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(lambda link: self.create_dependency(*link), links))
+
+
+class IssueMirror:
+    """Local SQLite mirror of Jira issues, shared by the Jira toolkit skills
+
+    The project creator records each epic it creates (as a partial row, without
+    status or links) so jira-story-creator.py can find the stage epics without
+    searching, and reads them back so a rerun skips stages whose epic Jira's
+    search doesn't list yet. The other skills keep the rows up to date with
+    incremental syncs.
+
+    The schema is shared with jira-update.py and jira-story-creator.py.
+    """
+
+    def __init__(self, path: str, site: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.site = site.rstrip("/")
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                site TEXT NOT NULL,
+                issue_key TEXT NOT NULL,
+                project_key TEXT NOT NULL,
+                issue_type TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT '',
+                summary TEXT NOT NULL DEFAULT '',
+                parent TEXT NOT NULL DEFAULT '',
+                labels TEXT NOT NULL DEFAULT '[]',
+                subtasks TEXT NOT NULL DEFAULT '[]',
+                links TEXT NOT NULL DEFAULT '[]',
+                updated TEXT NOT NULL DEFAULT '',
+                complete INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (site, issue_key)
+            );
+            CREATE INDEX IF NOT EXISTS issues_parent ON issues (site, parent);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                site TEXT PRIMARY KEY,
+                last_sync REAL NOT NULL
+            );
+        """)
+        # Rows written from now on are newer than this, so a new mirror starts synced
+        self.conn.execute("INSERT OR IGNORE INTO sync_state (site, last_sync) VALUES (?, ?)",
+                          (self.site, time.time()))
+        self.conn.commit()
+
+    def record_created(self, issue_key: str, issue_type: str, summary: str, labels: List[str]):
+        """Record an issue this run created (never replaces a row read from Jira)"""
+        self.conn.execute(
+            "INSERT OR IGNORE INTO issues (site, issue_key, project_key, issue_type, summary, labels) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (self.site, issue_key, issue_key.rsplit("-", 1)[0], issue_type, summary, json.dumps(labels))
+        )
+        self.conn.commit()
 
-    def __init__(self, spec_path: str, api_key: str = None):
-        self.spec_path = spec_path
-        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
-        if not self.api_key:
-            raise ValueError("ANTHROPIC_API_KEY not found in environment or config")
-        self.client = anthropic.Anthropic(api_key=self.api_key)
+    def stage_epics(self, project_key: str) -> Dict[int, str]:
+        """Mirrored epics by their stage-NNN labels; the oldest (lowest key) wins, as in Jira"""
+        rows = self.conn.execute(
+            "SELECT issue_key, labels FROM issues WHERE site = ? AND project_key = ? AND issue_type = 'Epic'",
+            (self.site, project_key)
+        ).fetchall()
+        epics = {}
+        for issue_key, labels in sorted(rows, key=lambda row: int(row[0].rsplit("-", 1)[1])):
+            for label in json.loads(labels):
+                match = re.fullmatch(r'stage-(\d+)', label)
+                if match:
+                    epics.setdefault(int(match.group(1)), issue_key)
+        return epics
 
-    def extract_text_from_docx(self) -> str:
-        """Extract full text from Word document"""
-        doc = Document(self.spec_path)
-        return "\n".join([p.text for p in doc.paragraphs])
+    def close(self):
+        self.conn.close()
 
-    def generate_plan(self) -> List[Dict]:
-        """Use Claude to generate implementation plan with stages"""
-        spec_text = self.extract_text_from_docx()
 
-        prompt = f"""Analyze this software specification and create a detailed implementation plan.
+# Prompt for ImplementationPlanGenerator; part of the plan cache key, so edits invalidate cached plans
+PLAN_PROMPT = """Analyze this software specification and create a detailed implementation plan.
 
 Specification:
-{spec_text[:50000]}  # Limit to avoid token issues
+{spec_text}  # Limit to avoid token issues
 
 CRITICAL REQUIREMENTS - You MUST explicitly identify and create separate stages for:
 
@@ -270,42 +876,482 @@ IMPORTANT GUIDELINES:
 - Do NOT create circular dependencies (if A blocks B, then B cannot block A)
 """
 
+
+# Prompt for one part of a spec too long for PLAN_PROMPT; the parts' stages are merged by merge_stages
+CHUNK_PROMPT = """This is part {part} of {parts} of a software specification. The other parts are being
+analyzed separately, and the stages from every part will be merged into one implementation plan.
+
+Specification (part {part} of {parts}):
+{spec_text}
+
+Create about {stage_count} implementation stages for the work described in THIS PART only.
+For each stage, provide:
+- Stage name (descriptive, specific title)
+- Brief description (what gets built and why)
+- Estimated timeline (in weeks)
+- List of specific tasks
+
+Format your response as JSON array:
+[
+  {{
+    "name": "Foundation & Authentication",
+    "description": "Set up infrastructure and user authentication",
+    "timeline": "Week 1-2",
+    "tasks": ["AWS setup", "PostgreSQL installation", "Cognito configuration"]
+  }},
+  ...
+]
+
+IMPORTANT GUIDELINES:
+- Give safety & compliance features (self-harm detection, crisis intervention, content moderation,
+  HIPAA) and AI/ML model development (voice, sentiment and emotion models, training pipelines)
+  their own stages - do NOT hide them inside generic stages
+- Use the same stage name for work that continues a stage from another part (e.g. "Testing & QA")
+- Order stages in the sequence they should be built
+"""
+
+
+def pack_sections(sections: List[List[str]], target: float, max_chars: int) -> List[List[str]]:
+    """Pack sections in order into parts of about target characters (see split_spec)
+
+    A part ends where that leaves the running total closest to a multiple of
+    the target, so rounding doesn't pile up into an extra part, and never
+    grows past max_chars.
+    """
+    def full(added: int) -> bool:
+        return size + added > max_chars or done + size + added / 2 > target * (len(parts) + 1)
+
+    parts, current, size, done = [], [], 0, 0
+    for section in sections:
+        section_size = sum(len(text) + 1 for text in section)
+        if current and full(section_size):
+            parts.append(current)
+            current, size, done = [], 0, done + size
+        for text in section:
+            # A heading always stays with the block after it
+            if current and current != section[:1] and full(len(text) + 1):
+                parts.append(current)
+                current, size, done = [], 0, done + size
+            current.append(text)
+            size += len(text) + 1
+    if current:
+        parts.append(current)
+    return parts
+
+
+def split_spec(blocks, max_chars: int = PLAN_CHUNK_CHARS) -> List[str]:
+    """Split spec blocks into parts of similar size, breaking at headings where possible
+
+    A section runs from one heading to the next. Sections are packed in order
+    into parts of about total / ceil(total / max_chars) characters, and a
+    section longer than that is broken between blocks. No part grows past
+    max_chars; when blocks too long to share a part force an extra one, the
+    parts are packed again around it.
+    """
+    sections = []
+    for kind, text in blocks:
+        if kind == "heading" or not sections:
+            sections.append([])
+        sections[-1].append(text)
+
+    total = sum(len(text) + 1 for section in sections for text in section)
+    count = max(1, -(-total // max_chars))
+    while True:
+        parts = pack_sections(sections, total / count, max_chars)
+        # Blocks that can't be split may force an extra part; rebalance around it
+        if len(parts) <= count:
+            break
+        count = len(parts)
+    return ["\n".join(part) for part in parts]
+
+
+def parse_stages(response_text: str) -> List[Dict]:
+    """The JSON array of stages in a Claude response (see StageStreamParser)"""
+    stages = StageStreamParser().feed(response_text)
+    if not stages:
+        raise ValueError("Could not extract JSON from Claude response")
+    return stages
+
+
+class StageStreamParser:
+    """Incremental parser for a streamed JSON array of stages
+
+    feed() takes the response text as it arrives and returns the stage
+    objects completed by it, so each stage can be used as soon as its
+    closing brace is written. Elements that aren't JSON objects are skipped,
+    and a bracketed aside before the plan ("Here is the plan [12 stages]:")
+    is passed over: scanning continues until an array with at least one
+    stage has closed (done). Text after it is ignored.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.done = False
+        self.in_string = False
+        self.escaped = False
+        self.found = 0  # stages read from the current array
+        self.pending = []  # characters of the element being read
+
+    def feed(self, text: str) -> List[Dict]:
+        stages = []
+        for ch in text:
+            if self.done:
+                break
+            if self.depth == 0:
+                if ch == "[":
+                    self.depth = 1
+                    self.found = 0
+                continue
+
+            if self.depth >= 2:
+                self.pending.append(ch)
+
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == "\\":
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '"':
+                # Strings only matter inside elements; quotes in a bracketed aside are prose
+                self.in_string = self.depth >= 2
+            elif ch in "[{":
+                self.depth += 1
+                if self.depth == 2:
+                    self.pending = [ch]
+            elif ch in "]}":
+                self.depth -= 1
+                if self.depth == 1:
+                    stage = self._element()
+                    if stage is not None:
+                        stages.append(stage)
+                        self.found += 1
+                elif self.depth == 0 and self.found:
+                    self.done = True
+        return stages
+
+    def _element(self) -> Optional[Dict]:
+        text, self.pending = "".join(self.pending), []
+        try:
+            element = json.loads(text)
+        except ValueError:
+            return None
+        return element if isinstance(element, dict) else None
+
+
+class BackgroundFeed:
+    """Run an iterator on a background thread and hand its items over through a queue
+
+    Lets the consumer work on each item (e.g. create an epic) while the
+    producer is still waiting for the next one; batches() hands over
+    everything that queued up meanwhile in one go. An exception raised by
+    the producer is re-raised in the consumer.
+    """
+
+    _DONE = object()
+
+    def __init__(self, items):
+        self.queue = queue.Queue()
+        self.error = None
+        self.thread = threading.Thread(target=self._produce, args=(items,), daemon=True)
+        self.thread.start()
+
+    def _produce(self, items):
+        try:
+            for item in items:
+                self.queue.put(item)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.queue.put(self._DONE)
+
+    def __iter__(self):
+        for batch in self.batches(1):
+            yield batch[0]
+
+    def batches(self, max_size: int):
+        """Yield lists of up to max_size items: waits for one, then takes whatever else is ready"""
+        finished = False
+        while not finished:
+            batch = []
+            item = self.queue.get()
+            while True:
+                if item is self._DONE:
+                    finished = True
+                    break
+                batch.append(item)
+                if len(batch) >= max_size:
+                    break
+                try:
+                    item = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            if batch:
+                yield batch
+        if self.error:
+            raise self.error
+
+
+def merge_stages(partial_plans: List[List[Dict]], max_stages: int = PLAN_MAX_STAGES) -> List[Dict]:
+    """Merge the stages planned for each part of a spec into one plan
+
+    Deterministic: stages keep spec order, stages with the same name (ignoring
+    case, punctuation and "&" vs "and") are combined where the last of them appears (work that spans parts is done
+    when its last part is), and while there are more than max_stages the
+    adjacent pair with the fewest tasks between them is combined. Stages are
+    numbered 1..N with the same simple dependencies PLAN_PROMPT asks for.
+    """
+    def text_key(text: str) -> str:
+        # Case, punctuation, spacing and "&" vs "and" don't make two names (or tasks) different
+        return " ".join(re.findall(r'[a-z0-9]+', text.lower().replace("&", " and ")))
+
+    def merge(into: Dict, stage: Dict):
+        for field in ("names", "tasks"):
+            keys = {text_key(text) for text in into[field]}
+            for text in stage[field]:
+                if text_key(text) not in keys:
+                    keys.add(text_key(text))
+                    into[field].append(text)
+        into["description"] = "\n".join(text for text in (into["description"], stage["description"]) if text)
+        if not into["timeline"]:
+            into["timeline"] = stage["timeline"]
+
+    stages, by_name = [], {}
+    for plan in partial_plans:
+        for stage in plan:
+            if not isinstance(stage, dict) or not str(stage.get("name", "")).strip():
+                continue
+            stage = {
+                "names": [str(stage["name"]).strip()],
+                "description": str(stage.get("description") or "").strip(),
+                "timeline": str(stage.get("timeline") or ""),
+                "tasks": [str(task) for task in stage.get("tasks") or []],
+            }
+            name_key = text_key(stage["names"][0])
+            if name_key in by_name:
+                merge(by_name[name_key], stage)
+                stages.remove(by_name[name_key])
+            else:
+                by_name[name_key] = stage
+            stages.append(by_name[name_key])
+
+    while len(stages) > max_stages:
+        i = min(range(len(stages) - 1), key=lambda i: len(stages[i]["tasks"]) + len(stages[i + 1]["tasks"]))
+        merge(stages[i], stages.pop(i + 1))
+
+    for number, stage in enumerate(stages, start=1):
+        stage["name"] = " & ".join(stage.pop("names"))
+        stage["number"] = number
+        stage["dependencies"] = [] if number == 1 else sorted({1, number - 1})
+    return stages
+
+
+class PlanCache:
+    """Generated plans on disk, keyed by a hash of everything that shapes the model's answer
+
+    The key covers the spec text, the prompt template and the model id, so
+    editing any of them misses the cache instead of returning a stale plan.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = PLAN_CACHE_ENTRIES):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(spec_text: str, prompt_template: str, model: str) -> str:
+        digest = hashlib.sha256()
+        for part in (model, prompt_template, spec_text):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        try:
+            with open(self.path(key), encoding="utf-8") as f:
+                stages = json.load(f)["stages"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if not self.valid(stages):
+            return None
+        os.utime(self.path(key))  # mark as recently used
+        return stages
+
+    @staticmethod
+    def valid(stages) -> bool:
+        """A usable plan: a non-empty list of stages, each with a name"""
+        return (isinstance(stages, list) and bool(stages) and
+                all(isinstance(stage, dict) and str(stage.get("name") or "").strip() for stage in stages))
+
+    def put(self, key: str, model: str, stages: List[Dict]) -> bool:
+        """Store a plan; empty or malformed plans are refused (returns False) so they are never reused"""
+        if not self.valid(stages):
+            return False
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path(key).with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"model": model, "created": datetime.now().isoformat(timespec="seconds"),
+                       "stages": stages}, f, indent=2)
+        os.replace(tmp_path, self.path(key))
+
+        entries = sorted(self.cache_dir.glob("*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+        for stale in entries[self.max_entries:]:
+            stale.unlink(missing_ok=True)
+        return True
+
+    def invalidate(self, key: str):
+        self.path(key).unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Remove every cached plan; returns how many were removed"""
+        removed = 0
+        if self.cache_dir.is_dir():
+            for entry in self.cache_dir.glob("*.json"):
+                entry.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+class ImplementationPlanGenerator:
+    """Generate implementation plan from specification using Claude API"""
+
+    MODEL = "claude-sonnet-4-5-20250929"
+
+    def __init__(self, document: SpecDocument, api_key: str = None,
+                 cache: PlanCache = None, refresh: bool = False, client=None):
+        self.document = document
+        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        if not (self.api_key or client):
+            raise ValueError("ANTHROPIC_API_KEY not found in environment or config")
+        # Anything with the SDK's messages.create(model=, max_tokens=, messages=) can stand in
+        self._client = client
+        self.cache = cache
+        self.refresh = refresh
+        self.from_cache = False
+
+    @property
+    def client(self):
+        """Claude client, created on first use so cached plans never import the SDK"""
+        if self._client is None:
+            try:
+                import anthropic
+            except ImportError:
+                print("ERROR: anthropic not installed. Run: pip install anthropic")
+                sys.exit(1)
+            self._client = anthropic.Anthropic(api_key=self.api_key)
+        return self._client
+
+    def ask(self, prompt: str, max_tokens: int) -> str:
         response = self.client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=16000,
+            model=self.MODEL,
+            max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}]
         )
+        return response.content[0].text
+
+    def ask_streamed(self, prompt: str, max_tokens: int):
+        """Yield the response text in pieces as Claude writes it"""
+        stream = self.client.messages.create(
+            model=self.MODEL,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True
+        )
+        for event in stream:
+            if event.type == "content_block_delta" and getattr(event.delta, "text", None):
+                yield event.delta.text
 
-        # Extract JSON from response
-        response_text = response.content[0].text
+    def generate_plan(self) -> List[Dict]:
+        """Use Claude to generate implementation plan with stages"""
+        return list(self.stream_plan())
 
-        # Find JSON array in response
-        json_match = re.search(r'\[[\s\S]*\]', response_text)
-        if json_match:
-            stages = json.loads(json_match.group(0))
-            return stages
+    def stream_plan(self):
+        """Yield the plan's stages, each as soon as Claude has finished writing it
+
+        Specs longer than PLAN_SINGLE_REQUEST_CHARS are split at headings and
+        the parts planned concurrently, then merged with merge_stages; their
+        stages are yielded once merged. Plans are served from the plan cache
+        when the spec, prompt and model are unchanged; refresh=True asks
+        Claude again and replaces the entry.
+        """
+        spec_text = self.document.text
+        split = len(spec_text) > PLAN_SINGLE_REQUEST_CHARS
+
+        key = PlanCache.key(spec_text, CHUNK_PROMPT if split else PLAN_PROMPT, self.MODEL)
+        if self.cache:
+            if self.refresh:
+                self.cache.invalidate(key)
+            else:
+                stages = self.cache.get(key)
+                if stages is not None:
+                    self.from_cache = True
+                    yield from stages
+                    return
+
+        if split:
+            stages = self.generate_split_plan()
+            if not PlanCache.valid(stages):
+                raise ValueError("Claude returned no usable stages for the spec")
+            yield from stages
         else:
-            raise ValueError("Could not extract JSON from Claude response")
+            stages = []
+            parser = StageStreamParser()
+            for text in self.ask_streamed(PLAN_PROMPT.format(spec_text=spec_text), 16000):
+                for stage in parser.feed(text):
+                    stages.append(stage)
+                    yield stage
+            if not (stages and parser.done):
+                raise ValueError("Could not extract JSON from Claude response")
+
+        # Only a complete plan gets here, and put() refuses one without usable stages
+        if self.cache:
+            self.cache.put(key, self.MODEL, stages)
+
+    def generate_split_plan(self) -> List[Dict]:
+        """Plan each part of a long spec concurrently and merge the results"""
+        parts = split_spec(self.document.blocks)
+        stage_count = max(2, -(-PLAN_MAX_STAGES // len(parts)) + 1)
+        prompts = [CHUNK_PROMPT.format(part=number, parts=len(parts), spec_text=text, stage_count=stage_count)
+                   for number, text in enumerate(parts, start=1)]
+        print(f"   Spec is {len(self.document.text):,} characters: planning {len(parts)} parts in parallel")
+
+        self.client  # create the client once, before the workers share it
+        with ThreadPoolExecutor(max_workers=min(PLAN_WORKERS, len(parts))) as pool:
+            partial_plans = list(pool.map(lambda prompt: parse_stages(self.ask(prompt, 8000)), prompts))
+        return merge_stages(partial_plans)
 
 
 class ProjectCreator:
     """Main orchestrator for creating Jira project from spec"""
 
-    def __init__(self, spec_path: str, config: Dict, options: Dict = None):
+    def __init__(self, spec_path: str, config: Dict, options: Dict = None,
+                 mirror: IssueMirror = None, document: SpecDocument = None, workers: int = 1):
         self.spec_path = spec_path
-        self.jira = JiraClient(config)
+        self.jira = JiraClient(config, workers=workers)
         self.config = config
         self.options = options or {}
+        self.mirror = mirror
         self.plan_generator = None
 
+        # Claude needs the whole text, so the AI path parses the spec once up front
+        # (or reuses its cached parse); the fallback parser streams it instead
+        self.document = document
+
         # Initialize plan generator if API key available
         if config.get("anthropic", {}).get("apiKey"):
+            if self.document is None:
+                self.document = SpecDocument.load(spec_path, self.options.get("spec_cache", CACHE_DIR / "specs"))
             self.plan_generator = ImplementationPlanGenerator(
-                spec_path,
-                config["anthropic"]["apiKey"]
+                self.document,
+                config["anthropic"]["apiKey"],
+                cache=self.options.get("plan_cache"),
+                refresh=self.options.get("refresh_plan", False)
             )
 
-    def calculate_dates(self, stage_number: int, total_stages: int) -> tuple:
+    def calculate_dates(self, stage_number: int) -> tuple:
         """Calculate start and due dates for a stage"""
         start_date_str = self.config["timeline"]["startDate"]
         start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
@@ -349,34 +1395,32 @@ class ProjectCreator:
 
         return dependencies
 
-    def create_project(self, dry_run: bool = False):
-        """Create the complete Jira project"""
-
-        print("=== Generating implementation plan from specification...")
-
-        if self.plan_generator:
-            # Use AI to generate plan
-            stages = self.plan_generator.generate_plan()
-            print(f"   AI generated {len(stages)} stages")
-        else:
-            # Fallback to parsing existing plan
-            print("   WARNING: No API key, falling back to spec parsing")
-            project_info = SpecParser(self.spec_path).extract_project_info()
-            stages = SpecParser(self.spec_path).extract_stages()
-            print(f"   Project: {project_info.get('name', 'Unknown')}")
-
-        print(f"   Total Stages: {len(stages)}")
-        print()
+    def find_existing_epics(self) -> Dict[int, str]:
+        """Stage epics already in Jira or the mirror, so a rerun doesn't create them again
 
-        if dry_run:
-            print("=== DRY RUN MODE - No changes will be made")
-            print()
-
-        created_epics = {}
-
-        print("=== Creating Epics...")
+        Jira's answer wins for a stage it knows; the mirror adds epics created
+        so recently that search may not list them yet.
+        """
+        existing = self.mirror.stage_epics(self.jira.project_key) if self.mirror else {}
+        found, error = self.jira.find_stage_epics()
+        if error:
+            print(f"   WARNING: Could not look up existing stage epics: {error}")
+        existing.update(found)
+        return existing
+
+    def create_stage_epics(self, stages: List[Dict], created_epics: Dict[int, str], dry_run: bool = False,
+                           existing: Dict[int, str] = None):
+        """Create (or preview) the epics for some stages in one bulk request, recording keys in created_epics
+
+        Stages with an epic in existing (see find_existing_epics) reuse it.
+        """
+        to_create = []
         for stage in stages:
             summary = f"STAGE-{stage['number']:03d}: {stage['name']}"
+            if existing and stage["number"] in existing:
+                created_epics[stage["number"]] = existing[stage["number"]]
+                print(f"   - Exists {existing[stage['number']]}: {summary}")
+                continue
 
             # Create labels
             labels = [
@@ -385,26 +1429,100 @@ class ProjectCreator:
             ]
 
             # Calculate dates
-            start_date, due_date = self.calculate_dates(stage["number"], len(stages))
+            start_date, due_date = self.calculate_dates(stage["number"])
 
             if dry_run:
                 print(f"   [DRY RUN] Would create: {summary}")
                 print(f"             Dates: {start_date} to {due_date}")
                 created_epics[stage["number"]] = f"AURA-{stage['number']}"
             else:
-                epic_key = self.jira.create_epic(
+                fields = self.jira.build_epic_fields(
                     summary=summary,
                     description=stage["description"][:500],
                     labels=labels,
+                    start_date=start_date,
                     due_date=due_date
                 )
+                to_create.append((stage, summary, labels, fields))
+
+        if not to_create:
+            return
+
+        results = self.jira.create_epics_bulk([fields for _, _, _, fields in to_create])
+        for (stage, summary, labels, _), (epic_key, error) in zip(to_create, results):
+            if epic_key:
+                created_epics[stage["number"]] = epic_key
+                if self.mirror:
+                    self.mirror.record_created(epic_key, "Epic", summary, labels)
+                print(f"   ✓ Created {epic_key}: {summary}")
+            else:
+                print(f"   Error creating epic: {error}")
+                print(f"   ✗ Failed to create: {summary}")
 
-                if epic_key:
-                    self.jira.add_start_date(epic_key, start_date)
-                    created_epics[stage["number"]] = epic_key
-                    print(f"   ✓ Created {epic_key}: {summary}")
-                else:
-                    print(f"   ✗ Failed to create: {summary}")
+    def create_project(self, dry_run: bool = False) -> bool:
+        """Create the complete Jira project; False if the plan could not be completed
+
+        Stages whose stage-NNN epic already exists are skipped, so rerunning
+        after a failure only creates what is missing.
+        """
+
+        print("=== Generating implementation plan from specification...")
+
+        created_epics = {}
+        existing = {} if dry_run else self.find_existing_epics()
+
+        if self.plan_generator:
+            # Use AI to generate plan, creating each stage's epic as soon as Claude has written it
+            if dry_run:
+                print()
+                print("=== DRY RUN MODE - No changes will be made")
+            print()
+            print("=== Creating Epics (as the plan streams in)...")
+
+            # Stages that arrive while a bulk request is out go together in the next one
+            stages = []
+            try:
+                for batch in BackgroundFeed(self.plan_generator.stream_plan()).batches(BULK_BATCH_SIZE):
+                    for stage in batch:
+                        stage.setdefault("number", len(stages) + 1)
+                        stages.append(stage)
+                    self.create_stage_epics(batch, created_epics, dry_run, existing)
+            except Exception as e:
+                # The plan broke off: report what exists; a rerun skips those stages
+                print()
+                print(f"[FAILED] Plan generation stopped after {len(stages)} stage(s): {e}")
+                if created_epics and not dry_run:
+                    print(f"   Stage epics in Jira: {', '.join(created_epics[number] for number in sorted(created_epics))}")
+                print("   Dependency links were skipped; rerun the same command to create the")
+                print("   remaining epics and link them all")
+                return False
+
+            print()
+            if self.plan_generator.from_cache:
+                print(f"   Reused cached AI plan with {len(stages)} stages (--refresh-plan to regenerate)")
+            else:
+                print(f"   AI generated {len(stages)} stages")
+            print(f"   Total Stages: {len(stages)}")
+        else:
+            # Fallback to parsing existing plan
+            print("   WARNING: No API key, falling back to spec parsing")
+            if self.document is not None:
+                spec_parser = SpecParser(self.document.blocks)
+            else:
+                spec_parser = SpecParser.from_docx(self.spec_path)
+            project_info = spec_parser.extract_project_info()
+            stages = spec_parser.extract_stages()
+            print(f"   Project: {project_info.get('name', 'Unknown')}")
+
+            print(f"   Total Stages: {len(stages)}")
+            print()
+
+            if dry_run:
+                print("=== DRY RUN MODE - No changes will be made")
+                print()
+
+            print("=== Creating Epics...")
+            self.create_stage_epics(stages, created_epics, dry_run, existing)
 
         print()
 
@@ -412,35 +1530,64 @@ class ProjectCreator:
             print("=== Creating Dependencies...")
             dependencies = self.infer_dependencies(stages)
 
+            links = []
             for blocked_num, blockers in dependencies.items():
                 blocked_key = created_epics.get(blocked_num)
                 for blocker_num in blockers:
                     blocker_key = created_epics.get(blocker_num)
                     if blocker_key and blocked_key:
-                        if dry_run:
-                            print(f"   [DRY RUN] {blocker_key} blocks {blocked_key}")
-                        else:
-                            self.jira.create_dependency(blocker_key, blocked_key)
-                            print(f"   ✓ {blocker_key} blocks {blocked_key}")
+                        links.append((blocker_key, blocked_key))
+
+            if dry_run:
+                for blocker_key, blocked_key in links:
+                    print(f"   [DRY RUN] {blocker_key} blocks {blocked_key}")
+            else:
+                for (blocker_key, blocked_key), ok in zip(links, self.jira.create_dependencies(links)):
+                    if ok:
+                        print(f"   ✓ {blocker_key} blocks {blocked_key}")
+                    else:
+                        print(f"   ✗ Failed: {blocker_key} blocks {blocked_key}")
 
         print()
         print("DONE Project creation complete!")
         print()
         print(f"=== View your project: {self.jira.base_url}/jira/software/projects/{self.jira.project_key}")
         print(f"=== View roadmap: {self.jira.base_url}/jira/software/c/projects/{self.jira.project_key}/roadmap")
+        return True
 
 
 def main():
     parser = argparse.ArgumentParser(description="Create Jira project from specification")
-    parser.add_argument("--spec", required=True, help="Path to specification document (.docx)")
-    parser.add_argument("--config", required=True, help="Path to config JSON file")
+    parser.add_argument("--spec", help="Path to specification document (.docx)")
+    parser.add_argument("--config", help="Path to config JSON file")
     parser.add_argument("--compress-timeline", type=int, help="Timeline compression factor (e.g., 7 for 1 week = 1 day)")
     parser.add_argument("--start-date", help="Project start date (YYYY-MM-DD or 'tomorrow')")
     parser.add_argument("--dry-run", action="store_true", help="Preview without creating")
     parser.add_argument("--output", help="Export summary to JSON file")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Number of dependency links sent to Jira at once (default: 4)")
+    parser.add_argument("--spec-cache", default=str(CACHE_DIR / "specs"),
+                        help="Directory of parsed specs for AI planning, reused while the spec file is unchanged")
+    parser.add_argument("--no-spec-cache", action="store_true", help="Always parse the spec document")
+    parser.add_argument("--plan-cache", default=str(CACHE_DIR / "plans"),
+                        help="Directory of AI-generated plans, reused while the spec, prompt and model are unchanged")
+    parser.add_argument("--no-plan-cache", action="store_true", help="Always ask Claude for a new plan")
+    parser.add_argument("--refresh-plan", action="store_true",
+                        help="Ask Claude for a new plan and replace the cached one")
+    parser.add_argument("--clear-plan-cache", action="store_true", help="Remove all cached plans and exit")
+    parser.add_argument("--mirror", default=str(CACHE_DIR / "issue-mirror.sqlite"),
+                        help="Local issue mirror shared with the other Jira skills; created epics are recorded there")
+    parser.add_argument("--no-mirror", action="store_true", help="Don't record created epics in the issue mirror")
 
     args = parser.parse_args()
 
+    if args.clear_plan_cache:
+        removed = PlanCache(args.plan_cache).clear()
+        print(f"Removed {removed} cached plan(s) from {args.plan_cache}")
+        return
+    if not (args.spec and args.config):
+        parser.error("--spec and --config are required")
+
     # Load config
     with open(args.config) as f:
         config_text = f.read()
@@ -460,8 +1607,21 @@ def main():
             config["timeline"]["startDate"] = args.start_date
 
     # Create project
-    creator = ProjectCreator(args.spec, config, config.get("options", {}))
-    creator.create_project(dry_run=args.dry_run)
+    mirror = None
+    if not args.dry_run and not args.no_mirror:
+        mirror = IssueMirror(args.mirror, config["jira"]["instanceUrl"])
+    options = dict(config.get("options", {}))
+    options["spec_cache"] = None if args.no_spec_cache else args.spec_cache
+    options["plan_cache"] = None if args.no_plan_cache else PlanCache(args.plan_cache)
+    options["refresh_plan"] = args.refresh_plan
+    creator = ProjectCreator(args.spec, config, options, mirror, workers=args.workers)
+    try:
+        completed = creator.create_project(dry_run=args.dry_run)
+    finally:
+        if mirror:
+            mirror.close()
+    if not completed:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
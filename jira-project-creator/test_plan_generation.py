@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Plan generation tests - split_spec, merge_stages and stream_plan against a fake Claude client
+Run with: python -m unittest jira-project-creator/test_plan_generation.py
+"""
+
+import contextlib
+import importlib.util
+import io
+import json
+import re
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+
+_spec = importlib.util.spec_from_file_location(
+    "jira_project_creator", Path(__file__).resolve().parent / "jira-project-creator.py")
+creator = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(creator)
+
+
+class FakeClient:
+    """Stands in for anthropic.Anthropic: answers messages.create from a reply function
+
+    reply(prompt) returns the response text. Streamed responses are sent as
+    content_block_delta events of a few characters each, like the SDK's.
+    """
+
+    def __init__(self, reply, piece: int = 7):
+        self.reply = reply
+        self.piece = piece
+        self.prompts = []
+        self._lock = threading.Lock()
+        self.messages = self
+
+    def create(self, model, max_tokens, messages, stream=False):
+        prompt = messages[0]["content"]
+        with self._lock:
+            self.prompts.append(prompt)
+        text = self.reply(prompt)
+        if not stream:
+            return SimpleNamespace(content=[SimpleNamespace(text=text)])
+        return [SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(text=text[i:i + self.piece]))
+                for i in range(0, len(text), self.piece)]
+
+
+def stage(name, *tasks):
+    return {"name": name, "description": f"Build {name}", "timeline": "1 week", "tasks": list(tasks)}
+
+
+def section_blocks(sections: int, paragraph_chars: int):
+    """Spec blocks: a heading per section followed by one long paragraph"""
+    blocks = []
+    for number in range(1, sections + 1):
+        blocks.append(("heading", f"Section {number}"))
+        blocks.append(("paragraph", f"Details for section {number}. " + "x" * paragraph_chars))
+    return blocks
+
+
+class SplitSpecTest(unittest.TestCase):
+
+    def test_parts_break_at_headings_and_keep_every_block(self):
+        blocks = section_blocks(12, 5000)
+        parts = creator.split_spec(blocks, max_chars=20000)
+
+        self.assertEqual(len(parts), 4)
+        self.assertTrue(all(part.startswith("Section ") for part in parts))
+        self.assertEqual("\n".join(parts), "\n".join(text for _, text in blocks))
+        sizes = [len(part) for part in parts]
+        self.assertLessEqual(max(sizes) - min(sizes), 5100)
+
+    def test_long_text_without_headings_is_still_split(self):
+        blocks = [("paragraph", "y" * 1000) for _ in range(60)]
+        parts = creator.split_spec(blocks, max_chars=20000)
+
+        self.assertEqual(len(parts), 4)
+        self.assertTrue(all(len(part) <= 20000 for part in parts))
+
+
+class MergeStagesTest(unittest.TestCase):
+
+    def test_same_stage_in_two_parts_is_merged_once(self):
+        merged = creator.merge_stages([
+            [stage("Backend API", "Create endpoints"), stage("Testing & QA", "Write unit tests")],
+            [stage("Frontend UI", "Build screens"), stage("testing & qa", "write unit tests.", "Load tests")],
+        ])
+
+        self.assertEqual([s["name"] for s in merged], ["Backend API", "Frontend UI", "Testing & QA"])
+        self.assertEqual(merged[2]["tasks"], ["Write unit tests", "Load tests"])
+        self.assertEqual([s["number"] for s in merged], [1, 2, 3])
+        self.assertEqual([s["dependencies"] for s in merged], [[], [1], [1, 2]])
+
+    def test_stage_limit_combines_the_smallest_neighbours(self):
+        merged = creator.merge_stages([[stage("A", "a1", "a2", "a3"), stage("B", "b1"),
+                                        stage("b", "b2"), stage("C", "c1"), stage("D", "d1", "d2")]],
+                                      max_stages=3)
+
+        self.assertEqual([s["name"] for s in merged], ["A", "B & C", "D"])
+        self.assertEqual(merged[1]["tasks"], ["b1", "b2", "c1"])
+
+    def test_elements_without_a_name_are_dropped(self):
+        merged = creator.merge_stages([[stage("A", "a1"), {"name": " "}, "12 stages", None]])
+        self.assertEqual([s["name"] for s in merged], ["A"])
+
+
+class StreamPlanTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = creator.PlanCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def generator(self, blocks, client):
+        return creator.ImplementationPlanGenerator(creator.SpecDocument(blocks), cache=self.cache, client=client)
+
+    def test_streamed_plan_skips_preamble_and_is_cached(self):
+        plan = [stage("Setup", "Create repo"), stage("Build", "Write code")]
+        reply = "Here is the plan [2 stages]:\n```json\n" + json.dumps(plan) + "\n```\nDone."
+        blocks = [("heading", "Overview"), ("paragraph", "A small project.")]
+
+        client = FakeClient(lambda prompt: reply)
+        stages = list(self.generator(blocks, client).stream_plan())
+        self.assertEqual([s["name"] for s in stages], ["Setup", "Build"])
+        self.assertEqual(len(client.prompts), 1)
+
+        cached_client = FakeClient(lambda prompt: self.fail("cached plan asked Claude again"))
+        generator = self.generator(blocks, cached_client)
+        self.assertEqual(list(generator.stream_plan()), stages)
+        self.assertTrue(generator.from_cache)
+
+    def test_reply_without_stages_raises_and_is_not_cached(self):
+        blocks = [("paragraph", "A small project.")]
+        client = FakeClient(lambda prompt: "Sorry, I need more detail [no stages].")
+
+        with self.assertRaises(ValueError):
+            list(self.generator(blocks, client).stream_plan())
+        self.assertEqual(list(Path(self.tmp.name).glob("*.json")), [])
+
+    def test_long_spec_is_planned_in_parts_and_merged(self):
+        blocks = section_blocks(12, 5000)
+
+        def reply(prompt):
+            sections = re.findall(r"^Section (\d+)$", prompt, re.MULTILINE)
+            stages = [stage(f"Section {number} work", f"Build section {number}") for number in sections]
+            # Every part plans some testing, spelled differently each time
+            stages.append(stage("Testing & QA" if sections[0] == "1" else "testing and QA",
+                                f"Test sections {sections[0]}-{sections[-1]}"))
+            return json.dumps(stages)
+
+        client = FakeClient(reply)
+        with contextlib.redirect_stdout(io.StringIO()):
+            stages = list(self.generator(blocks, client).stream_plan())
+
+        self.assertEqual(len(client.prompts), 4)
+        self.assertEqual([s["name"] for s in stages],
+                         [f"Section {number} work" for number in range(1, 13)] + ["Testing & QA"])
+        self.assertEqual(len(stages[-1]["tasks"]), 4)
+        self.assertEqual([s["number"] for s in stages], list(range(1, 14)))
+
+
+if __name__ == "__main__":
+    unittest.main()
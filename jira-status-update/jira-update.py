@@ -7,37 +7,125 @@ Configure via environment variables:
   JIRA_BASE_URL - Your Jira instance URL (e.g., https://your-company.atlassian.net)
   JIRA_EMAIL - Your Jira email address
   JIRA_API_TOKEN - Your Jira API token (generate at https://id.atlassian.com/manage-profile/security/api-tokens)
+
+Run `python jira-update.py --serve` to keep a warm daemon on a Unix socket;
+later invocations forward their command to it and fall back to running
+in-process when it is not running.
 """
+import hashlib
 import json
-import sys
 import os
-import requests
-from requests.auth import HTTPBasicAuth
+import socket
+import sys
+
+# Unix socket of the optional warm daemon (python jira-update.py --serve)
+DAEMON_SOCKET = os.environ.get("JIRA_UPDATE_SOCKET") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "jira-toolkit", "jira-update.sock")
+
+def daemon_config():
+    """Jira settings from the environment, as compared between client and daemon (token hashed)"""
+    url = os.environ.get('JIRA_BASE_URL')
+    token = os.environ.get('JIRA_API_TOKEN')
+    return {
+        'url': url.rstrip('/') if url else None,
+        'email': os.environ.get('JIRA_EMAIL'),
+        'token': hashlib.sha256(token.encode()).hexdigest() if token else None
+    }
 
-# Try to load .env file if python-dotenv is available
+def config_mismatch(client_config, served_config):
+    """Settings that differ between a client and the daemon; a missing value always counts"""
+    return [name for name, value in served_config.items()
+            if not value or client_config.get(name) != value]
+
+def forward_to_daemon(argv):
+    """Run a command on the warm daemon and relay its output
+
+    Returns the exit code, or None when no daemon is listening or it cannot
+    serve this command, so the caller runs it in-process instead.
+    """
+    if not hasattr(socket, "AF_UNIX") or "--serve" in argv or "--no-daemon" in argv:
+        return None
+    config = daemon_config()
+    if not all(config.values()):
+        return None  # incomplete settings: let the in-process run report them
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(DAEMON_SOCKET)
+    except OSError:
+        sock.close()
+        return None
+
+    request = {"argv": argv, "cwd": os.getcwd(), "config": config}
+    with sock, sock.makefile("rwb") as stream:
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        for line in stream:
+            message = json.loads(line)
+            if "out" in message:
+                sys.stdout.write(message["out"])
+                sys.stdout.flush()
+            elif "fallback" in message:
+                return None
+            elif "exit" in message:
+                return message["exit"]
+    print("\n[ERROR] Lost connection to the jira-update daemon")
+    return 1
+
+# Try to load .env file if python-dotenv is available (before forwarding, so the
+# daemon is compared against the same settings this process would use)
 try:
     from dotenv import load_dotenv
     load_dotenv()
 except ImportError:
     pass  # python-dotenv not installed, rely on environment variables
 
+# Thin client: when a daemon is running, hand the command over before paying
+# for the imports below
+if __name__ == "__main__":
+    _exit_code = forward_to_daemon(sys.argv[1:])
+    if _exit_code is not None:
+        sys.exit(_exit_code)
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import re
+import sqlite3
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+
+# httpx provides a native async client; without it requests runs on worker threads
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 # Load configuration from environment variables
 JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
 JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
 JIRA_TOKEN = os.environ.get('JIRA_API_TOKEN')
 
-# Validate configuration
-if not all([JIRA_BASE_URL, JIRA_EMAIL, JIRA_TOKEN]):
-    print("[ERROR] Missing required environment variables")
-    print("Please set the following environment variables:")
-    print("  JIRA_BASE_URL - Your Jira instance URL")
-    print("  JIRA_EMAIL - Your Jira email address")
-    print("  JIRA_API_TOKEN - Your Jira API token")
-    print("\nExample:")
-    print("  export JIRA_BASE_URL='https://your-company.atlassian.net'")
-    print("  export JIRA_EMAIL='your.email@company.com'")
-    print("  export JIRA_API_TOKEN='your-api-token'")
-    sys.exit(1)
+def require_config():
+    """Exit with instructions if the Jira environment variables are missing"""
+    if not all([JIRA_BASE_URL, JIRA_EMAIL, JIRA_TOKEN]):
+        print("[ERROR] Missing required environment variables")
+        print("Please set the following environment variables:")
+        print("  JIRA_BASE_URL - Your Jira instance URL")
+        print("  JIRA_EMAIL - Your Jira email address")
+        print("  JIRA_API_TOKEN - Your Jira API token")
+        print("\nExample:")
+        print("  export JIRA_BASE_URL='https://your-company.atlassian.net'")
+        print("  export JIRA_EMAIL='your.email@company.com'")
+        print("  export JIRA_API_TOKEN='your-api-token'")
+        sys.exit(1)
 
 # Status name to transition ID mapping
 STATUS_TRANSITIONS = {
@@ -47,15 +135,535 @@ STATUS_TRANSITIONS = {
     "Cancelled": 2
 }
 
-def get_issue_details(issue_key):
+# Jira requests in flight at once (and HTTP connections kept open)
+MAX_IN_FLIGHT = 8
+
+# Attempts per request when Jira answers 429 Too Many Requests
+MAX_RETRIES = 5
+
+# Local state shared by the Jira toolkit skills
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "jira-toolkit"
+
+# How long a cached workflow's transitions are trusted (seconds)
+TRANSITION_CACHE_TTL = 24 * 60 * 60
+
+# Fields needed to update a story and its test cases (plus what the issue mirror keeps)
+SNAPSHOT_FIELDS = ["summary", "status", "issuetype", "subtasks", "issuelinks", "parent", "labels", "updated"]
+
+# How long after a sync the issue mirror is trusted without asking Jira for changes (seconds)
+MIRROR_MAX_AGE = 60
+
+# Minutes added to each incremental mirror sync window to absorb clock skew
+MIRROR_SYNC_MARGIN = 2
+
+# Search paging: results per page, and keys per "key in (...)" query
+SEARCH_PAGE_SIZE = 100
+SEARCH_KEYS_PER_QUERY = 100
+
+# Jira rejects a whole "key in (...)" query when one of its keys is unknown,
+# naming each such key in an error message like this one
+UNKNOWN_KEY_ERROR = re.compile(r"(?:An issue with key|The issue key) '([^']+)'")
+
+# Commit message phrases that state what should happen to the issues they name.
+# Only a trigger word directly before a key (or a list of keys) counts, so a
+# key that is merely mentioned ("drop the cache for AURA-21") is left alone
+GIT_TRIGGERS = {
+    "fix": "Done", "fixes": "Done", "fixed": "Done",
+    "close": "Done", "closes": "Done", "closed": "Done",
+    "resolve": "Done", "resolves": "Done", "resolved": "Done",
+    "wip": "In Progress",
+}
+# Smart-commit style tags directly after a key: "AURA-21 #done"
+GIT_TAGS = {
+    "done": "Done", "close": "Done", "resolve": "Done",
+    "wip": "In Progress", "start": "In Progress", "progress": "In Progress",
+    "cancel": "Not Needed", "not-needed": "Not Needed",
+}
+
+ISSUE_KEY = r"[A-Z][A-Z0-9]+-[0-9]+"
+_TRIGGER_WORDS = "|".join(sorted(GIT_TRIGGERS, key=len, reverse=True))
+_TAG_WORDS = "|".join(sorted(GIT_TAGS, key=len, reverse=True))
+# "Fixes AURA-21, AURA-22 and AURA-23" / "wip: AURA-21"
+INTENT_BEFORE_KEYS = re.compile(
+    rf"(?i:\b({_TRIGGER_WORDS}))(?::\s*|\s+)({ISSUE_KEY}(?:(?:\s*,\s*|\s+and\s+){ISSUE_KEY})*)\b"
+)
+INTENT_AFTER_KEY = re.compile(rf"\b({ISSUE_KEY})\s+#(?i:({_TAG_WORDS}))(?![\w-])")
+# Reverts and merges restate other commits' messages rather than their own intent
+NO_INTENT_COMMIT = re.compile(r"^\s*(?:Revert|Merge)\b")
+
+class RateLimiter:
+    """Shared request pacing for one Jira site
+
+    Callers take a slot with reserve() and wait out the returned delay before
+    each request. A 429 pauses every caller until Retry-After has passed and
+    doubles the spacing between requests; successes shrink the spacing again,
+    so throughput settles just under the server's limit.
+    """
+
+    def __init__(self, min_interval=0.0, max_interval=10.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._next_slot = 0.0
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take the next request slot; returns the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        return slot - now
+
+    def throttled(self, retry_after=None):
+        """Record a 429 response and push back every pending request"""
+        with self._lock:
+            now = time.monotonic()
+            # Requests already in flight when the first 429 arrived will also be
+            # rejected; only back off once per pause
+            if now >= self._resume_at:
+                self.interval = min(self.max_interval, max(self.interval * 2, 0.05))
+            pause = retry_after if retry_after is not None else self.interval
+            self._next_slot = max(self._next_slot, now + pause)
+            self._resume_at = self._next_slot
+
+    def succeeded(self):
+        """Record a successful request and ease the spacing back down"""
+        with self._lock:
+            self.interval *= 0.9
+            if self.interval < max(self.min_interval, 0.001):
+                self.interval = self.min_interval
+
+def parse_retry_after(value):
+    """Retry-After header as seconds (accepts delta-seconds or an HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+class TransitionCache:
+    """Local cache of workflow transitions, per Jira site, project, issue type and status
+
+    Issues of the same type in the same status offer the same transitions, so
+    the name -> id map is fetched once per workflow step and reused across
+    issues and runs. Entries expire after TRANSITION_CACHE_TTL and are dropped
+    when Jira rejects one of their ids.
+    """
+
+    def __init__(self, path, ttl=TRANSITION_CACHE_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    @staticmethod
+    def workflow(issue):
+        """Cache key for an issue snapshot, subtask or test case dict"""
+        project_key = issue['key'].rsplit('-', 1)[0]
+        return f"{JIRA_BASE_URL.rstrip('/')}|{project_key}|{issue['type']}|{issue['status']}"
+
+    def get(self, workflow):
+        entry = self.data.get(workflow)
+        if entry and time.time() - entry['cached_at'] < self.ttl:
+            return entry['transitions']
+        return None
+
+    def put(self, workflow, transitions):
+        self.data[workflow] = {'transitions': transitions, 'cached_at': time.time()}
+        self.dirty = True
+
+    def forget(self, workflow):
+        if self.data.pop(workflow, None) is not None:
+            self.dirty = True
+
+    def clear(self):
+        self.data = {}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+class IssueMirror:
+    """Local SQLite mirror of Jira issues, shared by the Jira toolkit skills
+
+    Every issue read from Jira is written through, and an incremental
+    `updated >= -Nm` search over the mirrored projects brings all rows up to
+    date once the last sync is older than MIRROR_MAX_AGE. Issues read with
+    their subtasks and links are complete and can stand in for a Jira read
+    of their structure (statuses are re-read live before any transition);
+    issues only seen inside another issue's payload are partial.
+
+    The schema is shared with jira-story-creator.py and jira-project-creator.py.
+    """
+
+    def __init__(self, path, site, max_age=MIRROR_MAX_AGE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.site = site.rstrip('/')
+        self.max_age = max_age
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                site TEXT NOT NULL,
+                issue_key TEXT NOT NULL,
+                project_key TEXT NOT NULL,
+                issue_type TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT '',
+                summary TEXT NOT NULL DEFAULT '',
+                parent TEXT NOT NULL DEFAULT '',
+                labels TEXT NOT NULL DEFAULT '[]',
+                subtasks TEXT NOT NULL DEFAULT '[]',
+                links TEXT NOT NULL DEFAULT '[]',
+                updated TEXT NOT NULL DEFAULT '',
+                complete INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (site, issue_key)
+            );
+            CREATE INDEX IF NOT EXISTS issues_parent ON issues (site, parent);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                site TEXT PRIMARY KEY,
+                last_sync REAL NOT NULL
+            );
+        """)
+        # Rows written from now on are newer than this, so a new mirror starts synced
+        self.conn.execute("INSERT OR IGNORE INTO sync_state (site, last_sync) VALUES (?, ?)",
+                          (self.site, time.time()))
+        self.conn.commit()
+
+    def last_sync(self):
+        row = self.conn.execute("SELECT last_sync FROM sync_state WHERE site = ?", (self.site,)).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self):
+        last_sync = self.last_sync()
+        return last_sync is not None and time.time() - last_sync < self.max_age
+
+    def mark_synced(self, started):
+        """Record that every row is at least as new as `started` (a time.time() value)"""
+        self.conn.execute("INSERT OR REPLACE INTO sync_state (site, last_sync) VALUES (?, ?)",
+                          (self.site, started))
+        self.conn.commit()
+
+    def sync_jql(self):
+        """JQL for mirrored issues changed since the last sync, or None if there is nothing to sync"""
+        last_sync = self.last_sync()
+        projects = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT project_key FROM issues WHERE site = ? ORDER BY project_key", (self.site,))]
+        if last_sync is None or not projects:
+            return None
+        minutes = int((time.time() - last_sync) // 60) + MIRROR_SYNC_MARGIN
+        return f'project in ({", ".join(projects)}) AND updated >= "-{minutes}m"'
+
+    @staticmethod
+    def issue_rows(data):
+        """Rows for an issue payload and the subtasks and linked issues embedded in it"""
+        fields = data['fields']
+        complete = 'subtasks' in fields and 'issuelinks' in fields
+        linked = [link.get('outwardIssue') or link.get('inwardIssue') for link in fields.get('issuelinks') or []]
+        linked = [issue for issue in linked if issue]
+        rows = [{
+            'issue_key': data['key'],
+            'issue_type': fields['issuetype']['name'],
+            'status': fields['status']['name'],
+            'summary': fields.get('summary') or '',
+            'parent': (fields.get('parent') or {}).get('key', ''),
+            'labels': json.dumps(fields.get('labels') or []),
+            'subtasks': json.dumps([subtask['key'] for subtask in fields.get('subtasks') or []]),
+            'links': json.dumps([issue['key'] for issue in linked]),
+            'updated': fields.get('updated') or '',
+            'complete': int(complete),
+        }]
+        for embedded, parent in ([(subtask, data['key']) for subtask in fields.get('subtasks') or []] +
+                                 [(issue, '') for issue in linked]):
+            rows.append({
+                'issue_key': embedded['key'],
+                'issue_type': embedded['fields']['issuetype']['name'],
+                'status': embedded['fields']['status']['name'],
+                'summary': embedded['fields'].get('summary') or '',
+                'parent': parent,
+                'labels': '[]', 'subtasks': '[]', 'links': '[]', 'updated': '', 'complete': 0,
+            })
+        return rows
+
+    def store_issues(self, issues):
+        """Write raw issue payloads through to the mirror"""
+        self.store([row for data in issues for row in self.issue_rows(data)])
+
+    def store(self, rows):
+        # A row never replaces one that is more complete or more recently updated
+        self.conn.executemany("""
+            INSERT INTO issues (site, issue_key, project_key, issue_type, status, summary, parent,
+                                labels, subtasks, links, updated, complete)
+            VALUES (:site, :issue_key, :project_key, :issue_type, :status, :summary, :parent,
+                    :labels, :subtasks, :links, :updated, :complete)
+            ON CONFLICT (site, issue_key) DO UPDATE SET
+                project_key = excluded.project_key, issue_type = excluded.issue_type,
+                status = excluded.status, summary = excluded.summary, parent = excluded.parent,
+                labels = excluded.labels, subtasks = excluded.subtasks, links = excluded.links,
+                updated = excluded.updated, complete = excluded.complete
+            WHERE excluded.complete >= issues.complete AND excluded.updated >= issues.updated
+        """, [dict(row, site=self.site, project_key=row['issue_key'].rsplit('-', 1)[0]) for row in rows])
+        self.conn.commit()
+
+    def record_status(self, issue_key, status):
+        """Update the status of a mirrored issue after a transition or a status read"""
+        self.conn.execute("UPDATE issues SET status = ? WHERE site = ? AND issue_key = ?",
+                          (status, self.site, issue_key))
+        self.conn.commit()
+
+    def snapshot(self, issue_key):
+        """Story snapshot (as parse_issue_snapshot) from the mirror, or None if it isn't complete"""
+        row = self.conn.execute(
+            "SELECT summary, status, issue_type, subtasks, links FROM issues "
+            "WHERE site = ? AND issue_key = ? AND complete = 1",
+            (self.site, issue_key)
+        ).fetchone()
+        if not row:
+            return None
+        summary, status, issue_type, subtask_keys, linked_keys = row
+        subtask_keys, linked_keys = json.loads(subtask_keys), json.loads(linked_keys)
+
+        related = {}
+        for key in set(subtask_keys + linked_keys):
+            found = self.conn.execute(
+                "SELECT summary, status, issue_type FROM issues WHERE site = ? AND issue_key = ?",
+                (self.site, key)
+            ).fetchone()
+            if not found:
+                return None
+            related[key] = {'key': key, 'summary': found[0], 'status': found[1], 'type': found[2]}
+
+        return {
+            'key': issue_key,
+            'summary': summary,
+            'status': status,
+            'type': issue_type,
+            'subtasks': [dict(related[key]) for key in subtask_keys],
+            'test_cases': [dict(related[key]) for key in linked_keys
+                           if is_test_case(key, related[key]['type'])],
+            'transitions': None
+        }
+
+    def close(self):
+        self.conn.close()
+
+def open_session(pool_size=MAX_IN_FLIGHT):
+    """Authenticated keep-alive session with room for pool_size concurrent requests"""
+    session = requests.Session()
+    session.auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
+    session.headers["Content-Type"] = "application/json"
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+    session.mount("http://", HTTPAdapter(pool_maxsize=pool_size))
+    return session
+
+class JiraFatalError(Exception):
+    """Error that makes the rest of the run pointless (Jira unreachable, bad credentials)"""
+
+# Errors raised by the HTTP libraries when Jira cannot be reached at all
+TRANSPORT_ERRORS = (requests.RequestException,) + ((httpx.TransportError,) if httpx else ())
+
+class AsyncJiraClient:
+    """Pooled async Jira client shared by every task in a run
+
+    Uses httpx.AsyncClient when httpx is installed; otherwise requests runs on
+    worker threads through one keep-alive session. A semaphore bounds the
+    requests in flight, the rate limiter paces them and 429s are retried after
+    Retry-After. Connection failures and rejected credentials raise
+    JiraFatalError so the caller can cancel the rest of the run.
+
+    With an IssueMirror, the structure of snapshots (subtasks, linked test
+    cases) is served from it when it is fresh, statuses are always read live,
+    and everything read from Jira is written through to it.
+
+    Use as `async with AsyncJiraClient() as client:`.
+    """
+
+    def __init__(self, concurrency=MAX_IN_FLIGHT, limiter=None, mirror=None):
+        self.concurrency = concurrency
+        self.limiter = limiter or RateLimiter()
+        self.mirror = mirror
+        self._mirror_lock = None
+        self._client = None
+        self._session = None
+        self._executor = None
+        self._semaphore = None
+        self._workflow_locks = {}
+
+    async def __aenter__(self):
+        # Created here so they belong to the running event loop
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._mirror_lock = asyncio.Lock()
+        if httpx is not None:
+            self._client = httpx.AsyncClient(
+                auth=(JIRA_EMAIL, JIRA_TOKEN),
+                headers={"Content-Type": "application/json"},
+                limits=httpx.Limits(max_connections=self.concurrency,
+                                    max_keepalive_connections=self.concurrency),
+                timeout=30.0
+            )
+        else:
+            self._session = open_session(self.concurrency)
+            self._executor = ThreadPoolExecutor(max_workers=self.concurrency)
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._client is not None:
+            await self._client.aclose()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._session.close()
+
+    async def request(self, method, url, params=None, payload=None):
+        """Send a request; the response has status_code, headers, text and json()"""
+        body = json.dumps(payload) if payload is not None else None
+        async with self._semaphore:
+            for attempt in range(MAX_RETRIES + 1):
+                await asyncio.sleep(self.limiter.reserve())
+                try:
+                    response = await self._send(method, url, params, body)
+                except TRANSPORT_ERRORS as e:
+                    raise JiraFatalError(f"Cannot reach Jira: {e}")
+
+                if response.status_code == 401:
+                    raise JiraFatalError("Jira rejected the credentials (401); check JIRA_EMAIL and JIRA_API_TOKEN")
+                if response.status_code != 429:
+                    self.limiter.succeeded()
+                    return response
+                if attempt < MAX_RETRIES:
+                    self.limiter.throttled(parse_retry_after(response.headers.get("Retry-After")))
+            return response
+
+    async def _send(self, method, url, params, body):
+        if self._client is not None:
+            return await self._client.request(method, url, params=params, content=body)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(self._session.request, method, url, params=params, data=body)
+        )
+
+    async def mirror_ready(self):
+        """Bring the issue mirror up to date if needed; True if it can serve reads"""
+        if self.mirror is None:
+            return False
+        async with self._mirror_lock:
+            if self.mirror.is_fresh():
+                return True
+            started = time.time()
+            jql = self.mirror.sync_jql()
+            if jql:
+                issues, ok = await search_pages_async(self, jql, SNAPSHOT_FIELDS)
+                if not ok:
+                    return False
+                self.mirror.store_issues(issues)
+            self.mirror.mark_synced(started)
+            return True
+
+    def workflow_lock(self, workflow):
+        """Lock held while a workflow step's transitions are being fetched"""
+        if workflow not in self._workflow_locks:
+            self._workflow_locks[workflow] = asyncio.Lock()
+        return self._workflow_locks[workflow]
+
+async def cancel_all(tasks):
+    """Cancel tasks that are still running and wait for them to finish"""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+async def gather_or_cancel(coroutines):
+    """Run coroutines concurrently; if one fails, cancel the others and re-raise"""
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
+    try:
+        return await asyncio.gather(*tasks)
+    finally:
+        await cancel_all(tasks)
+
+def parse_subtasks(fields):
+    """Extract subtasks from an issue's fields"""
+    subtasks = []
+    if 'subtasks' in fields and fields['subtasks']:
+        for subtask in fields['subtasks']:
+            subtasks.append({
+                'key': subtask['key'],
+                'summary': subtask['fields']['summary'],
+                'status': subtask['fields']['status']['name'],
+                'type': subtask['fields']['issuetype']['name']
+            })
+    return subtasks
+
+def is_test_case(issue_key, issue_type):
+    """Whether a linked issue counts as a test case (you can adjust this logic)"""
+    return 'Test' in issue_type or issue_key.startswith('TC-')
+
+def parse_linked_test_cases(fields):
+    """Extract linked test cases from an issue's fields"""
+    test_cases = []
+    if 'issuelinks' in fields:
+        for link in fields['issuelinks']:
+            # Check both inward and outward links
+            linked_issue = None
+            if 'outwardIssue' in link:
+                linked_issue = link['outwardIssue']
+            elif 'inwardIssue' in link:
+                linked_issue = link['inwardIssue']
+
+            if linked_issue:
+                # Check if it's a test case
+                issue_type = linked_issue['fields']['issuetype']['name']
+                if is_test_case(linked_issue['key'], issue_type):
+                    test_cases.append({
+                        'key': linked_issue['key'],
+                        'summary': linked_issue['fields']['summary'],
+                        'status': linked_issue['fields']['status']['name'],
+                        'type': issue_type
+                    })
+    return test_cases
+
+def parse_issue_snapshot(data):
+    """Build a story snapshot (details, subtasks, linked test cases) from an issue payload"""
+    fields = data['fields']
+    snapshot = {
+        'key': data['key'],
+        'summary': fields['summary'],
+        'status': fields['status']['name'],
+        'type': fields['issuetype']['name'],
+        'subtasks': parse_subtasks(fields),
+        'test_cases': parse_linked_test_cases(fields),
+        'transitions': None
+    }
+    if 'transitions' in data:
+        snapshot['transitions'] = {t['name']: t['id'] for t in data['transitions']}
+    return snapshot
+
+async def get_issue_details_async(client, issue_key):
     """Get issue details from Jira"""
     url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}"
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
 
-    response = requests.get(url, auth=auth, headers={"Content-Type": "application/json"})
+    response = await client.request("GET", url)
 
     if response.status_code == 200:
         data = response.json()
+        if client.mirror is not None:
+            client.mirror.record_status(data['key'], data['fields']['status']['name'])
         return {
             'key': data['key'],
             'summary': data['fields']['summary'],
@@ -65,68 +673,239 @@ def get_issue_details(issue_key):
     else:
         return None
 
-def get_issue_subtasks(issue_key):
-    """Get all subtasks for an issue"""
+async def get_issue_snapshot_async(client, issue_key):
+    """Fetch a story's details, subtasks, linked test cases and transitions in one request"""
+    if await client.mirror_ready():
+        snapshot = client.mirror.snapshot(issue_key)
+        if snapshot:
+            snapshot = (await with_live_statuses_async(client, {issue_key: snapshot})).get(issue_key)
+            if snapshot:
+                return snapshot
+
     url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}"
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
 
-    # Request with fields parameter to get subtasks
-    params = {"fields": "subtasks"}
-    response = requests.get(url, auth=auth, headers={"Content-Type": "application/json"}, params=params)
+    params = {"fields": ",".join(SNAPSHOT_FIELDS), "expand": "transitions"}
+    response = await client.request("GET", url, params=params)
 
     if response.status_code == 200:
         data = response.json()
-        subtasks = []
-        if 'subtasks' in data['fields'] and data['fields']['subtasks']:
-            for subtask in data['fields']['subtasks']:
-                subtasks.append({
-                    'key': subtask['key'],
-                    'summary': subtask['fields']['summary'],
-                    'status': subtask['fields']['status']['name']
-                })
-        return subtasks
+        if client.mirror is not None:
+            client.mirror.store_issues([data])
+        return parse_issue_snapshot(data)
     else:
-        return []
+        return None
 
-def get_linked_test_cases(issue_key):
-    """Get all linked test cases (issues with 'tests' or 'is tested by' link)"""
-    url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}"
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
+async def get_issue_subtasks_async(client, issue_key):
+    """Get all subtasks for an issue"""
+    snapshot = await get_issue_snapshot_async(client, issue_key)
+    return snapshot['subtasks'] if snapshot else []
 
-    # Request with fields parameter to get issue links
-    params = {"fields": "issuelinks"}
-    response = requests.get(url, auth=auth, headers={"Content-Type": "application/json"}, params=params)
+async def get_linked_test_cases_async(client, issue_key):
+    """Get all linked test cases"""
+    snapshot = await get_issue_snapshot_async(client, issue_key)
+    return snapshot['test_cases'] if snapshot else []
+
+async def search_issues_async(client, jql, fields, expand=None):
+    """Run a JQL search, following pagination; returns raw issue payloads"""
+    issues, _ = await search_pages_async(client, jql, fields, expand)
+    return issues
+
+async def search_pages_async(client, jql, fields, expand=None, errors=None):
+    """Run a JQL search, following pagination; returns (issues, ok)
+
+    errors: optional list; when given, a failed search adds Jira's error
+    messages to it instead of printing them
+    """
+    url = f"{JIRA_BASE_URL}/rest/api/3/search/jql"
+
+    issues = []
+    next_page_token = None
+    while True:
+        payload = {"jql": jql, "fields": fields, "maxResults": SEARCH_PAGE_SIZE}
+        if expand:
+            payload["expand"] = expand
+        if next_page_token:
+            payload["nextPageToken"] = next_page_token
+
+        response = await client.request("POST", url, payload=payload)
+
+        if response.status_code != 200:
+            if errors is None:
+                print(f"[ERROR] Search failed: {response.status_code}")
+                print(response.text)
+            else:
+                try:
+                    errors.extend(response.json().get('errorMessages') or [response.text])
+                except ValueError:
+                    errors.append(response.text)
+            return issues, False
 
-    test_cases = []
-    if response.status_code == 200:
         data = response.json()
-        if 'issuelinks' in data['fields']:
-            for link in data['fields']['issuelinks']:
-                # Check both inward and outward links
-                linked_issue = None
-                if 'outwardIssue' in link:
-                    linked_issue = link['outwardIssue']
-                elif 'inwardIssue' in link:
-                    linked_issue = link['inwardIssue']
-
-                if linked_issue:
-                    # Check if it's a test case (you can adjust this logic)
-                    issue_type = linked_issue['fields']['issuetype']['name']
-                    if 'Test' in issue_type or linked_issue['key'].startswith('TC-'):
-                        test_cases.append({
-                            'key': linked_issue['key'],
-                            'summary': linked_issue['fields']['summary'],
-                            'status': linked_issue['fields']['status']['name']
-                        })
+        issues.extend(data.get('issues', []))
+        next_page_token = data.get('nextPageToken')
+        if not next_page_token or data.get('isLast', True):
+            return issues, True
 
-    return test_cases
+async def search_in_async(client, field, keys, fields, expand=None):
+    """Issues whose `field` is one of `keys`, via "field in (...)" searches run concurrently
 
-def get_transitions(issue_key):
+    Keys Jira reports as unknown are dropped from their query, which is run
+    again for the rest; like keys that match nothing, they are simply absent
+    from the result, and callers read those individually.
+    """
+    chunks = [keys[start:start + SEARCH_KEYS_PER_QUERY]
+              for start in range(0, len(keys), SEARCH_KEYS_PER_QUERY)]
+    pages = await gather_or_cancel(search_chunk_async(client, field, chunk, fields, expand)
+                                   for chunk in chunks)
+    return [data for page in pages for data in page]
+
+async def search_chunk_async(client, field, keys, fields, expand=None):
+    """One "field in (...)" search, retried without any keys Jira reports as unknown"""
+    while keys:
+        errors = []
+        issues, ok = await search_pages_async(client, f"{field} in ({', '.join(keys)})",
+                                              fields, expand, errors=errors)
+        if ok:
+            return issues
+        unknown = {match.group(1) for match in map(UNKNOWN_KEY_ERROR.search, errors) if match}
+        remaining = [key for key in keys if key not in unknown]
+        if len(remaining) == len(keys):
+            print(f"[ERROR] Search failed: {'; '.join(errors)}")
+            return issues
+        keys = remaining
+    return []
+
+async def fetch_issue_snapshots_async(client, keys=None, jql=None):
+    """Fetch story snapshots (as get_issue_snapshot) for many issues with paged searches
+
+    Returns a dict of key -> snapshot, ordered like `keys` (or by the JQL's order).
+    Keys that Jira did not return are left out.
+    """
+    snapshots = {}
+    if jql:
+        issues = await search_issues_async(client, jql, SNAPSHOT_FIELDS, expand="transitions")
+        if client.mirror is not None:
+            client.mirror.store_issues(issues)
+        for data in issues:
+            snapshots[data['key']] = parse_issue_snapshot(data)
+        return snapshots
+
+    # Issues complete in a fresh mirror only need their current statuses
+    found = {}
+    if await client.mirror_ready():
+        for key in keys:
+            snapshot = client.mirror.snapshot(key)
+            if snapshot:
+                found[key] = snapshot
+        if found:
+            found = await with_live_statuses_async(client, found)
+    missing = [key for key in keys if key not in found]
+    if missing:
+        found.update(await search_snapshots_in_async(client, "key", missing))
+    for key in keys:
+        if key in found:
+            snapshots[key] = found[key]
+    return snapshots
+
+async def with_live_statuses_async(client, snapshots):
+    """Mirrored snapshots with every status read again from Jira
+
+    The mirror only says which issues exist and how they relate; a status in
+    it can be MIRROR_MAX_AGE old, and deciding to skip a transition on it
+    would report work as done that never happened. So the stories, subtasks
+    and test cases are read back with one batched "key in (...)" search.
+    Stories Jira no longer returns are left out (the caller reads them in
+    full); subtasks and test cases it no longer returns are dropped.
+    """
+    keys = list(dict.fromkeys(
+        key for snapshot in snapshots.values()
+        for key in [snapshot['key']] + [tc['key'] for tc in snapshot['subtasks'] + snapshot['test_cases']]
+    ))
+    statuses = {}
+    for data in await search_in_async(client, "key", keys, ["status"]):
+        statuses[data['key']] = data['fields']['status']['name']
+        client.mirror.record_status(data['key'], statuses[data['key']])
+
+    live = {}
+    for key, snapshot in snapshots.items():
+        if snapshot['key'] not in statuses:
+            continue
+        live[key] = dict(
+            snapshot,
+            status=statuses[snapshot['key']],
+            subtasks=[dict(tc, status=statuses[tc['key']]) for tc in snapshot['subtasks'] if tc['key'] in statuses],
+            test_cases=[dict(tc, status=statuses[tc['key']]) for tc in snapshot['test_cases'] if tc['key'] in statuses]
+        )
+    return live
+
+async def search_snapshots_in_async(client, field, keys):
+    """Snapshots of the issues whose `field` is one of `keys`"""
+    issues = await search_in_async(client, field, keys, SNAPSHOT_FIELDS, expand="transitions")
+    if client.mirror is not None:
+        client.mirror.store_issues(issues)
+    found = {}
+    for data in issues:
+        found[data['key']] = parse_issue_snapshot(data)
+    return found
+
+async def verify_statuses_async(client, expected):
+    """Check that issues reached their expected status, reading them in batched searches
+
+    expected: dict of key -> expected status. Returns the keys that did not match.
+    """
+    if not expected:
+        return []
+    print(f"\n[VERIFYING] {len(expected)} issue(s)")
+
+    actual = {}
+    for data in await search_in_async(client, "key", list(expected), ["status"]):
+        actual[data['key']] = data['fields']['status']['name']
+        if client.mirror is not None:
+            client.mirror.record_status(data['key'], actual[data['key']])
+
+    mismatched = []
+    for key, status in expected.items():
+        if actual.get(key) != status:
+            print(f"  [MISMATCH] {key} is '{actual.get(key, 'not found')}', expected '{status}'")
+            mismatched.append(key)
+    if not mismatched:
+        print(f"[VERIFIED] All {len(expected)} issue(s) are in the expected status")
+    return mismatched
+
+async def walk_hierarchy_async(client, roots):
+    """Breadth-first levels of issues below the root snapshots
+
+    Each level holds the previous level's children (one batched "parent in (...)"
+    search per level) and the linked test cases found in its issue links.
+    Children are full snapshots; linked test cases carry key, summary, status
+    and type only.
+    """
+    levels = [list(roots)]
+    seen = {issue['key'] for issue in roots}
+    while True:
+        frontier = levels[-1]
+        children = await search_snapshots_in_async(client, "parent", [issue['key'] for issue in frontier])
+
+        next_level = []
+        for key, child in children.items():
+            if key not in seen:
+                seen.add(key)
+                next_level.append(child)
+        for issue in frontier:
+            for tc in issue.get('test_cases', []):
+                if tc['key'] not in seen:
+                    seen.add(tc['key'])
+                    next_level.append(tc)
+
+        if not next_level:
+            return levels
+        levels.append(next_level)
+
+async def get_transitions_async(client, issue_key):
     """Get available transitions for an issue"""
     url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/transitions"
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
 
-    response = requests.get(url, auth=auth, headers={"Content-Type": "application/json"})
+    response = await client.request("GET", url)
 
     if response.status_code == 200:
         data = response.json()
@@ -134,10 +913,30 @@ def get_transitions(issue_key):
     else:
         return {}
 
-def transition_issue(issue_key, status_name):
-    """Transition an issue to a new status"""
+async def transition_issue_async(client, issue_key, status_name, transitions=None, cache=None,
+                                 workflow=None, log=print):
+    """Transition an issue to a new status
+
+    transitions: optional name -> id map already known for the issue; fetched if omitted
+    cache, workflow: TransitionCache and the issue's workflow key, to reuse transitions
+    fetched for other issues in the same workflow step
+    log: where messages go (print, or a buffer when stories run concurrently)
+    """
     # Get available transitions
-    transitions = get_transitions(issue_key)
+    cached = False
+    if cache is not None and transitions is not None:
+        cache.put(workflow, transitions)
+    elif cache is not None:
+        # One fetch per workflow step, even with many test cases in flight
+        async with client.workflow_lock(workflow):
+            transitions = cache.get(workflow)
+            cached = transitions is not None
+            if transitions is None:
+                transitions = await get_transitions_async(client, issue_key)
+                if transitions:
+                    cache.put(workflow, transitions)
+    else:
+        transitions = await get_transitions_async(client, issue_key)
 
     # Map common status names to actual transition names
     status_mapping = {
@@ -149,15 +948,20 @@ def transition_issue(issue_key, status_name):
     # Try to find the transition
     transition_name = status_mapping.get(status_name, status_name)
 
+    if transition_name not in transitions and cached:
+        # The workflow may have changed since it was cached
+        cache.forget(workflow)
+        return await transition_issue_async(client, issue_key, status_name, cache=cache,
+                                            workflow=workflow, log=log)
+
     if transition_name not in transitions:
-        print(f"[ERROR] Status '{status_name}' not available for {issue_key}")
-        print(f"Available: {', '.join(transitions.keys())}")
+        log(f"[ERROR] Status '{status_name}' not available for {issue_key}")
+        log(f"Available: {', '.join(transitions.keys())}")
         return False
 
     transition_id = transitions[transition_name]
 
     url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/transitions"
-    auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_TOKEN)
 
     payload = {
         "transition": {
@@ -165,131 +969,604 @@ def transition_issue(issue_key, status_name):
         }
     }
 
-    response = requests.post(
-        url,
-        auth=auth,
-        headers={"Content-Type": "application/json"},
-        data=json.dumps(payload)
-    )
+    response = await client.request("POST", url, payload=payload)
 
     if response.status_code == 204:
+        if client.mirror is not None:
+            client.mirror.record_status(issue_key, status_name)
         return True
+    elif response.status_code == 400 and cached:
+        # Cached transition id rejected: refresh this workflow step and retry once
+        cache.forget(workflow)
+        return await transition_issue_async(client, issue_key, status_name, cache=cache,
+                                            workflow=workflow, log=log)
     else:
-        print(f"[ERROR] Error transitioning {issue_key}: {response.status_code}")
-        print(response.text)
+        log(f"[ERROR] Error transitioning {issue_key}: {response.status_code}")
+        log(response.text)
         return False
 
-def update_story(story_key, target_status):
-    """Update a story and all associated test cases"""
-    print(f"\n[UPDATING] {story_key} to {target_status}")
-    print("=" * 50)
+async def transition_all_async(client, issues, target_status, cache=None, log=print):
+    """Transition issues concurrently; returns one success flag per issue, in order"""
+    return await gather_or_cancel(
+        transition_issue_async(client, issue['key'], target_status, issue.get('transitions'),
+                               cache, TransitionCache.workflow(issue), log)
+        for issue in issues
+    )
+
+async def update_story_async(client, story_key, target_status, snapshot=None, cache=None,
+                             verify_later=None, log=print):
+    """Update a story and all associated test cases
+
+    snapshot: story data from get_issue_snapshot/fetch_issue_snapshots; fetched if omitted
+    cache: optional TransitionCache shared by the story and its test cases
+    verify_later: optional dict; when given, successful transitions are trusted and
+    recorded there as key -> expected status for verify_statuses() instead of
+    re-reading the story
+    log: where progress goes (print, or a buffer when stories run concurrently)
+    """
+    log(f"\n[UPDATING] {story_key} to {target_status}")
+    log("=" * 50)
 
-    # Get story details
-    details = get_issue_details(story_key)
+    # Get story details, test cases and transitions in one request
+    details = snapshot or await get_issue_snapshot_async(client, story_key)
     if not details:
-        print(f"[ERROR] Story {story_key} not found")
+        log(f"[ERROR] Story {story_key} not found")
         return False
 
-    print(f"\n[STORY DETAILS]")
-    print(f"  Key: {details['key']}")
-    print(f"  Summary: {details['summary']}")
-    print(f"  Current Status: {details['status']}")
-    print(f"  Type: {details['type']}")
+    log(f"\n[STORY DETAILS]")
+    log(f"  Key: {details['key']}")
+    log(f"  Summary: {details['summary']}")
+    log(f"  Current Status: {details['status']}")
+    log(f"  Type: {details['type']}")
 
     # Get all test cases (subtasks and linked issues)
-    print(f"\n[FINDING TEST CASES]")
-    subtasks = get_issue_subtasks(story_key)
-    linked_tests = get_linked_test_cases(story_key)
-
-    # Combine all test cases
-    all_test_cases = subtasks + linked_tests
+    log(f"\n[FINDING TEST CASES]")
+    all_test_cases = details['subtasks'] + details['test_cases']
 
     if all_test_cases:
-        print(f"  Found {len(all_test_cases)} test case(s):")
+        log(f"  Found {len(all_test_cases)} test case(s):")
         for tc in all_test_cases:
-            print(f"    - {tc['key']}: {tc['summary']} (Status: {tc['status']})")
+            log(f"    - {tc['key']}: {tc['summary']} (Status: {tc['status']})")
     else:
-        print(f"  No test cases found")
+        log(f"  No test cases found")
 
     # Update the story
     story_updated = False
     if details['status'] != target_status:
-        print(f"\n[TRANSITION STORY] {story_key}...")
-        success = transition_issue(story_key, target_status)
+        log(f"\n[TRANSITION STORY] {story_key}...")
+        success = await transition_issue_async(client, story_key, target_status, details['transitions'],
+                                               cache, TransitionCache.workflow(details), log)
 
         if success:
-            print(f"[SUCCESS] {story_key} -> {target_status}")
+            log(f"[SUCCESS] {story_key} -> {target_status}")
 
-            # Verify the update
-            new_details = get_issue_details(story_key)
-            if new_details and new_details['status'] == target_status:
-                print(f"[VERIFIED] Story status is now '{target_status}'")
+            if verify_later is not None:
+                # Optimistic: checked with every other issue in one search at the end
+                verify_later[story_key] = target_status
                 story_updated = True
+            else:
+                # Verify the update
+                new_details = await get_issue_details_async(client, story_key)
+                if new_details and new_details['status'] == target_status:
+                    log(f"[VERIFIED] Story status is now '{target_status}'")
+                    story_updated = True
         else:
-            print(f"[FAILED] Could not update story")
+            log(f"[FAILED] Could not update story")
             return False
     else:
-        print(f"\n[OK] Story already in '{target_status}' status")
+        log(f"\n[OK] Story already in '{target_status}' status")
         story_updated = True
 
     # Update all test cases
     test_case_results = {'success': [], 'failed': [], 'skipped': []}
 
     if all_test_cases:
-        print(f"\n[UPDATING TEST CASES]")
+        log(f"\n[UPDATING TEST CASES]")
+        pending = []
         for tc in all_test_cases:
             tc_key = tc['key']
             tc_status = tc['status']
 
             # Skip if already in target status
             if tc_status == target_status:
-                print(f"  [SKIP] {tc_key} already in '{target_status}'")
+                log(f"  [SKIP] {tc_key} already in '{target_status}'")
                 test_case_results['skipped'].append(tc_key)
                 continue
+            pending.append(tc)
 
-            # Try to transition
-            print(f"  [TRANSITION] {tc_key}...", end=" ")
-            success = transition_issue(tc_key, target_status)
-
+        # Transition concurrently; results are reported in test case order
+        results = await transition_all_async(client, pending, target_status, cache, log)
+        for tc, success in zip(pending, results):
             if success:
-                print(f"[OK]")
-                test_case_results['success'].append(tc_key)
+                log(f"  [TRANSITION] {tc['key']}... [OK]")
+                test_case_results['success'].append(tc['key'])
+                if verify_later is not None:
+                    verify_later[tc['key']] = target_status
             else:
-                print(f"[FAILED]")
-                test_case_results['failed'].append(tc_key)
+                log(f"  [TRANSITION] {tc['key']}... [FAILED]")
+                test_case_results['failed'].append(tc['key'])
 
     # Print summary
-    print(f"\n[SUMMARY]")
-    print(f"  Story: {'Updated' if story_updated else 'Failed'}")
+    log(f"\n[SUMMARY]")
+    log(f"  Story: {'Updated' if story_updated else 'Failed'}")
     if all_test_cases:
         total = len(all_test_cases)
         success_count = len(test_case_results['success'])
         failed_count = len(test_case_results['failed'])
         skipped_count = len(test_case_results['skipped'])
 
-        print(f"  Test Cases: {total} total")
+        log(f"  Test Cases: {total} total")
         if success_count > 0:
-            print(f"    - {success_count} updated: {', '.join(test_case_results['success'])}")
+            log(f"    - {success_count} updated: {', '.join(test_case_results['success'])}")
         if skipped_count > 0:
-            print(f"    - {skipped_count} skipped (already in status)")
+            log(f"    - {skipped_count} skipped (already in status)")
         if failed_count > 0:
-            print(f"    - {failed_count} failed: {', '.join(test_case_results['failed'])}")
+            log(f"    - {failed_count} failed: {', '.join(test_case_results['failed'])}")
 
     return story_updated and len(test_case_results['failed']) == 0
 
-def main():
-    """Main entry point"""
-    if len(sys.argv) < 3:
-        print("Usage: python jira-update.py <STORY-ID> <STATUS>")
+async def update_stories_async(client, story_keys, target_status, jql=None, cache=None,
+                               verify_later=None, snapshots=None):
+    """Update many stories concurrently, reading all of them up front with paged searches
+
+    Each story's output is buffered and printed in story order as soon as it
+    and the stories before it are done. Pass snapshots (from
+    fetch_issue_snapshots) to skip the read. Returns (updated_keys, failed_keys).
+    """
+    if snapshots is None:
+        print(f"\n[FETCHING] {'JQL: ' + jql if jql else str(len(story_keys)) + ' stories'}")
+        snapshots = await fetch_issue_snapshots_async(client, keys=story_keys, jql=jql)
+    if jql:
+        story_keys = list(snapshots)
+        print(f"  Found {len(story_keys)} issue(s)")
+
+    async def run(story_key):
+        lines = []
+        # Jira rejects a whole "key in (...)" query if any key is unknown, so
+        # anything the search didn't return is read individually instead
+        success = await update_story_async(client, story_key, target_status, snapshots.get(story_key),
+                                           cache, verify_later, log=lines.append)
+        return success, lines
+
+    updated, failed = [], []
+    tasks = [asyncio.ensure_future(run(story_key)) for story_key in story_keys]
+    try:
+        for story_key, task in zip(story_keys, tasks):
+            success, lines = await task
+            print("\n".join(lines))
+            if success:
+                updated.append(story_key)
+            else:
+                failed.append(story_key)
+    finally:
+        await cancel_all(tasks)
+
+    return updated, failed
+
+async def cascade_update_async(client, root_keys, target_status, jql=None, cache=None):
+    """Update epics (or any issues) and everything below them, level by level
+
+    The hierarchy is read breadth-first with batched searches, then each level
+    is transitioned concurrently, deepest level first so parents are closed
+    after their children. Returns (updated_keys, failed_keys).
+    """
+    print(f"\n[CASCADE] {'JQL: ' + jql if jql else ', '.join(root_keys)} to {target_status}")
+    print("=" * 50)
+
+    roots = await fetch_issue_snapshots_async(client, keys=root_keys, jql=jql)
+    failed = [key for key in root_keys if key not in roots] if not jql else []
+    for key in failed:
+        print(f"[ERROR] Issue {key} not found")
+
+    levels = await walk_hierarchy_async(client, list(roots.values()))
+    print(f"\n[HIERARCHY]")
+    for depth, level in enumerate(levels):
+        types = sorted({issue['type'] for issue in level})
+        print(f"  Level {depth}: {len(level)} issue(s) ({', '.join(types)})")
+
+    updated, skipped = [], []
+    for depth in range(len(levels) - 1, -1, -1):
+        level = levels[depth]
+        pending = [issue for issue in level if issue['status'] != target_status]
+        skipped += [issue['key'] for issue in level if issue['status'] == target_status]
+
+        print(f"\n[LEVEL {depth}] {len(pending)} to transition, "
+              f"{len(level) - len(pending)} already in '{target_status}'")
+        results = await transition_all_async(client, pending, target_status, cache)
+        for issue, success in zip(pending, results):
+            if success:
+                print(f"  [TRANSITION] {issue['key']}... [OK]")
+                updated.append(issue['key'])
+            else:
+                print(f"  [TRANSITION] {issue['key']}... [FAILED]")
+                failed.append(issue['key'])
+
+    # Transitions were trusted; confirm them all in one pass
+    mismatched = await verify_statuses_async(client, {key: target_status for key in updated})
+    updated = [key for key in updated if key not in mismatched]
+    failed += mismatched
+
+    print(f"\n[SUMMARY]")
+    print(f"  Issues: {sum(len(level) for level in levels)} total")
+    if updated:
+        print(f"    - {len(updated)} updated")
+    if skipped:
+        print(f"    - {len(skipped)} skipped (already in status)")
+    if failed:
+        print(f"    - {len(failed)} failed: {', '.join(failed)}")
+
+    return updated, failed
+
+def read_git_intents(revision_range, repo="."):
+    """Scan a git revision range once for issue keys and the status each commit asks for
+
+    Commits are read oldest first, so the last intent for an issue wins.
+    Keys without a trigger word or tag next to them are ignored, as are merge
+    and revert commits. Returns (commit_count, {key: status}) or raises
+    RuntimeError if git fails.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "log", "--reverse", "--no-merges", "--format=%B%x00", revision_range, "--"],
+            cwd=repo, capture_output=True, text=True
+        )
+    except OSError as e:
+        raise RuntimeError(f"Cannot run git: {e}")
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git log {revision_range} failed")
+
+    messages = [message for message in result.stdout.split("\0") if message.strip()]
+    intents = {}
+    for message in messages:
+        if NO_INTENT_COMMIT.match(message):
+            continue
+        # Both spellings may appear in one message; apply them in the order written
+        found = []
+        for match in INTENT_BEFORE_KEYS.finditer(message):
+            for key in re.findall(ISSUE_KEY, match.group(2)):
+                found.append((match.start(), key, GIT_TRIGGERS[match.group(1).lower()]))
+        for match in INTENT_AFTER_KEY.finditer(message):
+            found.append((match.start(), match.group(1), GIT_TAGS[match.group(2).lower()]))
+        for _, key, status in sorted(found):
+            # Re-insert so the dict stays ordered by each issue's latest intent
+            intents.pop(key, None)
+            intents[key] = status
+    return len(messages), intents
+
+async def git_sync_async(client, revision_range, repo=".", cache=None, verify_later=None):
+    """Apply the final status intent of every issue named in a git revision range
+
+    All issues are read with one batch of searches, then each target status is
+    applied with update_stories. Returns (updated_keys, failed_keys).
+    """
+    print(f"\n[GIT] Scanning {revision_range}")
+    print("=" * 50)
+    commit_count, intents = read_git_intents(revision_range, repo)
+    print(f"  {commit_count} commit(s), {len(intents)} issue(s) with a status intent")
+
+    by_status = {}
+    for key, status in intents.items():
+        by_status.setdefault(status, []).append(key)
+    for status, keys in by_status.items():
+        print(f"    - {status}: {', '.join(keys)}")
+    if not intents:
+        return [], []
+
+    print(f"\n[FETCHING] {len(intents)} stories")
+    snapshots = await fetch_issue_snapshots_async(client, keys=list(intents))
+    # A test case named in a commit follows its own intent, not its story's
+    for key, snapshot in snapshots.items():
+        snapshots[key] = dict(
+            snapshot,
+            subtasks=[tc for tc in snapshot['subtasks'] if tc['key'] not in intents],
+            test_cases=[tc for tc in snapshot['test_cases'] if tc['key'] not in intents]
+        )
+
+    updated, failed = [], []
+    for status, keys in by_status.items():
+        status_updated, status_failed = await update_stories_async(
+            client, keys, status, cache=cache, verify_later=verify_later,
+            snapshots={key: snapshots[key] for key in keys if key in snapshots}
+        )
+        updated += status_updated
+        failed += status_failed
+    return updated, failed
+
+# Synchronous wrappers: each call runs its async counterpart with a client of its own
+
+def run_sync(func, *args, workers=MAX_IN_FLIGHT, mirror=None, **kwargs):
+    """Run an async function taking a client as its first argument to completion"""
+    async def runner():
+        async with AsyncJiraClient(workers, mirror=mirror) as client:
+            return await func(client, *args, **kwargs)
+    return asyncio.run(runner())
+
+def get_issue_details(issue_key):
+    """Get issue details from Jira"""
+    return run_sync(get_issue_details_async, issue_key)
+
+def get_issue_snapshot(issue_key):
+    """Fetch a story's details, subtasks, linked test cases and transitions in one request"""
+    return run_sync(get_issue_snapshot_async, issue_key)
+
+def get_issue_subtasks(issue_key):
+    """Get all subtasks for an issue"""
+    return run_sync(get_issue_subtasks_async, issue_key)
+
+def get_linked_test_cases(issue_key):
+    """Get all linked test cases"""
+    return run_sync(get_linked_test_cases_async, issue_key)
+
+def search_issues(jql, fields, expand=None):
+    """Run a JQL search, following pagination; returns raw issue payloads"""
+    return run_sync(search_issues_async, jql, fields, expand)
+
+def fetch_issue_snapshots(keys=None, jql=None):
+    """Fetch story snapshots for many issues with paged searches"""
+    return run_sync(fetch_issue_snapshots_async, keys, jql)
+
+def verify_statuses(expected):
+    """Check that issues reached their expected status; returns the keys that did not match"""
+    return run_sync(verify_statuses_async, expected)
+
+def get_transitions(issue_key):
+    """Get available transitions for an issue"""
+    return run_sync(get_transitions_async, issue_key)
+
+def transition_issue(issue_key, status_name, transitions=None, cache=None, workflow=None):
+    """Transition an issue to a new status"""
+    return run_sync(transition_issue_async, issue_key, status_name, transitions, cache, workflow)
+
+def update_story(story_key, target_status, snapshot=None, cache=None, workers=MAX_IN_FLIGHT,
+                 verify_later=None):
+    """Update a story and all associated test cases"""
+    return run_sync(update_story_async, story_key, target_status, snapshot, cache, verify_later,
+                    workers=workers)
+
+def update_stories(story_keys, target_status, jql=None, cache=None, workers=MAX_IN_FLIGHT,
+                   verify_later=None):
+    """Update many stories; returns (updated_keys, failed_keys)"""
+    return run_sync(update_stories_async, story_keys, target_status, jql, cache, verify_later,
+                    workers=workers)
+
+def cascade_update(root_keys, target_status, jql=None, cache=None, workers=MAX_IN_FLIGHT):
+    """Update epics and everything below them; returns (updated_keys, failed_keys)"""
+    return run_sync(cascade_update_async, root_keys, target_status, jql, cache, workers=workers)
+
+def git_sync(revision_range, repo=".", cache=None, workers=MAX_IN_FLIGHT, verify_later=None):
+    """Apply the status intents found in a git revision range; returns (updated_keys, failed_keys)"""
+    return run_sync(git_sync_async, revision_range, repo, cache, verify_later, workers=workers)
+
+async def run_command(client, args, story_keys, target_status, cache):
+    """Run the parsed command on a client; returns the exit code"""
+    if args.cascade:
+        updated, failed = await cascade_update_async(client, story_keys, target_status,
+                                                     jql=args.jql, cache=cache)
+        if failed:
+            print("\n[FAILED] Update Failed")
+            return 1
+        print("\n[COMPLETE] Update Complete!")
+        return 0
+
+    # Optimistic runs collect key -> expected status and verify them all at the end
+    verify_later = {} if args.optimistic else None
+
+    if len(story_keys) == 1 and not (args.jql or args.git):
+        # Update the story
+        success = await update_story_async(client, story_keys[0], target_status, cache=cache,
+                                           verify_later=verify_later)
+        if verify_later and await verify_statuses_async(client, verify_later):
+            success = False
+
+        if success:
+            print("\n" + "=" * 50)
+            print("[COMPLETE] Update Complete!")
+            print("=" * 50)
+            print(f"\nView in Jira: {JIRA_BASE_URL}/browse/{story_keys[0]}")
+            return 0
+        else:
+            print("\n[FAILED] Update Failed")
+            return 1
+
+    if args.git:
+        try:
+            updated, failed = await git_sync_async(client, args.git, args.repo, cache=cache,
+                                                   verify_later=verify_later)
+        except RuntimeError as e:
+            print(f"[ERROR] {e}")
+            print("\n[FAILED] Update Failed")
+            return 1
+    else:
+        updated, failed = await update_stories_async(client, story_keys, target_status, jql=args.jql,
+                                                     cache=cache, verify_later=verify_later)
+    total = len(updated) + len(failed)
+    mismatched = await verify_statuses_async(client, verify_later) if verify_later else []
+    updated = [key for key in updated if key not in mismatched]
+
+    print("\n" + "=" * 50)
+    print(f"[BATCH SUMMARY] {total} stories")
+    print("=" * 50)
+    if updated:
+        print(f"  - {len(updated)} updated: {', '.join(updated)}")
+    if mismatched:
+        print(f"  - {len(mismatched)} not verified: {', '.join(mismatched)}")
+    if failed or mismatched:
+        if failed:
+            print(f"  - {len(failed)} failed: {', '.join(failed)}")
+        print("\n[FAILED] Update Failed")
+        return 1
+    print("\n[COMPLETE] Update Complete!")
+    return 0
+
+class DaemonOutput:
+    """File-like object that sends a forwarded command's output back to its client"""
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def write(self, text):
+        if text:
+            self.writer.write(json.dumps({"out": text}).encode("utf-8") + b"\n")
+        return len(text)
+
+    def flush(self):
+        pass
+
+def claim_socket(path):
+    """Prepare the daemon socket path; returns False if a daemon is already listening there"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+            return False
+        except OSError:
+            # Left behind by a daemon that did not shut down cleanly
+            os.unlink(path)
+        finally:
+            probe.close()
+    return True
+
+def open_mirror(args, cwd="."):
+    """The issue mirror selected on the command line, or None with --no-mirror"""
+    if args.no_mirror:
+        return None
+    return IssueMirror(Path(cwd, args.mirror), JIRA_BASE_URL,
+                       max_age=0 if args.refresh_mirror else MIRROR_MAX_AGE)
+
+async def run_forwarded(client, request, cache):
+    """Run a command forwarded by a thin client; returns the exit code"""
+    try:
+        args, story_keys, target_status = parse_arguments(request['argv'])
+    except SystemExit as e:
+        # Usage errors and --help
+        return e.code if isinstance(e.code, int) else 1
+
+    # Paths on the command line are relative to the client, not the daemon
+    args.repo = str(Path(request['cwd'], args.repo))
+
+    # A cache file other than the daemon's own is loaded just for this command
+    path = Path(request['cwd'], args.transition_cache).resolve()
+    command_cache = cache if path == cache.path.resolve() else TransitionCache(path)
+    if args.refresh_transitions:
+        command_cache.clear()
+    client.mirror = open_mirror(args, request['cwd'])
+
+    try:
+        return await run_command(client, args, story_keys, target_status, command_cache)
+    except JiraFatalError as e:
+        print(f"\n[FATAL] {e}")
+        print("\n[FAILED] Update Failed")
+        return 1
+    finally:
+        command_cache.save()
+        if client.mirror is not None:
+            client.mirror.close()
+            client.mirror = None
+
+async def serve(socket_path, cache, workers):
+    """Daemon: run forwarded commands one at a time on a warm client and transition cache"""
+    config = daemon_config()
+    busy = asyncio.Lock()
+
+    async with AsyncJiraClient(workers) as client:
+        async def handle(reader, writer):
+            try:
+                request = json.loads(await reader.readline())
+                mismatched = config_mismatch(request['config'], config)
+                if mismatched:
+                    # The client is set up for another Jira site or account
+                    writer.write(json.dumps({"fallback": ", ".join(mismatched)}).encode("utf-8") + b"\n")
+                else:
+                    async with busy:
+                        output = DaemonOutput(writer)
+                        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+                            code = await run_forwarded(client, request, cache)
+                    writer.write(json.dumps({"exit": code}).encode("utf-8") + b"\n")
+                await writer.drain()
+            except (ValueError, KeyError, ConnectionError):
+                pass  # malformed request, or the client went away
+            finally:
+                writer.close()
+
+        # Only the current user may talk to the daemon
+        umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(handle, path=socket_path)
+        finally:
+            os.umask(umask)
+        print(f"[DAEMON] Listening on {socket_path} for {JIRA_BASE_URL}")
+        async with server:
+            await server.serve_forever()
+
+def parse_arguments(argv):
+    """Parse command line arguments; returns (args, story_keys, target_status)"""
+    parser = argparse.ArgumentParser(
+        description="Update Jira stories and their test cases to a new status",
+        usage="python jira-update.py <STORY-ID> [STORY-ID ...] <STATUS>\n"
+              "       python jira-update.py --jql <QUERY> <STATUS>\n"
+              "       python jira-update.py --cascade <EPIC-ID> <STATUS>\n"
+              "       python jira-update.py --git <REVISION-RANGE>\n"
+              "       python jira-update.py --serve"
+    )
+    parser.add_argument("args", nargs="*", metavar="STORY-ID/STATUS",
+                        help="One or more story keys followed by the target status")
+    parser.add_argument("--jql", help="Update every issue matched by this JQL query")
+    parser.add_argument("--git", metavar="REVISION-RANGE",
+                        help="Apply the status intents in this range's commit messages "
+                             "(e.g. 'Fixes AURA-21', 'wip AURA-22', 'AURA-23 #done')")
+    parser.add_argument("--repo", default=".",
+                        help="Git repository scanned by --git (default: current directory)")
+    parser.add_argument("--cascade", action="store_true",
+                        help="Also update every issue below the given ones (epic -> stories -> test cases)")
+    parser.add_argument("--optimistic", action="store_true",
+                        help="Trust successful transitions and verify every issue in one search at the end")
+    parser.add_argument("--workers", type=int, default=MAX_IN_FLIGHT,
+                        help="Jira requests in flight at once (default: %(default)s)")
+    parser.add_argument("--transition-cache", default=str(CACHE_DIR / "transitions.json"),
+                        help="Workflow transition cache file (default: %(default)s)")
+    parser.add_argument("--refresh-transitions", action="store_true",
+                        help="Ignore cached workflow transitions and fetch them again")
+    parser.add_argument("--mirror", default=str(CACHE_DIR / "issue-mirror.sqlite"),
+                        help="Local issue mirror shared with the other Jira skills (default: %(default)s)")
+    parser.add_argument("--refresh-mirror", action="store_true",
+                        help="Sync the issue mirror with Jira before reading from it, however recent the last sync")
+    parser.add_argument("--no-mirror", action="store_true",
+                        help="Read everything from Jira and leave the issue mirror untouched")
+    parser.add_argument("--serve", action="store_true",
+                        help=f"Run as a warm daemon on {DAEMON_SOCKET} (JIRA_UPDATE_SOCKET overrides)")
+    parser.add_argument("--no-daemon", action="store_true",
+                        help="Run in-process even if a daemon is listening")
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        return args, [], None
+
+    if args.git:
+        if args.args or args.jql or args.cascade:
+            parser.error("--git takes its issues and statuses from the commit messages")
+        return args, [], None
+
+    if args.jql and len(args.args) > 1:
+        parser.error("--jql selects the issues itself; give only the target status after it")
+
+    if len(args.args) < (1 if args.jql else 2):
+        print("Usage: python jira-update.py <STORY-ID> [STORY-ID ...] <STATUS>")
+        print("       python jira-update.py --jql <QUERY> <STATUS>")
+        print("       python jira-update.py --cascade <EPIC-ID> <STATUS>")
+        print("       python jira-update.py --git <REVISION-RANGE>")
         print("Example: python jira-update.py AURA-21 Done")
+        print("Example: python jira-update.py AURA-21 AURA-22 AURA-23 Done")
+        print("Example: python jira-update.py --cascade AURA-5 Done")
+        print("Example: python jira-update.py --git origin/main..HEAD")
         print("\nSupported statuses:")
         print("  - Done")
         print("  - In Progress")
         print("  - Not Needed")
         sys.exit(1)
 
-    story_key = sys.argv[1]
-    target_status = sys.argv[2]
+    story_keys = [key.upper() for key in args.args[:-1]]
+    target_status = args.args[-1]
 
     # Allow status shortcuts
     status_shortcuts = {
@@ -307,18 +1584,48 @@ def main():
 
     target_status = status_shortcuts.get(target_status.lower(), target_status)
 
-    # Update the story
-    success = update_story(story_key, target_status)
-
-    if success:
-        print("\n" + "=" * 50)
-        print("[COMPLETE] Update Complete!")
-        print("=" * 50)
-        print(f"\nView in Jira: {JIRA_BASE_URL}/browse/{story_key}")
-        sys.exit(0)
-    else:
+    return args, story_keys, target_status
+
+def main():
+    """Main entry point"""
+    args, story_keys, target_status = parse_arguments(sys.argv[1:])
+    require_config()
+    workers = max(1, args.workers)
+
+    cache = TransitionCache(args.transition_cache)
+    if args.refresh_transitions:
+        cache.clear()
+
+    if args.serve:
+        if not hasattr(socket, "AF_UNIX"):
+            print("[ERROR] The daemon needs Unix domain sockets, which this platform does not support")
+            sys.exit(1)
+        if not claim_socket(DAEMON_SOCKET):
+            print(f"[ERROR] A daemon is already listening on {DAEMON_SOCKET}")
+            sys.exit(1)
+        try:
+            asyncio.run(serve(DAEMON_SOCKET, cache, workers))
+        except KeyboardInterrupt:
+            print("\n[DAEMON] Stopped")
+        finally:
+            cache.save()
+            if os.path.exists(DAEMON_SOCKET):
+                os.unlink(DAEMON_SOCKET)
+        return
+
+    mirror = open_mirror(args)
+    try:
+        code = run_sync(run_command, args, story_keys, target_status, cache, workers=workers,
+                        mirror=mirror)
+    except JiraFatalError as e:
+        print(f"\n[FATAL] {e}")
         print("\n[FAILED] Update Failed")
-        sys.exit(1)
+        code = 1
+    finally:
+        cache.save()
+        if mirror is not None:
+            mirror.close()
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
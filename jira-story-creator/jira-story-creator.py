@@ -5,12 +5,56 @@ Generates stories with User Story, Acceptance Criteria, Implementation, and Test
 """
 
 import argparse
+import base64
+import gzip
+import hashlib
+import http.client
 import json
-import sys
-import subprocess
+import os
+import sqlite3
+import ssl
 import re
-from typing import List, Dict, Optional
+import select
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urlsplit
+
+# Jira accepts at most 50 issues per /rest/api/3/issue/bulk request
+BULK_BATCH_SIZE = 50
+
+# Local state (run ledger, caches) shared by the Jira skills
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "jira-toolkit"
+
+# Fields kept by the issue mirror; every search written through to it asks for all of them
+MIRROR_FIELDS = ["summary", "status", "issuetype", "subtasks", "issuelinks", "parent", "labels", "updated"]
+
+# How long after a sync the issue mirror is trusted without asking Jira for changes (seconds)
+MIRROR_MAX_AGE = 60
+
+# Minutes added to each incremental mirror sync window to absorb clock skew
+MIRROR_SYNC_MARGIN = 2
+
+# Keyword rules for TaskClassifier; override with a "classifier" section in the config.
+# Story types are checked in order (first match wins); every matching label is applied.
+DEFAULT_CLASSIFIER_RULES = {
+    "storyTypes": {
+        "infrastructure": ["install", "setup", "configure", "infrastructure", "aws", "nginx",
+                           "postgresql", "redis"],
+        "backend_api": ["endpoint", "api", "backend", "service", "controller"],
+        "frontend_ui": ["ui", "component", "page", "interface", "display", "form", "button"],
+    },
+    "labels": {
+        "backend": ["backend", "api"],
+        "frontend": ["frontend", "ui"],
+        "testing": ["test"],
+        "database": ["database", "table"],
+    },
+}
 
 
 class StoryTemplate:
@@ -57,28 +101,93 @@ class StoryTemplate:
         }
 
 
+class TaskClassifier:
+    """Classify tasks into a story type and labels in one tokenised pass
+
+    Keywords are compiled once into a token index that also covers common
+    inflections ("install" -> "installs", "installation"), so classifying a task
+    is one dictionary lookup per word. Matching is on whole words, so "ui" no
+    longer matches inside "build". Multi-word keywords ("user interface") work too.
+    """
+
+    TOKEN = re.compile(r'[a-z0-9]+')
+    SUFFIXES = ('s', 'es', 'ed', 'ing', 'ation', 'ations', 'er', 'ers')
+
+    def __init__(self, rules: Dict = None):
+        rules = rules or {}
+        story_types = rules.get("storyTypes", DEFAULT_CLASSIFIER_RULES["storyTypes"])
+        labels = rules.get("labels", DEFAULT_CLASSIFIER_RULES["labels"])
+
+        # Rule ids: story types first (lower id = higher priority), then labels
+        self.story_types = list(story_types)
+        self.labels = list(labels)
+        self._index = {}
+
+        keyword_lists = list(story_types.values()) + list(labels.values())
+        for rule_id, keywords in enumerate(keyword_lists):
+            for keyword in keywords:
+                words = tuple(self.TOKEN.findall(keyword.lower()))
+                if not words:
+                    continue
+                for form in self._inflections(words[0]):
+                    self._index.setdefault(form, []).append((words[1:], rule_id))
+
+    @classmethod
+    def _inflections(cls, word: str) -> set:
+        forms = {word}
+        for suffix in cls.SUFFIXES:
+            forms.add(word + suffix)
+            # configure -> configured, configuring, configuration
+            if word.endswith('e') and suffix[0] in 'aeiou':
+                forms.add(word[:-1] + suffix)
+        return forms
+
+    def classify(self, task: str) -> Tuple[str, List[str]]:
+        """Return (story_type, labels) for a task"""
+        tokens = self.TOKEN.findall(task.lower())
+        hits = set()
+
+        for position, token in enumerate(tokens):
+            for rest, rule_id in self._index.get(token, ()):
+                if not rest or tuple(tokens[position + 1:position + 1 + len(rest)]) == rest:
+                    hits.add(rule_id)
+
+        story_type = next((name for rule_id, name in enumerate(self.story_types)
+                           if rule_id in hits), 'generic')
+        offset = len(self.story_types)
+        labels = [name for rule_id, name in enumerate(self.labels, offset) if rule_id in hits]
+        return story_type, labels
+
+    def classify_plan(self, stages: List[Dict]) -> List[List[Tuple[str, List[str]]]]:
+        """Classify every task in a plan, returning results aligned with stage["tasks"]"""
+        seen = {}
+        results = []
+        for stage in stages:
+            stage_results = []
+            for task in stage["tasks"]:
+                if task not in seen:
+                    seen[task] = self.classify(task)
+                story_type, labels = seen[task]
+                stage_results.append((story_type, list(labels)))
+            results.append(stage_results)
+        return results
+
+
 class StoryGenerator:
     """Generate story content from task descriptions"""
 
-    def __init__(self):
+    def __init__(self, classifier: TaskClassifier = None):
         self.template = StoryTemplate()
+        self.classifier = classifier or TaskClassifier()
 
     def detect_story_type(self, task_name: str) -> str:
         """Detect what type of story this is"""
-        task_lower = task_name.lower()
-
-        if any(word in task_lower for word in ['install', 'setup', 'configure', 'infrastructure', 'aws', 'nginx', 'postgresql', 'redis']):
-            return 'infrastructure'
-        elif any(word in task_lower for word in ['endpoint', 'api', 'backend', 'service', 'controller']):
-            return 'backend_api'
-        elif any(word in task_lower for word in ['ui', 'component', 'page', 'interface', 'display', 'form', 'button']):
-            return 'frontend_ui'
-        else:
-            return 'generic'
+        return self.classifier.classify(task_name)[0]
 
-    def generate_story(self, task_name: str, epic_context: str) -> Dict[str, str]:
+    def generate_story(self, task_name: str, epic_context: str,
+                       story_type: str = None) -> Dict[str, str]:
         """Generate a complete story with all sections"""
-        story_type = self.detect_story_type(task_name)
+        story_type = story_type or self.detect_story_type(task_name)
 
         if story_type == 'infrastructure':
             return self.template.infrastructure(task_name, epic_context)
@@ -96,12 +205,253 @@ class StoryGenerator:
             return self.template.generic(task_name, 'developer', 'the system functions correctly')
 
 
+class RateLimiter:
+    """Shared request pacing for one Jira site
+
+    Callers take a slot with acquire() before each request. A 429 pauses every
+    caller until Retry-After has passed and doubles the spacing between
+    requests; successes shrink the spacing again, so throughput settles just
+    under the server's limit.
+    """
+
+    def __init__(self, min_interval: float = 0.0, max_interval: float = 10.0):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self._next_slot = 0.0
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the caller may send its next request"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    def throttled(self, retry_after: Optional[float] = None):
+        """Record a 429 response and push back every pending request"""
+        with self._lock:
+            now = time.monotonic()
+            # Requests already in flight when the first 429 arrived will also be
+            # rejected; only back off once per pause
+            if now >= self._resume_at:
+                self.interval = min(self.max_interval, max(self.interval * 2, 0.05))
+            pause = retry_after if retry_after is not None else self.interval
+            self._next_slot = max(self._next_slot, now + pause)
+            self._resume_at = self._next_slot
+
+    def succeeded(self):
+        """Record a successful request and ease the spacing back down"""
+        with self._lock:
+            self.interval *= 0.9
+            if self.interval < max(self.min_interval, 0.001):
+                self.interval = self.min_interval
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header as seconds (accepts delta-seconds or an HTTP date)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class JiraResponse:
+    """Result of a Jira REST call: HTTP status, headers and decoded body"""
+
+    def __init__(self, status: int, headers=None, body: bytes = b"", error: str = ""):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def header(self, name: str, default: str = None) -> Optional[str]:
+        return self.headers.get(name, default) if self.headers is not None else default
+
+    def json(self):
+        """Parsed JSON body, or an empty dict for empty/non-JSON bodies"""
+        try:
+            return json.loads(self.body) if self.body else {}
+        except ValueError:
+            return {}
+
+    def error_message(self) -> str:
+        """Human-readable error built from Jira's errorMessages/errors payload"""
+        if self.error:
+            return self.error
+        data = self.json()
+        messages = []
+        if isinstance(data, dict):
+            messages += data.get("errorMessages") or []
+            if isinstance(data.get("errors"), dict):
+                messages += [f"{field}: {message}" for field, message in data["errors"].items()]
+        if not messages and self.body:
+            messages.append(self.text.strip()[:200])
+        return f"HTTP {self.status}: " + ("; ".join(messages) or "no details")
+
+
+class JiraTransport:
+    """Pooled keep-alive HTTP client for the Jira REST API
+
+    Connections are kept open and reused across requests (and threads), responses
+    are gzip-compressed on the wire, and credentials travel in a header rather
+    than on a command line. With a RateLimiter attached, every request is paced
+    through it and 429 responses are retried after the server's Retry-After.
+    A request that fails on a pooled connection the server had closed is only
+    sent again when that is safe: for idempotent methods, or when it failed
+    before it was sent. A POST that may have reached Jira is reported instead,
+    so it can never create an issue twice.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+    def __init__(self, base_url: str, email: str, api_token: str,
+                 pool_size: int = 8, timeout: float = 30,
+                 limiter: RateLimiter = None, max_retries: int = 5):
+        url = urlsplit(base_url.rstrip("/"))
+        self.scheme = url.scheme or "https"
+        self.host = url.hostname
+        self.port = url.port
+        self.base_path = url.path
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+        token = base64.b64encode(f"{email}:{api_token}".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {token}",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "Content-Type": "application/json",
+            "User-Agent": "claude-skills-jira-toolkit",
+        }
+
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.scheme == "http":
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout,
+                                           context=ssl.create_default_context())
+
+    @staticmethod
+    def _dropped(conn: http.client.HTTPConnection) -> bool:
+        """True if the server has closed an idle connection (it has nothing else to say)"""
+        if conn.sock is None:
+            return True
+        try:
+            return bool(select.select([conn.sock], [], [], 0)[0])
+        except (OSError, ValueError):
+            return True
+
+    def _acquire(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            if not self._dropped(conn):
+                return conn, True
+            conn.close()
+        return self._connect(), False
+
+    def _release(self, conn: http.client.HTTPConnection):
+        with self._lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def request(self, method: str, path: str, payload=None, params: Dict = None) -> JiraResponse:
+        """Send a request and return a JiraResponse (status 0 on connection errors)"""
+        url = self.base_path + path
+        if params:
+            url += "?" + urlencode(params)
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+
+        retries = 0
+        while True:
+            if self.limiter:
+                self.limiter.acquire()
+            conn, reused = self._acquire()
+            sent = False
+            try:
+                conn.request(method, url, body=body, headers=self.headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                # A pooled connection the server already closed: retry on a fresh one,
+                # unless a request that isn't safe to repeat may have reached Jira
+                if reused and isinstance(e, (http.client.RemoteDisconnected,
+                                             ConnectionResetError, BrokenPipeError)) \
+                        and (not sent or method in self.IDEMPOTENT_METHODS):
+                    continue
+                return JiraResponse(0, error=f"Connection error: {e}")
+
+            if response.getheader("Content-Encoding", "").lower() == "gzip":
+                data = gzip.decompress(data)
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+
+            if response.status == 429 and self.limiter and retries < self.max_retries:
+                retries += 1
+                self.limiter.throttled(parse_retry_after(response.getheader("Retry-After")))
+                continue
+            if self.limiter and response.status != 429:
+                self.limiter.succeeded()
+
+            return JiraResponse(response.status, response.msg, data)
+
+    def get(self, path: str, params: Dict = None) -> JiraResponse:
+        return self.request("GET", path, params=params)
+
+    def post(self, path: str, payload=None) -> JiraResponse:
+        return self.request("POST", path, payload)
+
+    def put(self, path: str, payload=None) -> JiraResponse:
+        return self.request("PUT", path, payload)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
 class JiraStoryCreator:
     """Create stories in Jira with full formatting"""
 
-    def __init__(self, config: Dict):
+    def __init__(self, config: Dict, workers: int = 1):
         self.base_url = config["jira"]["instanceUrl"]
-        self.auth = f"{config['jira']['email']}:{config['jira']['apiToken']}"
+        self.workers = max(1, workers)
+        self.http = JiraTransport(self.base_url, config["jira"]["email"],
+                                  config["jira"]["apiToken"],
+                                  pool_size=max(8, self.workers), limiter=RateLimiter())
         self.project_key = config["jira"]["projectKey"]
         self.story_type_id = config["jira"].get("storyTypeId", "10006")
 
@@ -151,10 +501,10 @@ class JiraStoryCreator:
             ]
         }
 
-    def create_story(self, epic_key: str, summary: str, user_story: str,
-                     acceptance_criteria: str, implementation: str, testing: str,
-                     labels: List[str] = None) -> str:
-        """Create a story in Jira"""
+    def build_story_fields(self, epic_key: str, summary: str, user_story: str,
+                           acceptance_criteria: str, implementation: str, testing: str,
+                           labels: List[str] = None) -> Dict:
+        """Build the issue fields payload for a story"""
 
         description = self.create_adf_description(user_story, acceptance_criteria,
                                                     implementation, testing)
@@ -170,61 +520,558 @@ class JiraStoryCreator:
         if labels:
             fields["labels"] = labels
 
-        data = json.dumps({"fields": fields})
+        return fields
+
+    def create_story(self, epic_key: str, summary: str, user_story: str,
+                     acceptance_criteria: str, implementation: str, testing: str,
+                     labels: List[str] = None) -> str:
+        """Create a story in Jira"""
+
+        fields = self.build_story_fields(epic_key, summary, user_story, acceptance_criteria,
+                                         implementation, testing, labels)
+
+        story_key, error = self.post_story(fields)
+        if error:
+            print(f"Error creating story: {error}")
+        return story_key
+
+    def post_story(self, fields: Dict) -> Tuple[str, str]:
+        """Create a story from a fields payload, returning (key, error)"""
+        response = self.http.post("/rest/api/3/issue", {"fields": fields})
+
+        if not response.ok:
+            return "", response.error_message()
+        story_key = response.json().get("key", "")
+        return story_key, "" if story_key else "No key in create response"
+
+    def search(self, jql: str, fields: List[str]) -> Tuple[List[Dict], str]:
+        """Run a JQL search, following pagination; returns (issues, error)"""
+        issues = []
+        page_token = None
+
+        while True:
+            payload = {"jql": jql, "fields": fields, "maxResults": 100}
+            if page_token:
+                payload["nextPageToken"] = page_token
+            response = self.http.post("/rest/api/3/search/jql", payload)
+            if not response.ok:
+                return issues, response.error_message()
+
+            data = response.json()
+            issues.extend(data.get("issues", []))
+            page_token = data.get("nextPageToken")
+            if not page_token or data.get("isLast", True):
+                return issues, ""
+
+    def find_stage_epics(self, stage_numbers: List[int],
+                         mirror: "IssueMirror" = None) -> Tuple[Dict[int, str], str]:
+        """Find epic keys by their stage-NNN labels with a single JQL search
+
+        Returns ({stage_number: epic_key}, error). If several epics carry the same
+        stage label, the oldest one wins. Epics found are written through to the
+        mirror when one is given.
+        """
+        labels = [f"stage-{number:03d}" for number in sorted(set(stage_numbers))]
+        if not labels:
+            return {}, ""
+
+        jql = (f'project = "{self.project_key}" AND issuetype = Epic '
+               f'AND labels in ({", ".join(labels)}) ORDER BY created ASC')
+        issues, error = self.search(jql, MIRROR_FIELDS if mirror else ["labels"])
+        if mirror and not error:
+            mirror.store_issues(issues)
+
+        epics = {}
+        for issue in issues:
+            for label in issue.get("fields", {}).get("labels") or []:
+                match = re.fullmatch(r'stage-(\d+)', label)
+                if match:
+                    epics.setdefault(int(match.group(1)), issue["key"])
+        return epics, error
+
+    def sync_mirror(self, mirror: "IssueMirror") -> bool:
+        """Bring the issue mirror up to date if needed; True if it can serve lookups"""
+        if mirror.is_fresh():
+            return True
+        started = time.time()
+        jql = mirror.sync_jql()
+        if jql:
+            issues, error = self.search(jql, MIRROR_FIELDS)
+            if error:
+                print(f"WARNING: Issue mirror sync failed: {error}")
+                return False
+            mirror.store_issues(issues)
+        mirror.mark_synced(started)
+        return True
+
+    def update_story(self, issue_key: str, fields: Dict) -> Tuple[bool, str]:
+        """Overwrite an existing story with a fields payload, returning (ok, error)"""
+        editable = {name: value for name, value in fields.items()
+                    if name not in ("project", "issuetype")}
+        response = self.http.put(f"/rest/api/3/issue/{issue_key}", {"fields": editable})
+
+        if response.ok:
+            return True, ""
+        return False, response.error_message()
+
+    def create_stories_bulk(self, stories: List[Dict], batch_size: int = BULK_BATCH_SIZE,
+                            on_created: Callable[[int, str], None] = None) -> List[Tuple[str, str]]:
+        """Create stories through the bulk issue endpoint
+
+        Takes a list of fields payloads (see build_story_fields) and returns one
+        (key, error) tuple per story, in the same order as the input. Batches are
+        sent concurrently when the creator has more than one worker. on_created,
+        if given, is called with (index, key) as soon as each batch returns.
+        """
+        batch_size = max(1, min(batch_size, BULK_BATCH_SIZE))
+        starts = range(0, len(stories), batch_size)
+
+        def create_batch(start: int) -> List[Tuple[str, str]]:
+            batch_results = self._create_bulk_batch(stories[start:start + batch_size])
+            if on_created:
+                for offset, (story_key, _) in enumerate(batch_results):
+                    if story_key:
+                        on_created(start + offset, story_key)
+            return batch_results
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for batch_results in pool.map(create_batch, starts):
+                results.extend(batch_results)
+        return results
+
+    def _create_bulk_batch(self, batch: List[Dict]) -> List[Tuple[str, str]]:
+        response = self.http.post("/rest/api/3/issue/bulk",
+                                  {"issueUpdates": [{"fields": fields} for fields in batch]})
+
+        data = response.json()
+        # Element-level failures come back as a 400 with an errors list;
+        # anything else that isn't a 2xx failed the whole batch
+        if not isinstance(data, dict) or not (response.ok or isinstance(data.get("errors"), list)):
+            return [("", response.error_message())] * len(batch)
+
+        return self._map_bulk_response(data, len(batch))
+
+    @staticmethod
+    def _map_bulk_response(response: Dict, count: int) -> List[Tuple[str, str]]:
+        """Map a bulk create response back onto the submitted items
+
+        Jira lists created issues in submission order, skipping the failed
+        elements, which are reported separately by index.
+        """
+        errors = {}
+        element_failures = response.get("errors") if isinstance(response.get("errors"), list) else []
+        for error in element_failures:
+            index = error.get("failedElementNumber")
+            if index is None:
+                continue
+            element_errors = error.get("elementErrors", {})
+            messages = list(element_errors.get("errorMessages", []))
+            messages += [f"{field}: {message}"
+                         for field, message in element_errors.get("errors", {}).items()]
+            errors[index] = "; ".join(messages) or f"HTTP {error.get('status', '?')}"
+
+        if not response.get("issues") and not errors:
+            # Request-level failure (auth, malformed payload): every item failed
+            messages = list(response.get("errorMessages", []))
+            if isinstance(response.get("errors"), dict):
+                messages += [f"{field}: {message}"
+                             for field, message in response["errors"].items()]
+            error = "; ".join(messages) or "No issues returned by bulk create"
+            return [("", error)] * count
+
+        created = iter(response.get("issues", []))
+        results = []
+        for index in range(count):
+            if index in errors:
+                results.append(("", errors[index]))
+            else:
+                issue = next(created, None)
+                if issue:
+                    results.append((issue.get("key", ""), ""))
+                else:
+                    results.append(("", "Missing from bulk create response"))
+        return results
+
+
+class RunLedger:
+    """SQLite record of the stories created from each plan
+
+    Rows are keyed by project, plan path, stage and a hash of the task text, so a
+    rerun after a partial failure skips everything that already reached Jira.
+    Each row also keeps a hash of the fields last sent for the story, which is
+    the snapshot --sync compares against to find stories whose content changed.
+    A task whose text changed only in case, punctuation or spacing still
+    matches its row (see match_tasks), and --sync relinks the row to it.
+    Dry runs open an existing ledger read-only and never create one.
+    """
+
+    def __init__(self, path: str, read_only: bool = False):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        if read_only:
+            # Dry runs read an existing ledger and never create or change one
+            self.conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True,
+                                        check_same_thread=False)
+            self._columns = {row[1] for row in self.conn.execute("PRAGMA table_info(stories)")}
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Stories are recorded from worker threads as they are created
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS stories (
+                project_key TEXT NOT NULL,
+                plan_path TEXT NOT NULL,
+                stage INTEGER NOT NULL,
+                task_hash TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                issue_key TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                fields_hash TEXT NOT NULL DEFAULT '',
+                PRIMARY KEY (project_key, plan_path, stage, task_hash)
+            )
+        """)
+        # Ledgers written before fields_hash existed
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(stories)")}
+        if "fields_hash" not in columns:
+            self.conn.execute("ALTER TABLE stories ADD COLUMN fields_hash TEXT NOT NULL DEFAULT ''")
+        self.conn.commit()
+        self._columns = columns | {"fields_hash"}
+
+    @staticmethod
+    def task_hash(task: str, occurrence: int = 0) -> str:
+        """Content hash of a task; occurrence separates identical tasks in one stage"""
+        return hashlib.sha256(f"{task.strip()}\0{occurrence}".encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def normalize_summary(task: str) -> str:
+        """Task text with case, punctuation and spacing ignored"""
+        return " ".join(re.sub(r"[^\w\s]", " ", task.lower()).split())
+
+    @classmethod
+    def match_tasks(cls, rows: Dict[str, Tuple[str, str, str]],
+                    tasks: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """Match one stage's tasks to its ledger rows
+
+        rows maps task_hash -> (issue_key, summary, fields_hash) and tasks
+        lists (task_hash, task) in plan order. Returns the ledger task_hash for
+        each task, or None for a new task. A task matches its own hash first,
+        then an unmatched row with the same normalized summary. Anything else is
+        a different task: it is new, and rows left unmatched were removed.
+        """
+        matched: List[Optional[str]] = [task_hash if task_hash in rows else None
+                                        for task_hash, _ in tasks]
+        free = [task_hash for task_hash in rows if task_hash not in set(matched)]
+
+        by_summary: Dict[str, List[str]] = {}
+        for task_hash in free:
+            by_summary.setdefault(cls.normalize_summary(rows[task_hash][1]), []).append(task_hash)
+        for index, (_, task) in enumerate(tasks):
+            candidates = by_summary.get(cls.normalize_summary(task))
+            if matched[index] is None and candidates:
+                matched[index] = candidates.pop(0)
+        return matched
+
+    @staticmethod
+    def fields_hash(fields: Dict) -> str:
+        """Content hash of a story's generated fields payload"""
+        return hashlib.sha256(json.dumps(fields, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def created_stories(self, project_key: str,
+                        plan_path: str) -> Dict[int, Dict[str, Tuple[str, str, str]]]:
+        """Map stage -> task_hash -> (issue_key, summary, fields_hash) for a plan"""
+        if not self._columns:
+            return {}  # A read-only ledger that has never been written
+        fields_hash = "fields_hash" if "fields_hash" in self._columns else "''"
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT stage, task_hash, issue_key, summary, {fields_hash} FROM stories "
+                "WHERE project_key = ? AND plan_path = ? ORDER BY rowid",
+                (project_key, plan_path)
+            ).fetchall()
+        created: Dict[int, Dict[str, Tuple[str, str, str]]] = {}
+        for stage, task_hash, issue_key, summary, fields_hash in rows:
+            created.setdefault(stage, {})[task_hash] = (issue_key, summary, fields_hash)
+        return created
+
+    def record(self, project_key: str, plan_path: str, stage: int, task_hash: str,
+               summary: str, issue_key: str, fields_hash: str = ""):
+        """Record a created story (committed immediately so a crash can't lose it)"""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO stories "
+                "(project_key, plan_path, stage, task_hash, summary, issue_key, created_at, fields_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (project_key, plan_path, stage, task_hash, summary, issue_key,
+                 datetime.now(timezone.utc).isoformat(timespec="seconds"), fields_hash)
+            )
+            self.conn.commit()
+
+    def relink(self, project_key: str, plan_path: str, stage: int, old_hash: str,
+               task_hash: str, summary: str):
+        """Point a story's row at the task's current text"""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE stories SET task_hash = ?, summary = ? "
+                "WHERE project_key = ? AND plan_path = ? AND stage = ? AND task_hash = ?",
+                (task_hash, summary, project_key, plan_path, stage, old_hash)
+            )
+            self.conn.commit()
+
+    def record_update(self, project_key: str, plan_path: str, stage: int, task_hash: str,
+                      fields_hash: str):
+        """Store the fields hash of a story that was just updated in Jira"""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE stories SET fields_hash = ? "
+                "WHERE project_key = ? AND plan_path = ? AND stage = ? AND task_hash = ?",
+                (fields_hash, project_key, plan_path, stage, task_hash)
+            )
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
 
-        result = subprocess.run(
-            ["curl", "-s", "-u", self.auth, "-X", "POST",
-             "-H", "Content-Type: application/json",
-             "-d", data,
-             f"{self.base_url}/rest/api/3/issue"],
-            capture_output=True,
-            text=True
-        )
 
+class EpicKeyCache:
+    """Local cache of stage number -> epic key, per Jira site and project
+
+    Stored as JSON so the epic search only runs for stages not seen before.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
         try:
-            response = json.loads(result.stdout)
-            return response.get("key", "")
-        except json.JSONDecodeError:
-            print(f"Error creating story: {result.stdout}")
-            return ""
+            with open(self.path, encoding="utf-8") as f:
+                self.data = json.load(f)
+        except (OSError, ValueError):
+            self.data = {}
+
+    @staticmethod
+    def _scope(base_url: str, project_key: str) -> str:
+        return f"{base_url.rstrip('/')}|{project_key}"
+
+    def get(self, base_url: str, project_key: str) -> Dict[int, str]:
+        entries = self.data.get(self._scope(base_url, project_key), {})
+        return {int(stage): epic_key for stage, epic_key in entries.items()}
+
+    def update(self, base_url: str, project_key: str, epics: Dict[int, str]):
+        entries = self.data.setdefault(self._scope(base_url, project_key), {})
+        entries.update({str(stage): epic_key for stage, epic_key in epics.items()})
+
+    def forget(self, base_url: str, project_key: str, stages: List[int]):
+        entries = self.data.get(self._scope(base_url, project_key), {})
+        for stage in stages:
+            entries.pop(str(stage), None)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class IssueMirror:
+    """Local SQLite mirror of Jira issues, shared by the Jira toolkit skills
+
+    Issues read from Jira are written through, and an incremental
+    `updated >= -Nm` search over the mirrored projects brings all rows up to
+    date once the last sync is older than MIRROR_MAX_AGE. Here it answers
+    stage epic lookups; jira-update.py also serves story reads from it.
+
+    The schema is shared with jira-update.py and jira-project-creator.py.
+    """
+
+    def __init__(self, path: str, site: str, max_age: float = MIRROR_MAX_AGE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.site = site.rstrip("/")
+        self.max_age = max_age
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                site TEXT NOT NULL,
+                issue_key TEXT NOT NULL,
+                project_key TEXT NOT NULL,
+                issue_type TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT '',
+                summary TEXT NOT NULL DEFAULT '',
+                parent TEXT NOT NULL DEFAULT '',
+                labels TEXT NOT NULL DEFAULT '[]',
+                subtasks TEXT NOT NULL DEFAULT '[]',
+                links TEXT NOT NULL DEFAULT '[]',
+                updated TEXT NOT NULL DEFAULT '',
+                complete INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (site, issue_key)
+            );
+            CREATE INDEX IF NOT EXISTS issues_parent ON issues (site, parent);
+            CREATE TABLE IF NOT EXISTS sync_state (
+                site TEXT PRIMARY KEY,
+                last_sync REAL NOT NULL
+            );
+        """)
+        # Rows written from now on are newer than this, so a new mirror starts synced
+        self.conn.execute("INSERT OR IGNORE INTO sync_state (site, last_sync) VALUES (?, ?)",
+                          (self.site, time.time()))
+        self.conn.commit()
+
+    def last_sync(self) -> Optional[float]:
+        row = self.conn.execute("SELECT last_sync FROM sync_state WHERE site = ?", (self.site,)).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self) -> bool:
+        last_sync = self.last_sync()
+        return last_sync is not None and time.time() - last_sync < self.max_age
+
+    def mark_synced(self, started: float):
+        """Record that every row is at least as new as `started` (a time.time() value)"""
+        self.conn.execute("INSERT OR REPLACE INTO sync_state (site, last_sync) VALUES (?, ?)",
+                          (self.site, started))
+        self.conn.commit()
+
+    def sync_jql(self) -> Optional[str]:
+        """JQL for mirrored issues changed since the last sync, or None if there is nothing to sync"""
+        last_sync = self.last_sync()
+        projects = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT project_key FROM issues WHERE site = ? ORDER BY project_key", (self.site,))]
+        if last_sync is None or not projects:
+            return None
+        minutes = int((time.time() - last_sync) // 60) + MIRROR_SYNC_MARGIN
+        return f'project in ({", ".join(projects)}) AND updated >= "-{minutes}m"'
+
+    @staticmethod
+    def issue_rows(data: Dict) -> List[Dict]:
+        """Rows for an issue payload and the subtasks and linked issues embedded in it"""
+        fields = data["fields"]
+        complete = "subtasks" in fields and "issuelinks" in fields
+        linked = [link.get("outwardIssue") or link.get("inwardIssue") for link in fields.get("issuelinks") or []]
+        linked = [issue for issue in linked if issue]
+        rows = [{
+            "issue_key": data["key"],
+            "issue_type": fields["issuetype"]["name"],
+            "status": fields["status"]["name"],
+            "summary": fields.get("summary") or "",
+            "parent": (fields.get("parent") or {}).get("key", ""),
+            "labels": json.dumps(fields.get("labels") or []),
+            "subtasks": json.dumps([subtask["key"] for subtask in fields.get("subtasks") or []]),
+            "links": json.dumps([issue["key"] for issue in linked]),
+            "updated": fields.get("updated") or "",
+            "complete": int(complete),
+        }]
+        for embedded, parent in ([(subtask, data["key"]) for subtask in fields.get("subtasks") or []] +
+                                 [(issue, "") for issue in linked]):
+            rows.append({
+                "issue_key": embedded["key"],
+                "issue_type": embedded["fields"]["issuetype"]["name"],
+                "status": embedded["fields"]["status"]["name"],
+                "summary": embedded["fields"].get("summary") or "",
+                "parent": parent,
+                "labels": "[]", "subtasks": "[]", "links": "[]", "updated": "", "complete": 0,
+            })
+        return rows
+
+    def store_issues(self, issues: List[Dict]):
+        """Write raw issue payloads through to the mirror"""
+        self.store([row for data in issues for row in self.issue_rows(data)])
+
+    def store(self, rows: List[Dict]):
+        # A row never replaces one that is more complete or more recently updated
+        self.conn.executemany("""
+            INSERT INTO issues (site, issue_key, project_key, issue_type, status, summary, parent,
+                                labels, subtasks, links, updated, complete)
+            VALUES (:site, :issue_key, :project_key, :issue_type, :status, :summary, :parent,
+                    :labels, :subtasks, :links, :updated, :complete)
+            ON CONFLICT (site, issue_key) DO UPDATE SET
+                project_key = excluded.project_key, issue_type = excluded.issue_type,
+                status = excluded.status, summary = excluded.summary, parent = excluded.parent,
+                labels = excluded.labels, subtasks = excluded.subtasks, links = excluded.links,
+                updated = excluded.updated, complete = excluded.complete
+            WHERE excluded.complete >= issues.complete AND excluded.updated >= issues.updated
+        """, [dict(row, site=self.site, project_key=row["issue_key"].rsplit("-", 1)[0]) for row in rows])
+        self.conn.commit()
+
+    def forget(self, issue_keys: List[str]):
+        """Drop issues Jira no longer accepts (deleted or moved)"""
+        self.conn.executemany("DELETE FROM issues WHERE site = ? AND issue_key = ?",
+                              [(self.site, issue_key) for issue_key in issue_keys])
+        self.conn.commit()
+
+    def stage_epics(self, project_key: str, stage_numbers: List[int]) -> Dict[int, str]:
+        """Mirrored epics by their stage-NNN labels; the oldest (lowest key) wins, as in Jira"""
+        wanted = {f"stage-{number:03d}": number for number in stage_numbers}
+        rows = self.conn.execute(
+            "SELECT issue_key, labels FROM issues WHERE site = ? AND project_key = ? AND issue_type = 'Epic'",
+            (self.site, project_key)
+        ).fetchall()
+        epics = {}
+        for issue_key, labels in sorted(rows, key=lambda row: int(row[0].rsplit("-", 1)[1])):
+            for label in json.loads(labels):
+                if label in wanted:
+                    epics.setdefault(wanted[label], issue_key)
+        return epics
+
+    def close(self):
+        self.conn.close()
 
 
 class ImplementationPlanParser:
-    """Parse implementation plan markdown files"""
+    """Parse implementation plan markdown files
+
+    The plan is read line by line in a single pass: a stage starts at a
+    "Stage N: Name" heading, its tasks are the "- [ ]" items after **Tasks:**,
+    and it ends at the next heading. Only the current stage is held in memory.
+    """
+
+    STAGE_HEADING = re.compile(r'#+\s*Stage\s+(\d+)\s*:\s*(.+)')
+    # Trailing "(Week 1-2, 80 hours)" schedule note, dropped from the stage name
+    SCHEDULE_SUFFIX = re.compile(r'\s*\(Week\b.*$')
+    TASK_ITEM = '- [ ] '
 
     def __init__(self, plan_path: str):
         self.plan_path = plan_path
 
-    def parse_stages(self) -> List[Dict]:
-        """Parse stages from markdown file"""
+    def iter_stages(self):
+        """Yield stages from the markdown file as they are parsed"""
+        stage = None
+        in_tasks = False
+
         with open(self.plan_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        stages = []
-        # Find all stage sections
-        stage_pattern = r'### Stage (\d+): (.+?) \(Week .+?\).*?\*\*Tasks:\*\*(.*?)(?=###|\Z)'
-        matches = re.finditer(stage_pattern, content, re.DOTALL)
-
-        for match in matches:
-            stage_num = int(match.group(1))
-            stage_name = match.group(2)
-            tasks_section = match.group(3)
-
-            # Extract tasks
-            tasks = []
-            task_lines = re.findall(r'- \[ \] (.+)', tasks_section)
-            for task in task_lines:
-                # Skip sub-items (lines that start with more spaces)
-                if not task.startswith('  '):
-                    tasks.append(task.strip())
-
-            stages.append({
-                "number": stage_num,
-                "name": stage_name,
-                "tasks": tasks
-            })
+            for line in f:
+                stripped = line.strip()
+
+                if stripped.startswith('#'):
+                    if stage:
+                        yield stage
+                        stage = None
+                    in_tasks = False
 
-        return stages
+                    match = self.STAGE_HEADING.match(stripped)
+                    if match:
+                        name = self.SCHEDULE_SUFFIX.sub('', match.group(2)).strip()
+                        stage = {
+                            "number": int(match.group(1)),
+                            "name": name,
+                            "tasks": []
+                        }
+                elif stage is None:
+                    continue
+                elif stripped.startswith('**Tasks:**'):
+                    in_tasks = True
+                elif in_tasks:
+                    # Nested checklist items are tasks too
+                    index = stripped.find(self.TASK_ITEM)
+                    if index != -1:
+                        task = stripped[index + len(self.TASK_ITEM):].strip()
+                        if task:
+                            stage["tasks"].append(task)
+
+        if stage:
+            yield stage
+
+    def parse_stages(self) -> List[Dict]:
+        """Parse stages from markdown file"""
+        return list(self.iter_stages())
 
 
 def main():
@@ -234,8 +1081,29 @@ def main():
     parser.add_argument("--plan", required=True, help="Path to implementation plan (markdown)")
     parser.add_argument("--config", required=True, help="Path to Jira config JSON")
     parser.add_argument("--stages", help="Comma-separated stage numbers (e.g., 1,2,3)")
-    parser.add_argument("--epic-prefix", default="AURA", help="Epic key prefix")
+    parser.add_argument("--epic-prefix",
+                        help="Fall back to PREFIX-<stage number> for stages with no stage-NNN labelled epic")
+    parser.add_argument("--epic-cache", default=str(CACHE_DIR / "epic-keys.json"),
+                        help="Local cache of resolved epic keys")
+    parser.add_argument("--refresh-epics", action="store_true",
+                        help="Ignore cached epic keys and search Jira again")
+    parser.add_argument("--mirror", default=str(CACHE_DIR / "issue-mirror.sqlite"),
+                        help="Local issue mirror shared with the other Jira skills, checked before searching for epics")
+    parser.add_argument("--no-mirror", action="store_true",
+                        help="Search Jira for epics and leave the issue mirror untouched")
     parser.add_argument("--dry-run", action="store_true", help="Preview without creating")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Create stories through the bulk issue endpoint")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of concurrent requests to Jira (default: 1)")
+    parser.add_argument("--ledger", default=str(CACHE_DIR / "story-ledger.sqlite"),
+                        help="SQLite ledger of created stories, used to skip them on reruns")
+    parser.add_argument("--no-ledger", action="store_true",
+                        help="Create every story, ignoring and not updating the ledger")
+    parser.add_argument("--sync", action="store_true",
+                        help="Also update stories whose generated content changed and report removed tasks")
+    parser.add_argument("--batch-size", type=int, default=BULK_BATCH_SIZE,
+                        help=f"Stories per bulk request (max {BULK_BATCH_SIZE})")
 
     args = parser.parse_args()
 
@@ -246,12 +1114,11 @@ def main():
     # Parse implementation plan
     print(f"Parsing implementation plan: {args.plan}")
     plan_parser = ImplementationPlanParser(args.plan)
-    stages = plan_parser.parse_stages()
 
-    # Filter stages if specified
-    if args.stages:
-        stage_nums = [int(s) for s in args.stages.split(',')]
-        stages = [s for s in stages if s["number"] in stage_nums]
+    # Filter stages if specified (while streaming, so skipped stages are never kept)
+    stage_nums = {int(s) for s in args.stages.split(',')} if args.stages else None
+    stages = [s for s in plan_parser.iter_stages()
+              if stage_nums is None or s["number"] in stage_nums]
 
     print(f"Found {len(stages)} stages to process")
     print()
@@ -261,59 +1128,261 @@ def main():
         print()
 
     # Initialize creators
-    story_gen = StoryGenerator()
-    jira_creator = JiraStoryCreator(config)
+    classifier = TaskClassifier(config.get("classifier"))
+    story_gen = StoryGenerator(classifier)
+    jira_creator = JiraStoryCreator(config, workers=args.workers)
 
-    total_stories = 0
+    # Previously created stories are skipped without any API call
+    ledger = None
+    created = {}
+    plan_path = str(Path(args.plan).resolve())
+    if args.sync and args.no_ledger:
+        parser.error("--sync compares against the ledger and cannot be used with --no-ledger")
+    if not args.no_ledger and not args.dry_run:
+        ledger = RunLedger(args.ledger)
+    elif not args.no_ledger and Path(args.ledger).is_file():
+        ledger = RunLedger(args.ledger, read_only=True)
+    if ledger:
+        created = ledger.created_stories(jira_creator.project_key, plan_path)
+
+    # Resolve epic keys from their stage-NNN labels (one search, cached per project)
+    mirror = None
+    epic_cache = EpicKeyCache(args.epic_cache)
+    epic_keys = {} if args.refresh_epics else epic_cache.get(jira_creator.base_url,
+                                                             jira_creator.project_key)
+    unresolved = [stage['number'] for stage in stages if stage['number'] not in epic_keys]
+    if unresolved and not args.dry_run:
+        # Epics already in a fresh issue mirror need no search
+        mirror = IssueMirror(args.mirror, jira_creator.base_url) if not args.no_mirror else None
+        found = {}
+        if mirror and not args.refresh_epics and jira_creator.sync_mirror(mirror):
+            found = mirror.stage_epics(jira_creator.project_key, unresolved)
+            if found:
+                print(f"Resolved {len(found)} epic(s) from the issue mirror")
+        searched, error = {}, ""
+        if len(found) < len(unresolved):
+            searched, error = jira_creator.find_stage_epics(
+                [number for number in unresolved if number not in found], mirror)
+        if error:
+            print(f"WARNING: Epic lookup failed: {error}")
+        found.update(searched)
+        epic_keys.update(found)
+        epic_cache.update(jira_creator.base_url, jira_creator.project_key, found)
+        epic_cache.save()
+        print(f"Resolved {len(found)} of {len(unresolved)} epic(s) by stage label")
+        print()
 
-    for stage in stages:
-        epic_key = f"{args.epic_prefix}-{stage['number']}"
+    # Generate all story content up front so bulk mode can batch across stages
+    planned = []
+    seen = set()
+    classifications = classifier.classify_plan(stages)
+    for stage, stage_classes in zip(stages, classifications):
+        epic_key = epic_keys.get(stage['number'], "")
+        if not epic_key and args.epic_prefix:
+            # Legacy guess, only when explicitly asked for
+            epic_key = f"{args.epic_prefix}-{stage['number']}"
         stage_label = f"stage-{stage['number']:03d}"
+        stories = []
+        occurrences = {}
+        task_hashes = []
+        for task in stage['tasks']:
+            occurrence = occurrences.get(task, 0)
+            occurrences[task] = occurrence + 1
+            task_hashes.append(RunLedger.task_hash(task, occurrence))
+        stage_rows = created.get(stage['number'], {})
+        ledger_hashes = RunLedger.match_tasks(stage_rows, list(zip(task_hashes, stage['tasks'])))
 
-        print(f"Stage {stage['number']}: {stage['name']} ({epic_key})")
-        print(f"  Tasks: {len(stage['tasks'])}")
+        for index, (task, (story_type, task_labels)) in enumerate(zip(stage['tasks'], stage_classes)):
+            task_hash = task_hashes[index]
+            ledger_hash = ledger_hashes[index]
+            existing = stage_rows.get(ledger_hash) if ledger_hash else None
+            if existing:
+                seen.add((stage['number'], ledger_hash))
+                if args.sync and not args.dry_run and ledger_hash != task_hash:
+                    # Same task respelled: keep it on the story it already has
+                    ledger.relink(jira_creator.project_key, plan_path, stage['number'], ledger_hash,
+                                  task_hash, task)
+                    ledger_hash = task_hash
 
-        for task in stage['tasks']:
             # Generate story content
-            story_content = story_gen.generate_story(task, stage['name'])
-
-            # Determine labels based on task
-            labels = [stage_label]
-            task_lower = task.lower()
-            if 'backend' in task_lower or 'api' in task_lower:
-                labels.append('backend')
-            if 'frontend' in task_lower or 'ui' in task_lower:
-                labels.append('frontend')
-            if 'test' in task_lower:
-                labels.append('testing')
-            if 'database' in task_lower or 'table' in task_lower:
-                labels.append('database')
+            story_content = story_gen.generate_story(task, stage['name'], story_type)
+            labels = [stage_label] + task_labels
+            fields = jira_creator.build_story_fields(epic_key=epic_key, summary=task,
+                                                     labels=labels, **story_content)
+            story = {
+                "stage": stage['number'],
+                "task": task,
+                "task_hash": task_hash,
+                "ledger_hash": ledger_hash or task_hash,
+                "fields": fields,
+                "fields_hash": RunLedger.fields_hash(fields),
+                "key": "",
+                "action": "create",
+            }
+
+            if not epic_key and not existing:
+                # Don't spend a request on a story Jira would reject
+                story["action"] = "no-epic"
+            elif existing and not existing[2]:
+                # Ledgers from before fields_hash: take this run as the baseline
+                # rather than rewriting every story
+                story["key"] = existing[0]
+                story["action"] = "skip"
+                if ledger and not args.dry_run:
+                    ledger.record_update(jira_creator.project_key, plan_path, stage['number'],
+                                         story["ledger_hash"], story["fields_hash"])
+            elif existing:
+                story["key"] = existing[0]
+                # In sync mode, stories whose generated content changed are updated
+                changed = existing[2] != story["fields_hash"]
+                story["action"] = "update" if args.sync and changed and epic_key else "skip"
+            stories.append(story)
+
+        planned.append((stage, epic_key, stories))
+
+    # Stories in the ledger for the selected stages that are no longer in the plan
+    removed = []
+    if args.sync:
+        stage_numbers = {stage['number'] for stage in stages}
+        removed = sorted((stage_number, issue_key, summary)
+                         for stage_number, rows in created.items() if stage_number in stage_numbers
+                         for task_hash, (issue_key, summary, _) in rows.items()
+                         if (stage_number, task_hash) not in seen)
+
+    all_stories = [story for _, _, stories in planned for story in stories]
+    to_create = [story for story in all_stories if story["action"] == "create"]
+    to_update = [story for story in all_stories if story["action"] == "update"]
+
+    def record(story: Dict, story_key: str):
+        if ledger:
+            ledger.record(jira_creator.project_key, plan_path, story["stage"], story["task_hash"],
+                          story["task"], story_key, story["fields_hash"])
+
+    def post_and_record(story: Dict) -> Tuple[str, str]:
+        story_key, error = jira_creator.post_story(story["fields"])
+        if story_key:
+            record(story, story_key)
+        return story_key, error
+
+    def update_and_record(story: Dict) -> Tuple[str, str]:
+        ok, error = jira_creator.update_story(story["key"], story["fields"])
+        if ok:
+            ledger.record_update(jira_creator.project_key, plan_path, story["stage"],
+                                 story["ledger_hash"], story["fields_hash"])
+        return (story["key"] if ok else ""), error
+
+    pool = None
+    if not args.dry_run and (to_create or to_update):
+        # Stories are independent, so queue them all and report in plan order
+        # as they complete; the transport paces requests and retries 429s
+        pool = ThreadPoolExecutor(max_workers=jira_creator.workers)
+        for story in to_update:
+            story["future"] = pool.submit(update_and_record, story)
+
+        if args.bulk and to_create:
+            batches = -(-len(to_create) // max(1, min(args.batch_size, BULK_BATCH_SIZE)))
+            print(f"Submitting {len(to_create)} stories in {batches} bulk request(s)")
+            print()
+            bulk_results = jira_creator.create_stories_bulk(
+                [story["fields"] for story in to_create], args.batch_size,
+                on_created=lambda index, story_key: record(to_create[index], story_key))
+            for story, result in zip(to_create, bulk_results):
+                story["result"] = result
+        else:
+            for story in to_create:
+                story["future"] = pool.submit(post_and_record, story)
+
+    total_stories = 0
+    updated_stories = 0
+    skipped_stories = 0
+    failed_stories = 0
+    stale_epics = set()
+
+    for stage, epic_key, stories in planned:
+        if epic_key:
+            epic_note = epic_key
+        else:
+            epic_note = "epic not looked up in dry run" if args.dry_run else "no epic found"
+        print(f"Stage {stage['number']}: {stage['name']} ({epic_note})")
+        print(f"  Tasks: {len(stage['tasks'])}")
+
+        for story in stories:
+            task = story["task"]
+            if story["action"] == "no-epic":
+                if args.dry_run:
+                    print(f"  [DRY RUN] Would create: {task} (epic not resolved yet)")
+                else:
+                    print(f"  ✗ Failed: {task} (no epic labelled stage-{stage['number']:03d} "
+                          f"in {jira_creator.project_key})")
+                    failed_stories += 1
+                continue
+            if story["action"] == "skip":
+                if args.sync:
+                    print(f"  - Unchanged {story['key']}: {task}")
+                else:
+                    print(f"  - Skipped {story['key']}: {task} (already created)")
+                skipped_stories += 1
+                continue
 
             if args.dry_run:
-                print(f"  [DRY RUN] Would create: {task}")
-            else:
-                # Create story in Jira
-                story_key = jira_creator.create_story(
-                    epic_key=epic_key,
-                    summary=task,
-                    user_story=story_content["user_story"],
-                    acceptance_criteria=story_content["acceptance_criteria"],
-                    implementation=story_content["implementation"],
-                    testing=story_content["testing"],
-                    labels=labels
-                )
-
-                if story_key:
-                    print(f"  ✓ {story_key}: {task}")
-                    total_stories += 1
+                if story["action"] == "update":
+                    print(f"  [DRY RUN] Would update {story['key']}: {task}")
                 else:
-                    print(f"  ✗ Failed: {task}")
+                    print(f"  [DRY RUN] Would create: {task}")
+                continue
+
+            if "result" in story:
+                story_key, error = story["result"]
+            else:
+                story_key, error = story["future"].result()
+
+            if story_key and story["action"] == "update":
+                print(f"  ↻ {story_key}: {task} (updated)")
+                updated_stories += 1
+            elif story_key:
+                print(f"  ✓ {story_key}: {task}")
+                total_stories += 1
+            else:
+                print(f"  ✗ Failed: {task} ({error})")
+                failed_stories += 1
+                if "parent" in error.lower():
+                    stale_epics.add(stage['number'])
 
         print()
 
+    if pool:
+        pool.shutdown()
+    if ledger:
+        ledger.close()
+    if stale_epics:
+        # Jira rejected the parent: look these epics up again next run
+        epic_cache.forget(jira_creator.base_url, jira_creator.project_key, sorted(stale_epics))
+        epic_cache.save()
+        if mirror:
+            mirror.forget([epic_keys[stage] for stage in stale_epics if stage in epic_keys])
+    if mirror:
+        mirror.close()
+
+    if removed:
+        print("Removed from plan (not changed in Jira):")
+        for stage_number, issue_key, summary in removed:
+            print(f"  - {issue_key}: {summary} (stage {stage_number})")
+        print()
+
     print(f"=== Complete ===")
     if not args.dry_run:
         print(f"Created {total_stories} stories")
+        if args.sync:
+            print(f"Updated {updated_stories} stories")
+        if failed_stories:
+            print(f"Failed {failed_stories} stories")
+    if skipped_stories:
+        if args.sync:
+            print(f"Unchanged {skipped_stories} stories (no API calls)")
+        else:
+            print(f"Skipped {skipped_stories} stories already created in a previous run")
+    if removed:
+        print(f"Removed {len(removed)} tasks from the plan")
     print()
 
 